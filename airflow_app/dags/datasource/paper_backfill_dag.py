@@ -0,0 +1,47 @@
+from airflow.sdk import Param, dag
+from dags.datasource.tasks.paper_backfill_task import (
+    hand_over_backfill,
+    plan_backfill,
+    run_backfill,
+)
+from pendulum import datetime
+
+from common.constants import DataSource
+from common.utils.logger import LOG_MODULES, LoggerManager
+
+LoggerManager._log_module = LOG_MODULES.AIRFLOW
+
+logger = LoggerManager.get_logger(__name__)
+
+
+@dag(
+    start_date=datetime(2026, 1, 1),
+    catchup=False,
+    schedule=None,
+    tags=["paper_metadata_ingestion", "backfill"],
+    max_active_runs=1,
+    params={
+        "datasource": Param(DataSource.ARXIV.value, type="string"),
+        "domain_code": Param(type="string"),
+        "start": Param(type="string", format="date"),
+        "end": Param(type="string", format="date"),
+        "window_days": Param(30, type="integer", minimum=1),
+    },
+)
+def paper_backfill_dag():
+    """Harvest the history of a domain, then hand it over to daily ingestion.
+
+    Triggered manually with the domain and date range. Triggering it again
+    with the same parameters resumes the pending windows.
+    """
+    target = plan_backfill(
+        datasource="{{ params.datasource }}",
+        domain_code="{{ params.domain_code }}",
+        start="{{ params.start }}",
+        end="{{ params.end }}",
+        window_days="{{ params.window_days }}",
+    )
+    run_backfill(target) >> hand_over_backfill(target)
+
+
+paper_backfill_dag()
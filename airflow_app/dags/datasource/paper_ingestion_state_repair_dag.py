@@ -0,0 +1,32 @@
+from airflow.sdk import dag
+from dags.datasource.tasks.paper_metadata_ingestion_task import (
+    repair_domain_ingestion_states,
+    repair_paper_statistics,
+)
+from pendulum import datetime
+
+from common.utils.logger import LOG_MODULES, LoggerManager
+
+LoggerManager._log_module = LOG_MODULES.AIRFLOW
+
+logger = LoggerManager.get_logger(__name__)
+
+
+@dag(
+    start_date=datetime(2026, 1, 1),
+    catchup=False,
+    schedule=None,
+    tags=["paper_metadata_ingestion", "repair"],
+    max_active_runs=1,
+)
+def paper_ingestion_state_repair_dag():
+    """Recompute the domain cursor dates and paper counters from the papers table.
+
+    Triggered manually, e.g. after papers were loaded outside of ingestion or
+    an ingestion task was killed, while no ingestion runs.
+    """
+    repair_domain_ingestion_states()
+    repair_paper_statistics()
+
+
+paper_ingestion_state_repair_dag()
@@ -1,11 +1,15 @@
-from airflow.sdk import TriggerRule, dag
+import os
+
+from airflow.sdk import Param, TriggerRule, dag
 from dags.datasource.tasks.paper_metadata_ingestion_task import (
-    flatten,
+    enqueue_subject_windows,
+    ensure_paper_partitions,
+    group_subjects,
     ingest_papers_task,
-    load_domain_ingestion_states,
-    load_subject_to_ingest,
-    update_domain_ingestion_states,
+    ingest_subject_group_task,
+    plan_subject_ingestion,
     update_statistics,
+    wait_for_ingestion_queue,
 )
 from pendulum import datetime
 
@@ -15,6 +19,14 @@ LoggerManager._log_module = LOG_MODULES.AIRFLOW
 
 logger = LoggerManager.get_logger(__name__)
 
+# Number of subject group tasks; 0 runs one mapped task per subject instead.
+PAPER_INGESTION_GROUP_COUNT = int(os.getenv("PAPER_INGESTION_GROUP_COUNT", "4"))
+# Whether the windows go to the work queue drained by ingestion workers
+# (python -m common.services.ingestion worker) instead of Airflow tasks.
+PAPER_INGESTION_USE_QUEUE = (
+    os.getenv("PAPER_INGESTION_USE_QUEUE", "false").lower() == "true"
+)
+
 
 @dag(
     start_date=datetime(2026, 1, 1),
@@ -23,22 +35,31 @@ logger = LoggerManager.get_logger(__name__)
     tags=["paper_metadata_ingestion"],
     max_active_tasks=16,
     max_active_runs=1,
+    params={"force": Param(False, type="boolean")},
 )
 def paper_metadata_ingestion_dag():
-    """Run paper metadata ingestion task per datasources."""
+    """Run paper metadata ingestion task per datasources.
+
+    Windows that already succeeded are skipped unless triggered with force.
+    """
     logger.info("Running paper metadata ingestion task")
 
-    ingestion_states = load_domain_ingestion_states()
-    subject_candidates = load_subject_to_ingest.expand(ingestion_state=ingestion_states)
-    flattened_subject_candidates = flatten(subject_candidates)
-    ingested_tasks = ingest_papers_task.expand(
-        subject_record=flattened_subject_candidates
-    )
-    updated_states = update_domain_ingestion_states()
+    partitions = ensure_paper_partitions()
+    subject_records = plan_subject_ingestion(force="{{ params.force }}")
+    partitions >> subject_records
+    if PAPER_INGESTION_USE_QUEUE:
+        batch = enqueue_subject_windows(subject_records, batch_id="{{ run_id }}")
+        ingested_tasks = wait_for_ingestion_queue(
+            batch["batch_id"], batch["unit_count"]
+        )
+    elif PAPER_INGESTION_GROUP_COUNT > 0:
+        subject_groups = group_subjects(subject_records, PAPER_INGESTION_GROUP_COUNT)
+        ingested_tasks = ingest_subject_group_task.expand(subject_group=subject_groups)
+    else:
+        ingested_tasks = ingest_papers_task.expand(subject_record=subject_records)
     updated_statistics = update_statistics.override(trigger_rule=TriggerRule.ALL_DONE)()
 
-    ingested_tasks >> updated_states
-    updated_states >> updated_statistics
+    ingested_tasks >> updated_statistics
 
 
 dag_variable = paper_metadata_ingestion_dag()
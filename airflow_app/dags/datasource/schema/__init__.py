@@ -1,4 +1,9 @@
-from .domain_ingestion_state import PaperIngestionStateRecord
+from .backfill_target import BackfillTargetRecord
 from .ingestion_subject import SubjectIngestionRecord
+from .subject_ingestion_result import SubjectIngestionResultRecord
 
-__all__ = ["PaperIngestionStateRecord", "SubjectIngestionRecord"]
+__all__ = [
+    "BackfillTargetRecord",
+    "SubjectIngestionRecord",
+    "SubjectIngestionResultRecord",
+]
@@ -0,0 +1,8 @@
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class BackfillTargetRecord(BaseModel):
+    datasource_uuid: UUID = Field(description="UUID of the datasource")
+    domain_uuid: UUID = Field(description="UUID of the backfilled domain")
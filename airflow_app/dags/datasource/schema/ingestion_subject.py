@@ -1,4 +1,5 @@
 from datetime import date
+from typing import Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -10,3 +11,9 @@ class SubjectIngestionRecord(BaseModel):
     subject_uuid: UUID = Field(description="Subject uuid")
     from_date: date = Field(description="From date")
     until_date: date = Field(description="Until date")
+    expected_records: Optional[float] = Field(
+        default=None, description="Expected number of papers in the window"
+    )
+    priority: float = Field(
+        default=0.0, description="Priority of the subject, higher first"
+    )
@@ -0,0 +1,17 @@
+from datetime import date
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class SubjectIngestionResultRecord(BaseModel):
+    subject_uuid: UUID = Field(description="Subject uuid")
+    from_date: date = Field(description="From date")
+    until_date: date = Field(description="Until date")
+    num_papers_ingested: Optional[int] = Field(
+        default=None, description="Number of papers ingested, if it succeeded"
+    )
+    error: Optional[str] = Field(
+        default=None, description="Error the ingestion failed with, if any"
+    )
@@ -0,0 +1,212 @@
+import asyncio
+from datetime import date, timedelta
+import os
+from typing import Optional
+
+from airflow.sdk import task
+from dags.datasource.schema import BackfillTargetRecord
+from httpx import AsyncClient, Limits, Timeout
+
+from common.constants import DataSource
+from common.database.postgres.repositories import DatabaseRepository
+from common.database.postgres.session import (
+    cleanup,
+    get_session_factory,
+    init_database,
+)
+from common.datasources.factories import PaperMetadataIngestionFactory
+from common.services.ingestion import (
+    PaperBackfillService,
+    PaperMetadataIngestionService,
+    SharedRateLimiter,
+)
+from common.services.ingestion.shared_rate_limiter import rate_limit_hooks
+from common.utils.logger import LOG_MODULES, LoggerManager
+from common.utils.rate_limiter import AsyncRateLimiter
+
+LoggerManager._log_module = LOG_MODULES.AIRFLOW
+
+
+def _backfill_service(
+    http_client: Optional[AsyncClient] = None,
+) -> PaperBackfillService:
+    """Returns a backfill service, harvesting with the HTTP client if given."""
+    _async_session_factory = get_session_factory()
+    _db = DatabaseRepository()
+    ingestion_service = None
+    if http_client is not None:
+        ingestion_service = PaperMetadataIngestionService(
+            PaperMetadataIngestionFactory(), _db, _async_session_factory, http_client
+        )
+    return PaperBackfillService(_db, _async_session_factory, ingestion_service)
+
+
+@task(
+    retries=2,
+    retry_delay=timedelta(seconds=5),
+    retry_exponential_backoff=True,
+    max_retry_delay=timedelta(minutes=2),
+    sla=timedelta(minutes=5),
+    execution_timeout=timedelta(minutes=10),
+)
+def plan_backfill(
+    datasource: str, domain_code: str, start: str, end: str, window_days: str
+) -> BackfillTargetRecord:
+    """Plans the backfill windows of a domain.
+
+    Args:
+        datasource (str): The datasource name.
+        domain_code (str): The code of the domain to backfill.
+        start (str): The first day to harvest, in ISO format.
+        end (str): The last day to harvest, in ISO format.
+        window_days (str): The number of days per window.
+
+    Returns:
+        BackfillTargetRecord: The datasource and domain of the backfill.
+    """
+
+    async def _run():
+        logger = LoggerManager.get_logger(__name__)
+        init_database()
+        _async_session_factory = get_session_factory()
+        _db = DatabaseRepository()
+        try:
+            async with _async_session_factory() as session:
+                datasource_uuid = await _db.datasource.get_uuid_by_name(
+                    DataSource(datasource), session
+                )
+                if datasource_uuid is None:
+                    raise ValueError(f"Datasource {datasource} not found")
+                domain = await _db.domain.get_by_code(
+                    domain_code, datasource_uuid, session
+                )
+                if domain is None:
+                    raise ValueError(f"Domain {domain_code} not found")
+
+            await _backfill_service().plan(
+                datasource_uuid,
+                domain.id,
+                date.fromisoformat(start),
+                date.fromisoformat(end),
+                int(window_days),
+            )
+        except Exception as e:
+            logger.error(
+                "Error planning backfill",
+                exc_info=e,
+                extra={"domain_code": domain_code},
+            )
+            raise e
+        finally:
+            await cleanup()
+
+        return BackfillTargetRecord(
+            datasource_uuid=datasource_uuid, domain_uuid=domain.id
+        ).model_dump(mode="json")
+
+    return asyncio.run(_run())
+
+
+@task(
+    retries=10,
+    retry_delay=timedelta(minutes=5),
+    retry_exponential_backoff=True,
+    max_retry_delay=timedelta(minutes=30),
+    execution_timeout=timedelta(hours=24),
+)
+def run_backfill(target: BackfillTargetRecord):
+    """Harvests the pending backfill windows of a domain.
+
+    Requests of all windows share one HTTP client, rate limited to
+    PAPER_BACKFILL_REQUESTS_PER_SECOND on top of the limit shared with the
+    other ingestion tasks. Completed windows are recorded as they finish, so
+    a retry only harvests the remaining ones.
+
+    Args:
+        target (BackfillTargetRecord): The datasource and domain of the
+            backfill.
+
+    Returns:
+        None
+    """
+
+    async def _run(target: BackfillTargetRecord):
+        logger = LoggerManager.get_logger(__name__)
+        init_database()
+        rate_limiter = AsyncRateLimiter(
+            float(os.getenv("PAPER_BACKFILL_REQUESTS_PER_SECOND", "0.33"))
+        )
+        try:
+            async with AsyncClient(
+                timeout=Timeout(30),
+                limits=Limits(max_connections=10),
+                event_hooks=rate_limit_hooks(
+                    rate_limiter, SharedRateLimiter.from_env(get_session_factory())
+                ),
+            ) as http_client:
+                completed, failed = await _backfill_service(http_client).run(
+                    target.domain_uuid,
+                    max_concurrency=int(os.getenv("PAPER_BACKFILL_CONCURRENCY", "4")),
+                )
+        except Exception as e:
+            logger.error(
+                "Error running backfill",
+                exc_info=e,
+                extra={"domain_uuid": target.domain_uuid},
+            )
+            raise e
+        finally:
+            await cleanup()
+
+        if failed:
+            raise RuntimeError(f"{failed} backfill windows failed")
+        logger.info(
+            "Backfill completed",
+            extra={"domain_uuid": target.domain_uuid, "completed": completed},
+        )
+
+    target = BackfillTargetRecord.model_validate(target)
+    return asyncio.run(_run(target))
+
+
+@task(
+    retries=2,
+    retry_delay=timedelta(seconds=5),
+    retry_exponential_backoff=True,
+    max_retry_delay=timedelta(minutes=2),
+    sla=timedelta(minutes=5),
+    execution_timeout=timedelta(minutes=5),
+)
+def hand_over_backfill(target: BackfillTargetRecord):
+    """Hands the backfilled domain over to the daily ingestion.
+
+    Args:
+        target (BackfillTargetRecord): The datasource and domain of the
+            backfill.
+
+    Returns:
+        None
+    """
+
+    async def _run(target: BackfillTargetRecord):
+        logger = LoggerManager.get_logger(__name__)
+        init_database()
+        try:
+            handed_over = await _backfill_service().hand_over(
+                target.datasource_uuid, target.domain_uuid
+            )
+        except Exception as e:
+            logger.error(
+                "Error handing over backfill",
+                exc_info=e,
+                extra={"domain_uuid": target.domain_uuid},
+            )
+            raise e
+        finally:
+            await cleanup()
+
+        if not handed_over:
+            raise RuntimeError("Backfill has pending windows or no ingestion state")
+
+    target = BackfillTargetRecord.model_validate(target)
+    return asyncio.run(_run(target))
@@ -1,21 +1,54 @@
 import asyncio
-from datetime import timedelta
-from typing import List
-from uuid import UUID
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+import os
+from typing import Any, Dict, List
 
 from airflow.sdk import task
-from dags.datasource.schema import PaperIngestionStateRecord, SubjectIngestionRecord
+from dags.datasource.schema import (
+    SubjectIngestionRecord,
+    SubjectIngestionResultRecord,
+)
 from httpx import AsyncClient, Limits, Timeout
 
+from common.constants import IngestionStatus
+from common.database.postgres.partitions import paper_partition_horizon
 from common.database.postgres.repositories import DatabaseRepository
-from common.database.postgres.session import cleanup, get_session_factory, init_database
+from common.database.postgres.session import (
+    cleanup,
+    get_session,
+    get_session_factory,
+    init_database,
+)
 from common.datasources.factories import PaperMetadataIngestionFactory
 from common.metrics.stats_d import get_client
-from common.services.ingestion import PaperMetadataIngestionService
+from common.services.ingestion import (
+    PaperMetadataIngestionService,
+    SharedRateLimiter,
+)
+from common.services.ingestion.harvest_windows import (
+    harvest_window_days,
+    plan_harvest_windows,
+)
+from common.services.ingestion.shared_rate_limiter import rate_limit_hooks
+from common.services.ingestion.subject_groups import pack_by_volume
+from common.services.ingestion.subject_priority import (
+    parse_subject_weights,
+    subject_priority,
+)
 from common.utils.logger import LOG_MODULES, LoggerManager
 
 LoggerManager._log_module = LOG_MODULES.AIRFLOW
 
+# Number of days after the subject watermark ingested per run, extended up to
+# MAX_INGESTION_RANGE_DAYS for sparse subjects, and never past today.
+INGESTION_WINDOW_DAYS = 10
+MAX_INGESTION_RANGE_DAYS = 90
+# Window of the daily counters used to estimate the paper density of a subject.
+SUBJECT_DENSITY_WINDOW_DAYS = 365
+# Window of the ingestion ledger reported as throughput gauges.
+THROUGHPUT_WINDOW = timedelta(days=1)
+
 
 @task(
     retries=2,
@@ -25,50 +58,29 @@ LoggerManager._log_module = LOG_MODULES.AIRFLOW
     sla=timedelta(minutes=5),
     execution_timeout=timedelta(minutes=5),
 )
-def load_domain_ingestion_states() -> List[PaperIngestionStateRecord]:
-    """Loads domain ingestion states for a all datasources.
-
-    Args:
-        datasource_type (DataSource): The datasource type to load ingestion states for.
+def ensure_paper_partitions():
+    """Creates the monthly papers partitions for the coming months.
 
     Returns:
-        List[PaperIngestionStateRecord]: A list of domain ingestion states for the
-            given datasource type.
+        None
     """
 
     async def _run():
         logger = LoggerManager.get_logger(__name__)
-        logger.info("Start loading domain ingestion states")
         init_database()
         _async_session_factory = get_session_factory()
         _db = DatabaseRepository()
-        domain_state_records = []
+        until = paper_partition_horizon(date.today())
         try:
             async with _async_session_factory() as session:
-                domain_states = await _db.paper_ingestion_state.get_active(session)
-
-                for domain_state in domain_states:
-                    domain_state_records.append(
-                        PaperIngestionStateRecord(
-                            datasource_uuid=UUID(str(domain_state.datasource_id)),
-                            domain_uuid=UUID(str(domain_state.domain_id)),
-                            cursor_date=domain_state.cursor_date,
-                            is_active=bool(domain_state.is_active),
-                        ).model_dump(mode="json")
-                    )
+                async with session.begin():
+                    await _db.paper.ensure_partitions(until, session)
         except Exception as e:
-            logger.error(
-                "Error running domain ingestion task",
-                exc_info=e,
-            )
+            logger.error("Error creating papers partitions", exc_info=e)
             raise e
         finally:
-            logger.info(
-                "Domain ingestion states loaded",
-                extra={"count": len(domain_state_records)},
-            )
             await cleanup()
-        return domain_state_records
+        logger.info("Papers partitions ensured", extra={"until": until})
 
     return asyncio.run(_run())
 
@@ -81,90 +93,112 @@ def load_domain_ingestion_states() -> List[PaperIngestionStateRecord]:
     sla=timedelta(minutes=5),
     execution_timeout=timedelta(minutes=5),
 )
-def load_subject_to_ingest(
-    ingestion_state: PaperIngestionStateRecord,
-) -> List[SubjectIngestionRecord]:
-    """Loads the subject to ingest given the ingestion state.
+def plan_subject_ingestion(force: str = "False") -> List[SubjectIngestionRecord]:
+    """Plans the subject windows to ingest for all active domain states.
+
+    The plan comes from a single join of the active ingestion states with
+    their domains, subjects and subject watermarks. Each subject resumes the
+    day after its watermark, over the next INGESTION_WINDOW_DAYS or as many
+    days as expected to hold PAPER_INGESTION_TARGET_RECORDS papers if more,
+    cut into windows expected to hold about that many papers each. The paper
+    density of a subject is its daily paper count over the last
+    SUBJECT_DENSITY_WINDOW_DAYS, read from the daily counters.
+
+    Windows inside a window that already succeeded according to the
+    ingestion ledger are left out, so clearing a DAG run does not harvest
+    them again.
+
+    Subjects are listed by decreasing priority, their expected backlog
+    (days behind the watermark times density) scaled by their weight in
+    PAPER_INGESTION_SUBJECT_WEIGHTS, e.g. "cs.AI=3,cs.LG=2". Mapped tasks
+    are scheduled in that order, so a run cut short by its deadline has
+    harvested the most valuable subjects.
 
     Args:
-        ingestion_state (PaperIngestionStateRecord): The ingestion state to
-            load the subject for.
+        force (str): "True" to plan the windows that already succeeded too.
 
     Returns:
-        List[SubjectIngestionRecord]: A list of subjects to ingest for the
-            given ingestion state.
+        List[SubjectIngestionRecord]: The subject windows to ingest.
     """
 
-    async def _run(ingestion_state: PaperIngestionStateRecord):
+    async def _run():
         logger = LoggerManager.get_logger(__name__)
-        logger.info(
-            "Start loading subject to ingest",
-            extra={"ingestion_state": ingestion_state},
-        )
+        logger.info("Start planning subject ingestion")
         init_database()
-        _async_session_factory = get_session_factory()
         _db = DatabaseRepository()
-        subject_records: List[SubjectIngestionRecord] = []
+        target_records = int(os.getenv("PAPER_INGESTION_TARGET_RECORDS", "2000"))
+        weights = parse_subject_weights(os.getenv("PAPER_INGESTION_SUBJECT_WEIGHTS"))
+        today = datetime.now(timezone.utc).date()
+        subject_records = []
         try:
-            async with _async_session_factory() as session:
-                subjects = await _db.subject.get_by_domain_uuid(
-                    ingestion_state.domain_uuid, session
+            async with get_session(read_only=True) as session:
+                plan = await _db.paper_ingestion_state.get_subject_plan(session)
+                paper_counts = (
+                    await _db.paper_statistics.get_paper_count_by_subject_uuid(
+                        session,
+                        since=today - timedelta(days=SUBJECT_DENSITY_WINDOW_DAYS),
+                    )
+                )
+
+            for datasource_id, domain_id, subject_id, start_date, code in plan:
+                density = paper_counts.get(subject_id, 0) / SUBJECT_DENSITY_WINDOW_DAYS
+                priority = subject_priority(
+                    (today - start_date).days + 1, density, weights.get(code, 1.0)
                 )
-                for subject in subjects:
+                range_days = max(
+                    INGESTION_WINDOW_DAYS,
+                    harvest_window_days(
+                        density, target_records, MAX_INGESTION_RANGE_DAYS
+                    ),
+                )
+                range_days = min(range_days, (today - start_date).days)
+                if range_days < 0:
+                    continue
+                for from_date, until_date, expected_records in plan_harvest_windows(
+                    start_date, range_days, density, target_records
+                ):
                     subject_records.append(
                         SubjectIngestionRecord(
-                            datasource_uuid=UUID(str(ingestion_state.datasource_uuid)),
-                            domain_uuid=UUID(str(ingestion_state.domain_uuid)),
-                            subject_uuid=UUID(str(subject.id)),
-                            from_date=ingestion_state.cursor_date,
-                            until_date=ingestion_state.cursor_date + timedelta(days=10),
-                        ).model_dump(mode="json")
+                            datasource_uuid=datasource_id,
+                            domain_uuid=domain_id,
+                            subject_uuid=subject_id,
+                            from_date=from_date,
+                            until_date=until_date,
+                            expected_records=expected_records,
+                            priority=priority,
+                        )
                     )
-        except Exception:
-            logger.error(
-                "Error running subject ingestion task",
-                exc_info=True,
-                extra={"ingestion_state": ingestion_state},
-            )
+            # Stable, so the windows of a subject stay in date order.
+            subject_records.sort(key=lambda record: record.priority, reverse=True)
+
+            completed = set()
+            if str(force).lower() != "true":
+                async with get_session(read_only=True) as session:
+                    completed = await _db.paper_ingestion_ledger.get_completed_windows(
+                        [
+                            (record.subject_uuid, record.from_date, record.until_date)
+                            for record in subject_records
+                        ],
+                        session,
+                    )
+        except Exception as e:
+            logger.error("Error planning subject ingestion", exc_info=e)
+            raise e
         finally:
-            logger.info(
-                "Subject to ingest loaded",
-                extra={"count": len(subject_records)},
-            )
             await cleanup()
-        return subject_records
-
-    if ingestion_state is None:
-        return None
-    ingestion_state = PaperIngestionStateRecord.model_validate(ingestion_state)
-    return asyncio.run(_run(ingestion_state))
-
-
-@task(
-    retries=2,
-    retry_delay=timedelta(seconds=5),
-    retry_exponential_backoff=True,
-    max_retry_delay=timedelta(minutes=2),
-    sla=timedelta(minutes=5),
-    execution_timeout=timedelta(minutes=5),
-)
-def flatten(records) -> List:
-    """Flatten a list of records."""
-    logger = LoggerManager.get_logger(__name__)
-    logger.info("Start flattening records", extra={"count": len(records)})
-    new_records = []
-    queue = []
-    for record in records:
-        queue.append(record)
+        planned = [
+            record.model_dump(mode="json")
+            for record in subject_records
+            if (record.subject_uuid, record.from_date, record.until_date)
+            not in completed
+        ]
+        logger.info(
+            "Subject ingestion planned",
+            extra={"count": len(planned), "completed": len(completed)},
+        )
+        return planned
 
-    while queue:
-        record = queue.pop()
-        if isinstance(record, list):
-            queue.extend(record)
-        elif record is not None:
-            new_records.append(record)
-    logger.info("Flattened records", extra={"count": len(new_records)})
-    return new_records
+    return asyncio.run(_run())
 
 
 @task(
@@ -199,7 +233,11 @@ def ingest_papers_task(subject_record: SubjectIngestionRecord):
         ingested_papers_count = 0
         try:
             async with AsyncClient(
-                timeout=Timeout(30), limits=Limits(max_connections=10)
+                timeout=Timeout(30),
+                limits=Limits(max_connections=10),
+                event_hooks=rate_limit_hooks(
+                    SharedRateLimiter.from_env(_async_session_factory)
+                ),
             ) as http_client:
                 metadata_ingestion_service = PaperMetadataIngestionService(
                     _factory, _db, _async_session_factory, http_client
@@ -236,6 +274,297 @@ def ingest_papers_task(subject_record: SubjectIngestionRecord):
     return asyncio.run(_run(subject_record))
 
 
+@task(
+    retries=2,
+    retry_delay=timedelta(seconds=5),
+    retry_exponential_backoff=True,
+    max_retry_delay=timedelta(minutes=2),
+    sla=timedelta(minutes=5),
+    execution_timeout=timedelta(minutes=5),
+)
+def group_subjects(records, group_count: int) -> List[List[SubjectIngestionRecord]]:
+    """Bin-packs the subject windows to ingest into groups of similar volume.
+
+    All windows of a subject go to the same group, which runs them in date
+    order so the subject watermark advances window by window. Groups and
+    the subjects within a group are ordered by decreasing priority, so the
+    most valuable subjects start first.
+
+    Args:
+        records (List[SubjectIngestionRecord]): The subject windows to ingest.
+        group_count (int): The maximum number of groups.
+
+    Returns:
+        List[List[SubjectIngestionRecord]]: The subject window groups.
+    """
+    logger = LoggerManager.get_logger(__name__)
+    windows_by_subject = defaultdict(list)
+    for record in records:
+        record = SubjectIngestionRecord.model_validate(record)
+        windows_by_subject[record.subject_uuid].append(record.model_dump(mode="json"))
+    subject_windows = list(windows_by_subject.values())
+    subject_groups = pack_by_volume(
+        subject_windows,
+        [
+            max(sum(window["expected_records"] or 0 for window in windows), 1)
+            for windows in subject_windows
+        ],
+        group_count,
+    )
+    for subject_group in subject_groups:
+        subject_group.sort(key=lambda windows: windows[0]["priority"], reverse=True)
+    subject_groups.sort(
+        key=lambda subject_group: subject_group[0][0]["priority"], reverse=True
+    )
+    groups = [
+        [window for windows in subject_group for window in windows]
+        for subject_group in subject_groups
+    ]
+    logger.info(
+        "Subjects grouped",
+        extra={"count": len(subject_windows), "groups": len(groups)},
+    )
+    return groups
+
+
+@task(
+    retries=5,
+    retry_delay=timedelta(minutes=5),
+    retry_exponential_backoff=True,
+    max_retry_delay=timedelta(minutes=10),
+    sla=timedelta(hours=6),
+    execution_timeout=timedelta(hours=12),
+)
+def ingest_subject_group_task(
+    subject_group: List[SubjectIngestionRecord],
+) -> List[SubjectIngestionResultRecord]:
+    """Runs the paper metadata ingestion of a group of subject windows.
+
+    The windows are ingested concurrently in one event loop, sharing the
+    database engine, the HTTP client and the caches, at most
+    PAPER_INGESTION_SUBJECT_CONCURRENCY at a time. The task fails after all
+    windows ran if any of them failed, so a retry runs the group again.
+
+    Args:
+        subject_group (List[SubjectIngestionRecord]): The subject windows to
+            run the ingestion for.
+
+    Returns:
+        List[SubjectIngestionResultRecord]: The result of each window.
+    """
+
+    async def _run(subject_records: List[SubjectIngestionRecord]):
+        logger = LoggerManager.get_logger(__name__)
+        logger.info(
+            "Start subject group ingestion task",
+            extra={"count": len(subject_records)},
+        )
+        init_database()
+        _async_session_factory = get_session_factory()
+        _factory = PaperMetadataIngestionFactory()
+        _db = DatabaseRepository()
+
+        try:
+            async with AsyncClient(
+                timeout=Timeout(30),
+                limits=Limits(max_connections=10),
+                event_hooks=rate_limit_hooks(
+                    SharedRateLimiter.from_env(_async_session_factory)
+                ),
+            ) as http_client:
+                metadata_ingestion_service = PaperMetadataIngestionService(
+                    _factory, _db, _async_session_factory, http_client
+                )
+                results = await metadata_ingestion_service.run_subjects(
+                    [
+                        (
+                            record.datasource_uuid,
+                            record.subject_uuid,
+                            record.from_date,
+                            record.until_date,
+                        )
+                        for record in subject_records
+                    ],
+                    max_concurrency=int(
+                        os.getenv("PAPER_INGESTION_SUBJECT_CONCURRENCY", "4")
+                    ),
+                )
+        except Exception as e:
+            logger.error("Error running subject group ingestion task", exc_info=e)
+            raise e
+        finally:
+            await cleanup()
+
+        result_records = []
+        for record, result in zip(subject_records, results, strict=True):
+            result_record = SubjectIngestionResultRecord(
+                subject_uuid=record.subject_uuid,
+                from_date=record.from_date,
+                until_date=record.until_date,
+            )
+            if isinstance(result, Exception):
+                result_record.error = repr(result)
+            else:
+                result_record.num_papers_ingested = result
+            logger.info(
+                "Subject ingestion completed",
+                extra={"result": result_record.model_dump(mode="json")},
+            )
+            result_records.append(result_record)
+
+        failed = [
+            (str(record.subject_uuid), str(record.from_date))
+            for record in result_records
+            if record.error
+        ]
+        if failed:
+            raise RuntimeError(f"Ingestion failed for subjects {failed}")
+        return [record.model_dump(mode="json") for record in result_records]
+
+    subject_records = [
+        SubjectIngestionRecord.model_validate(record) for record in subject_group
+    ]
+    return asyncio.run(_run(subject_records))
+
+
+@task(
+    retries=2,
+    retry_delay=timedelta(seconds=5),
+    retry_exponential_backoff=True,
+    max_retry_delay=timedelta(minutes=2),
+    sla=timedelta(minutes=5),
+    execution_timeout=timedelta(minutes=5),
+    multiple_outputs=True,
+)
+def enqueue_subject_windows(records, batch_id: str) -> Dict[str, Any]:
+    """Enqueues the subject windows to ingest for the ingestion workers.
+
+    Enqueueing again in the same batch skips the windows already queued, so
+    the task can be retried.
+
+    Args:
+        records (List[SubjectIngestionRecord]): The subject windows to ingest.
+        batch_id (str): The ID of the batch, e.g. the DAG run ID.
+
+    Returns:
+        Dict[str, Any]: The batch ID as "batch_id", and the number of units
+            in the batch, including the ones queued by an earlier try, as
+            "unit_count".
+    """
+
+    async def _run():
+        logger = LoggerManager.get_logger(__name__)
+        init_database()
+        _async_session_factory = get_session_factory()
+        _db = DatabaseRepository()
+        units = [
+            SubjectIngestionRecord.model_validate(record) for record in records or []
+        ]
+        try:
+            async with _async_session_factory() as session:
+                async with session.begin():
+                    enqueued = await _db.ingestion_work_queue.enqueue(
+                        batch_id,
+                        [
+                            {
+                                "datasource_id": unit.datasource_uuid,
+                                "subject_id": unit.subject_uuid,
+                                "from_date": unit.from_date,
+                                "until_date": unit.until_date,
+                                "expected_records": unit.expected_records,
+                                "priority": unit.priority,
+                            }
+                            for unit in units
+                        ],
+                        session,
+                    )
+                    statuses = await _db.ingestion_work_queue.get_batch_status(
+                        batch_id, session
+                    )
+        except Exception as e:
+            logger.error("Error enqueueing subject windows", exc_info=e)
+            raise e
+        finally:
+            await cleanup()
+        unit_count = sum(statuses.values())
+        logger.info(
+            "Subject windows enqueued",
+            extra={
+                "batch_id": batch_id,
+                "count": enqueued,
+                "planned": len(units),
+                "unit_count": unit_count,
+            },
+        )
+        return {"batch_id": batch_id, "unit_count": unit_count}
+
+    return asyncio.run(_run())
+
+
+@task.sensor(
+    poke_interval=60,
+    timeout=timedelta(hours=12).total_seconds(),
+    mode="reschedule",
+)
+def wait_for_ingestion_queue(batch_id: str, unit_count: int) -> bool:
+    """Waits until the ingestion workers drained a batch.
+
+    The status is read from the primary, since a lagging replica may not
+    show the units yet, and the batch only counts as drained once all the
+    units enqueued are seen.
+
+    Args:
+        batch_id (str): The ID of the batch.
+        unit_count (int): The number of units in the batch, as returned by
+            `enqueue_subject_windows`.
+
+    Returns:
+        bool: Whether all the units of the batch are seen and none is pending
+            or running.
+
+    Raises:
+        RuntimeError: If units of the drained batch failed.
+    """
+
+    async def _run():
+        logger = LoggerManager.get_logger(__name__)
+        init_database()
+        _db = DatabaseRepository()
+        try:
+            async with get_session() as session:
+                statuses = await _db.ingestion_work_queue.get_batch_status(
+                    batch_id, session
+                )
+        finally:
+            await cleanup()
+        logger.info(
+            "Ingestion queue batch status",
+            extra={
+                "batch_id": batch_id,
+                "statuses": statuses,
+                "unit_count": unit_count,
+            },
+        )
+        if sum(statuses.values()) != int(unit_count):
+            logger.warning(
+                "Ingestion queue batch incomplete",
+                extra={"batch_id": batch_id, "seen": sum(statuses.values())},
+            )
+            return False
+        if statuses.get(IngestionStatus.PENDING) or statuses.get(
+            IngestionStatus.RUNNING
+        ):
+            return False
+        if statuses.get(IngestionStatus.FAILED):
+            raise RuntimeError(
+                f"{statuses[IngestionStatus.FAILED]} ingestion units failed"
+                f" in batch {batch_id}"
+            )
+        return True
+
+    return asyncio.run(_run())
+
+
 @task(
     retries=2,
     retry_delay=timedelta(seconds=10),
@@ -244,8 +573,11 @@ def ingest_papers_task(subject_record: SubjectIngestionRecord):
     sla=timedelta(minutes=5),
     execution_timeout=timedelta(minutes=5),
 )
-def update_domain_ingestion_states():
-    """Updates the domain ingestion states with the latest cursor dates.
+def repair_domain_ingestion_states():
+    """Recomputes the domain cursor dates from the papers table.
+
+    Ingestion advances the cursors as papers are written, so this full scan
+    only runs on demand to repair them.
 
     Returns:
         None
@@ -253,7 +585,7 @@ def update_domain_ingestion_states():
 
     async def _runs():
         logger = LoggerManager.get_logger(__name__)
-        logger.info("Start updating domain ingestion states")
+        logger.info("Start repairing domain ingestion states")
         init_database()
         _async_session_factory = get_session_factory()
         _db = DatabaseRepository()
@@ -267,15 +599,59 @@ def update_domain_ingestion_states():
 
         except Exception as e:
             logger.error(
-                "Error running domain ingestion task",
+                "Error repairing domain ingestion states",
                 exc_info=e,
             )
+            raise e
         finally:
             await cleanup()
 
     return asyncio.run(_runs())
 
 
+@task(
+    retries=2,
+    retry_delay=timedelta(seconds=10),
+    retry_exponential_backoff=True,
+    max_retry_delay=timedelta(minutes=2),
+    sla=timedelta(minutes=30),
+    execution_timeout=timedelta(minutes=30),
+)
+def repair_paper_statistics():
+    """Recomputes the daily paper counters from the papers table.
+
+    Ingestion writes the counters once per batch of papers, so this full
+    scan only runs on demand to repair them, e.g. after an ingestion task
+    was killed.
+
+    Returns:
+        None
+    """
+
+    async def _run():
+        logger = LoggerManager.get_logger(__name__)
+        logger.info("Start repairing paper statistics")
+        init_database()
+        _async_session_factory = get_session_factory()
+        _db = DatabaseRepository()
+
+        try:
+            async with _async_session_factory() as session:
+                async with session.begin():
+                    await _db.paper_statistics.recompute_from_papers(session)
+
+        except Exception as e:
+            logger.error(
+                "Error repairing paper statistics",
+                exc_info=e,
+            )
+            raise e
+        finally:
+            await cleanup()
+
+    return asyncio.run(_run())
+
+
 @task(
     retries=2,
     retry_delay=timedelta(seconds=10),
@@ -285,24 +661,30 @@ def update_domain_ingestion_states():
     execution_timeout=timedelta(minutes=5),
 )
 def update_statistics():
-    """Update statistics for papers ingested by datasource and subject."""
+    """Update statistics for papers ingested by datasource and subject.
+
+    Reads the daily counters kept by ingestion instead of counting papers,
+    and the ingestion throughput of the last day from the ingestion ledger.
+    """
 
     async def _run():
         logger = LoggerManager.get_logger(__name__)
         logger.info("Start updating statistics")
         init_database()
-        _async_session_factory = get_session_factory()
         _db = DatabaseRepository()
 
         statsd = get_client()
         try:
-            async with _async_session_factory() as session:
-                datasource2papers = await _db.paper.get_paper_count_by_datasource(
-                    session
+            async with get_session(read_only=True) as session:
+                datasource2papers = (
+                    await _db.paper_statistics.get_paper_count_by_datasource(session)
                 )
-                subjects2papers = await _db.paper_subject.get_paper_count_by_subject(
+                subjects2papers = await _db.paper_statistics.get_paper_count_by_subject(
                     session
                 )
+                throughput = await _db.paper_ingestion_ledger.get_throughput(
+                    datetime.now(timezone.utc) - THROUGHPUT_WINDOW, session
+                )
 
             papers_total = 0
             for datasource_name, papers_count in datasource2papers:
@@ -334,6 +716,20 @@ def update_statistics():
                 other_paper_counts,
             )
 
+            for row in throughput:
+                totals = row._asdict()
+                datasource_name = totals.pop("datasource")
+                for name, value in totals.items():
+                    statsd.gauge(
+                        f"papers.ingestion.last_day.{name}.{datasource_name}",
+                        value or 0,
+                    )
+                if row.duration_seconds:
+                    statsd.gauge(
+                        f"papers.ingestion.last_day.papers_per_second.{datasource_name}",
+                        row.fetched / row.duration_seconds,
+                    )
+
         except Exception as e:
             logger.error(
                 "Error running domain ingestion task",
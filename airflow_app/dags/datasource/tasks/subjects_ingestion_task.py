@@ -7,10 +7,16 @@ from httpx import AsyncClient, Limits, Timeout
 from common.constants import DataSource
 from common.database.postgres.models import Datasource, PaperIngestionState
 from common.database.postgres.repositories import DatabaseRepository
-from common.database.postgres.session import cleanup, get_session_factory, init_database
+from common.database.postgres.session import (
+    cleanup,
+    get_session,
+    get_session_factory,
+    init_database,
+)
 from common.datasources.factories import SubjectsFetcherFactory
 from common.metrics.stats_d import get_client
-from common.services.ingestion import SubjectsIngestionService
+from common.services.ingestion import SharedRateLimiter, SubjectsIngestionService
+from common.services.ingestion.shared_rate_limiter import rate_limit_hooks
 from common.utils.logger import LOG_MODULES, LoggerManager
 
 LoggerManager._log_module = LOG_MODULES.AIRFLOW
@@ -77,7 +83,11 @@ def ingest_subjects_task(
                         )
 
             async with AsyncClient(
-                timeout=Timeout(30), limits=Limits(max_connections=10)
+                timeout=Timeout(30),
+                limits=Limits(max_connections=10),
+                event_hooks=rate_limit_hooks(
+                    SharedRateLimiter.from_env(_async_session_factory)
+                ),
             ) as http_client:
                 ingestion_service = SubjectsIngestionService(_async_session_factory)
                 subjects_fetcher = SubjectsFetcherFactory.get(
@@ -186,13 +196,12 @@ def update_statistics():
         logger = LoggerManager.get_logger(__name__)
         logger.info("Start updating statistics")
         init_database()
-        _async_session_factory = get_session_factory()
         _db = DatabaseRepository()
 
         statsd = get_client()
         total_subjects = 0
         try:
-            async with _async_session_factory() as session:
+            async with get_session(read_only=True) as session:
                 domain2subjects = await _db.subject.get_subject_count_by_domain(session)
 
             for domain_name, subjects_count in domain2subjects:
@@ -0,0 +1,24 @@
+from airflow.sdk import dag
+from dags.export.tasks.paper_export_task import export_papers_task
+from pendulum import datetime
+
+from common.utils.logger import LOG_MODULES, LoggerManager
+
+LoggerManager._log_module = LOG_MODULES.AIRFLOW
+
+logger = LoggerManager.get_logger(__name__)
+
+
+@dag(
+    start_date=datetime(2026, 1, 1),
+    catchup=False,
+    schedule="@daily",
+    tags=["export"],
+    max_active_runs=1,
+)
+def paper_export_dag():
+    """Append new and updated papers to the Parquet export."""
+    export_papers_task()
+
+
+paper_export_dag()
@@ -0,0 +1,50 @@
+import asyncio
+from datetime import timedelta
+import os
+
+from airflow.sdk import task
+
+from common.database.postgres.repositories import DatabaseRepository
+from common.database.postgres.session import cleanup, get_session_factory, init_database
+from common.services.export import PaperExportService
+from common.utils.logger import LOG_MODULES, LoggerManager
+
+LoggerManager._log_module = LOG_MODULES.AIRFLOW
+
+
+@task(
+    retries=2,
+    retry_delay=timedelta(minutes=5),
+    retry_exponential_backoff=True,
+    max_retry_delay=timedelta(minutes=30),
+    execution_timeout=timedelta(hours=6),
+)
+def export_papers_task() -> int:
+    """Appends the papers updated since the last export to the Parquet files.
+
+    The export root directory is read from PAPER_EXPORT_DIR.
+
+    Returns:
+        int: The number of exported papers.
+    """
+
+    async def _run() -> int:
+        logger = LoggerManager.get_logger(__name__)
+        logger.info("Start paper export task")
+        init_database()
+        _db = DatabaseRepository()
+
+        try:
+            service = PaperExportService(
+                _db,
+                get_session_factory(read_only=True),
+                os.getenv("PAPER_EXPORT_DIR", "/opt/airflow/export"),
+            )
+            return await service.run()
+        except Exception as e:
+            logger.error("Error running paper export task", exc_info=e)
+            raise e
+        finally:
+            await cleanup()
+
+    return asyncio.run(_run())
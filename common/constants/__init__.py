@@ -1,4 +1,5 @@
 from .datasource import DataSource
+from .ingestion import IngestionStatus
 from .path import APP_ROOT, LOG_DIR
 
-__all__ = ["APP_ROOT", "LOG_DIR", "DataSource"]
+__all__ = ["APP_ROOT", "LOG_DIR", "DataSource", "IngestionStatus"]
@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class IngestionStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    def __str__(self):
+        """Return the string."""
+        return self.value
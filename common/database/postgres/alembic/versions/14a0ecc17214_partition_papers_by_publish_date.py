@@ -0,0 +1,237 @@
+"""partition papers by publish date.
+
+The papers table is rebuilt as a table range-partitioned by month of
+publish_date: the old table is renamed, a partitioned table is created with
+monthly partitions covering the existing papers and a few months ahead, the
+rows are copied over and the old table is dropped. Pause ingestion while the
+upgrade runs.
+
+Unique constraints on a partitioned table must include the partition key, so
+the primary key becomes (id, publish_date) and the global uniqueness of
+paper_identifier moves to the paper_identifiers registry. The foreign keys
+from paper_subjects and paper_authors to papers are dropped.
+
+Revision ID: 14a0ecc17214
+Revises: dcdd5edf5974
+Create Date: 2026-10-19 14:52:37.190426
+
+"""
+
+from datetime import date
+from typing import List, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from common.database.postgres.partitions import (
+    PAPERS_DEFAULT_PARTITION,
+    create_paper_partition_sql,
+    paper_partition_horizon,
+    paper_partition_ranges,
+)
+
+# revision identifiers, used by Alembic.
+revision: str = "14a0ecc17214"
+down_revision: Union[str, Sequence[str], None] = "dcdd5edf5974"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PAPER_COLUMNS = (
+    "id, abstract, content_hash, datasource_id, domain_id, main_author_id, "
+    "publish_date, title, paper_identifier, created_at, deleted_at, updated_at"
+)
+
+
+def _paper_columns() -> List[sa.Column]:
+    """Returns the columns of the papers table."""
+    return [
+        sa.Column(
+            "id", sa.UUID(), nullable=False, comment="Unique identifier for the paper"
+        ),
+        sa.Column(
+            "abstract", sa.Text(), nullable=False, comment="Abstract of the paper"
+        ),
+        sa.Column(
+            "content_hash",
+            sa.String(length=64),
+            nullable=True,
+            comment=(
+                "SHA-256 hash of title, abstract, authors, subjects and publish date"
+            ),
+        ),
+        sa.Column(
+            "datasource_id",
+            sa.UUID(),
+            nullable=False,
+            comment=(
+                "ID of the source from which this paper"
+                " was ingested (e.g., arXiv, PubMed)"
+            ),
+        ),
+        sa.Column(
+            "domain_id",
+            sa.UUID(),
+            nullable=False,
+            comment=(
+                "ID of the high-level academic domain (e.g., Computer Science, Physics)"
+            ),
+        ),
+        sa.Column(
+            "main_author_id",
+            sa.UUID(),
+            nullable=False,
+            comment="ID of the main/primary author of the paper",
+        ),
+        sa.Column(
+            "publish_date", sa.Date(), nullable=False, comment="Date of publication"
+        ),
+        sa.Column("title", sa.Text(), nullable=False, comment="Title of the paper"),
+        sa.Column(
+            "paper_identifier",
+            sa.String(),
+            nullable=False,
+            comment="Permanent URL or DOI of the paper",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["datasource_id"], ["datasources.id"], name="fk_papers_datasource"
+        ),
+        sa.ForeignKeyConstraint(["domain_id"], ["domains.id"]),
+        sa.ForeignKeyConstraint(["main_author_id"], ["authors.id"]),
+    ]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_constraint(
+        "paper_subjects_paper_id_fkey", "paper_subjects", type_="foreignkey"
+    )
+    op.drop_constraint(
+        "paper_authors_paper_id_fkey", "paper_authors", type_="foreignkey"
+    )
+
+    op.rename_table("papers", "papers_unpartitioned")
+    for index_name in [
+        "papers_pkey",
+        "uq_papers_paper_identifier",
+        "ix_papers_datasource_id_domain_id_publish_date",
+    ]:
+        op.execute(
+            f"ALTER INDEX {index_name} "
+            f"RENAME TO {index_name.replace('papers', 'papers_unpartitioned', 1)}"
+        )
+
+    op.create_table(
+        "papers",
+        *_paper_columns(),
+        sa.PrimaryKeyConstraint("id", "publish_date"),
+        postgresql_partition_by="RANGE (publish_date)",
+    )
+
+    connection = op.get_bind()
+    first_date, last_date = connection.execute(
+        sa.text("SELECT min(publish_date), max(publish_date) FROM papers_unpartitioned")
+    ).one()
+    today = date.today()
+    first_date = min(first_date or today, today)
+    last_date = max(last_date or today, paper_partition_horizon(today))
+    for name, lower, upper in paper_partition_ranges(first_date, last_date):
+        op.execute(create_paper_partition_sql(name, lower, upper))
+    op.execute(f"CREATE TABLE {PAPERS_DEFAULT_PARTITION} PARTITION OF papers DEFAULT")
+
+    op.create_index(
+        "ix_papers_datasource_id_domain_id_publish_date",
+        "papers",
+        ["datasource_id", "domain_id", "publish_date"],
+        unique=False,
+    )
+    op.execute(
+        f"INSERT INTO papers ({PAPER_COLUMNS}) "
+        f"SELECT {PAPER_COLUMNS} FROM papers_unpartitioned"
+    )
+
+    op.create_table(
+        "paper_identifiers",
+        sa.Column(
+            "paper_identifier",
+            sa.String(),
+            nullable=False,
+            comment="Permanent URL or DOI of the paper",
+        ),
+        sa.Column("paper_id", sa.UUID(), nullable=False, comment="ID of the paper"),
+        sa.Column(
+            "publish_date",
+            sa.Date(),
+            nullable=False,
+            comment="Publish date of the paper, selecting its partition",
+        ),
+        sa.PrimaryKeyConstraint("paper_identifier"),
+        comment=(
+            "Unique paper identifiers, pointing to the paper key in the"
+            " partitioned papers table"
+        ),
+    )
+    op.execute(
+        "INSERT INTO paper_identifiers (paper_identifier, paper_id, publish_date) "
+        "SELECT paper_identifier, id, publish_date FROM papers_unpartitioned"
+    )
+
+    op.drop_table("papers_unpartitioned")
+    op.execute("ANALYZE papers")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("paper_identifiers")
+
+    op.rename_table("papers", "papers_partitioned")
+    for index_name in ["papers_pkey", "ix_papers_datasource_id_domain_id_publish_date"]:
+        op.execute(
+            f"ALTER INDEX {index_name} "
+            f"RENAME TO {index_name.replace('papers', 'papers_partitioned', 1)}"
+        )
+
+    op.create_table(
+        "papers",
+        *_paper_columns(),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("paper_identifier", name="uq_papers_paper_identifier"),
+    )
+    op.create_index(
+        "ix_papers_datasource_id_domain_id_publish_date",
+        "papers",
+        ["datasource_id", "domain_id", "publish_date"],
+        unique=False,
+    )
+    op.execute(
+        f"INSERT INTO papers ({PAPER_COLUMNS}) "
+        f"SELECT {PAPER_COLUMNS} FROM papers_partitioned"
+    )
+    op.drop_table("papers_partitioned")
+
+    op.create_foreign_key(
+        "paper_authors_paper_id_fkey",
+        "paper_authors",
+        "papers",
+        ["paper_id"],
+        ["id"],
+    )
+    op.create_foreign_key(
+        "paper_subjects_paper_id_fkey",
+        "paper_subjects",
+        "papers",
+        ["paper_id"],
+        ["id"],
+    )
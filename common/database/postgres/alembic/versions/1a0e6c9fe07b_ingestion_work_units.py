@@ -0,0 +1,149 @@
+"""ingestion work units.
+
+Revision ID: 1a0e6c9fe07b
+Revises: fde2f3263165
+Create Date: 2026-10-19 22:47:05.118392
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "1a0e6c9fe07b"
+down_revision: Union[str, Sequence[str], None] = "fde2f3263165"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "ingestion_work_units",
+        sa.Column(
+            "id",
+            sa.Integer(),
+            nullable=False,
+            comment="Unique identifier for the work unit",
+        ),
+        sa.Column(
+            "batch_id",
+            sa.String(),
+            nullable=False,
+            comment="ID of the batch, e.g. the DAG run ID",
+        ),
+        sa.Column(
+            "datasource_id",
+            sa.UUID(),
+            nullable=False,
+            comment="ID of the data source (e.g., arXiv, PubMed)",
+        ),
+        sa.Column(
+            "subject_id",
+            sa.UUID(),
+            nullable=False,
+            comment="ID of the subject to harvest",
+        ),
+        sa.Column(
+            "from_date", sa.Date(), nullable=False, comment="First day of the window"
+        ),
+        sa.Column(
+            "until_date",
+            sa.Date(),
+            nullable=False,
+            comment="Last day of the window, inclusive",
+        ),
+        sa.Column(
+            "expected_records",
+            sa.Float(),
+            nullable=True,
+            comment="Expected number of papers in the window",
+        ),
+        sa.Column(
+            "status",
+            sa.String(length=16),
+            server_default="pending",
+            nullable=False,
+            comment="Status of the unit: pending, running, succeeded or failed",
+        ),
+        sa.Column(
+            "attempts",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+            comment="Number of times the unit was claimed",
+        ),
+        sa.Column(
+            "claimed_by",
+            sa.String(),
+            nullable=True,
+            comment="ID of the worker of the last claim",
+        ),
+        sa.Column(
+            "heartbeat_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="Timestamp of the last heartbeat of the worker running the unit",
+        ),
+        sa.Column(
+            "paper_count",
+            sa.Integer(),
+            nullable=True,
+            comment="Number of papers fetched for the unit",
+        ),
+        sa.Column(
+            "error",
+            sa.Text(),
+            nullable=True,
+            comment="Error of the last failed attempt, if any",
+        ),
+        sa.Column(
+            "enqueued_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="Timestamp of when the unit was enqueued",
+        ),
+        sa.Column(
+            "finished_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="Timestamp of when the unit succeeded or failed for good",
+        ),
+        sa.ForeignKeyConstraint(
+            ["datasource_id"],
+            ["datasources.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["subject_id"],
+            ["subjects.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "batch_id",
+            "subject_id",
+            "from_date",
+            "until_date",
+            name="uq_ingestion_work_units_batch_window",
+        ),
+        comment="Queue of paper ingestion windows drained by workers",
+    )
+    op.create_index(
+        "ix_ingestion_work_units_open",
+        "ingestion_work_units",
+        ["subject_id", "from_date"],
+        unique=False,
+        postgresql_where=sa.text("status IN ('pending', 'running')"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_ingestion_work_units_open",
+        table_name="ingestion_work_units",
+        postgresql_where=sa.text("status IN ('pending', 'running')"),
+    )
+    op.drop_table("ingestion_work_units")
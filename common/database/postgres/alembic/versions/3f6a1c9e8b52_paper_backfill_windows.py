@@ -0,0 +1,107 @@
+"""paper backfill windows.
+
+Revision ID: 3f6a1c9e8b52
+Revises: 7b2e9f4c1d83
+Create Date: 2026-10-19 18:41:36.905117
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "3f6a1c9e8b52"
+down_revision: Union[str, Sequence[str], None] = "7b2e9f4c1d83"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "paper_backfill_windows",
+        sa.Column(
+            "id",
+            sa.Integer(),
+            nullable=False,
+            comment="Unique identifier for the backfill window",
+        ),
+        sa.Column(
+            "datasource_id",
+            sa.UUID(),
+            nullable=False,
+            comment="ID of the data source (e.g., arXiv, PubMed)",
+        ),
+        sa.Column(
+            "domain_id",
+            sa.UUID(),
+            nullable=False,
+            comment="ID of the domain (e.g., Physics)",
+        ),
+        sa.Column(
+            "subject_id",
+            sa.UUID(),
+            nullable=False,
+            comment="ID of the subject to harvest",
+        ),
+        sa.Column(
+            "from_date", sa.Date(), nullable=False, comment="First day of the window"
+        ),
+        sa.Column(
+            "until_date",
+            sa.Date(),
+            nullable=False,
+            comment="Last day of the window, inclusive",
+        ),
+        sa.Column(
+            "paper_count",
+            sa.Integer(),
+            nullable=True,
+            comment="Number of papers harvested in the window",
+        ),
+        sa.Column(
+            "completed_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="Timestamp of when the window was harvested, NULL while pending",
+        ),
+        sa.ForeignKeyConstraint(
+            ["datasource_id"],
+            ["datasources.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["domain_id"],
+            ["domains.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["subject_id"],
+            ["subjects.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "subject_id",
+            "from_date",
+            "until_date",
+            name="uq_paper_backfill_windows_subject_range",
+        ),
+        comment="Historical harvesting windows of the paper backfill",
+    )
+    op.create_index(
+        "ix_paper_backfill_windows_pending",
+        "paper_backfill_windows",
+        ["domain_id", "from_date"],
+        unique=False,
+        postgresql_where=sa.text("completed_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_paper_backfill_windows_pending",
+        table_name="paper_backfill_windows",
+        postgresql_where=sa.text("completed_at IS NULL"),
+    )
+    op.drop_table("paper_backfill_windows")
@@ -0,0 +1,132 @@
+"""author canonical name.
+
+Authors are matched on a canonical name key instead of the raw name. The wide
+unique index on authors.name is replaced by a unique index on a 64-bit hash of
+the canonical name. Existing authors whose names canonicalize to the same key
+are merged into the first one.
+
+Revision ID: 4af0cd182cc8
+Revises: 9d3bdbde9b69
+Create Date: 2026-10-19 10:12:41.512337
+
+"""
+
+from typing import Dict, List, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from common.utils.author_name import author_name_hash, canonicalize_author_name
+
+# revision identifiers, used by Alembic.
+revision: str = "4af0cd182cc8"
+down_revision: Union[str, Sequence[str], None] = "9d3bdbde9b69"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 5000
+
+
+def _merge_duplicates(connection, survivor_id, duplicate_ids: List):
+    """Points papers of duplicate authors to the survivor and drops duplicates."""
+    params = {"survivor_id": survivor_id, "duplicate_ids": duplicate_ids}
+    connection.execute(
+        sa.text(
+            "UPDATE papers SET main_author_id = CAST(:survivor_id AS uuid) "
+            "WHERE main_author_id = ANY(CAST(:duplicate_ids AS uuid[]))"
+        ),
+        params,
+    )
+    connection.execute(
+        sa.text(
+            "INSERT INTO paper_authors (author_id, paper_id) "
+            "SELECT CAST(:survivor_id AS uuid), paper_id FROM paper_authors "
+            "WHERE author_id = ANY(CAST(:duplicate_ids AS uuid[])) "
+            "ON CONFLICT DO NOTHING"
+        ),
+        params,
+    )
+    connection.execute(
+        sa.text(
+            "DELETE FROM paper_authors "
+            "WHERE author_id = ANY(CAST(:duplicate_ids AS uuid[]))"
+        ),
+        params,
+    )
+    connection.execute(
+        sa.text("DELETE FROM authors WHERE id = ANY(CAST(:duplicate_ids AS uuid[]))"),
+        params,
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "authors",
+        sa.Column(
+            "canonical_name",
+            sa.Text(),
+            nullable=True,
+            comment="Unicode-normalized, case-folded name used to match the author",
+        ),
+    )
+    op.add_column(
+        "authors",
+        sa.Column(
+            "canonical_name_hash",
+            sa.BigInteger(),
+            nullable=True,
+            comment="64-bit hash of the canonical name, unique per author",
+        ),
+    )
+
+    connection = op.get_bind()
+    survivors: Dict[int, object] = {}
+    duplicates: Dict[object, List] = {}
+    updates = []
+    rows = connection.execute(sa.text("SELECT id, name FROM authors ORDER BY name"))
+    for author_id, name in rows:
+        canonical_name = canonicalize_author_name(name)
+        name_hash = author_name_hash(canonical_name)
+        if name_hash in survivors:
+            duplicates.setdefault(survivors[name_hash], []).append(author_id)
+            continue
+        survivors[name_hash] = author_id
+        updates.append(
+            {
+                "author_id": author_id,
+                "canonical_name": canonical_name,
+                "canonical_name_hash": name_hash,
+            }
+        )
+
+    for survivor_id, duplicate_ids in duplicates.items():
+        _merge_duplicates(connection, survivor_id, duplicate_ids)
+
+    update_stmt = sa.text(
+        "UPDATE authors SET canonical_name = :canonical_name, "
+        "canonical_name_hash = :canonical_name_hash WHERE id = :author_id"
+    )
+    for start in range(0, len(updates), BATCH_SIZE):
+        connection.execute(update_stmt, updates[start : start + BATCH_SIZE])
+
+    op.alter_column("authors", "canonical_name", nullable=False)
+    op.alter_column("authors", "canonical_name_hash", nullable=False)
+    op.create_index(
+        op.f("ix_authors_canonical_name_hash"),
+        "authors",
+        ["canonical_name_hash"],
+        unique=True,
+    )
+    op.drop_constraint(op.f("authors_name_key"), "authors", type_="unique")
+
+
+def downgrade() -> None:
+    """Downgrade schema.
+
+    Merged duplicate authors are not restored.
+    """
+    op.create_unique_constraint(op.f("authors_name_key"), "authors", ["name"])
+    op.drop_index(op.f("ix_authors_canonical_name_hash"), table_name="authors")
+    op.drop_column("authors", "canonical_name_hash")
+    op.drop_column("authors", "canonical_name")
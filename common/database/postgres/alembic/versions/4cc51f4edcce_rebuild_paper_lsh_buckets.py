@@ -0,0 +1,84 @@
+"""rebuild paper lsh buckets.
+
+The signatures are banded in 32 bands of 4 rows instead of 16 bands of 8, so
+that pairs at the duplicate threshold become candidates. The buckets of the
+stored signatures are recomputed; the signatures themselves do not change.
+
+Revision ID: 4cc51f4edcce
+Revises: f09ed0f34c35
+Create Date: 2026-10-20 09:14:37.260914
+
+"""
+
+import hashlib
+import struct
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "4cc51f4edcce"
+down_revision: Union[str, Sequence[str], None] = "f09ed0f34c35"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NUM_PERMUTATIONS = 128
+BATCH_SIZE = 5000
+
+
+def _rebuild_buckets(bands: int):
+    """Recomputes the LSH buckets of all the stored signatures.
+
+    The banding is inlined rather than imported from common.utils.minhash, so
+    the migration keeps producing the buckets of its own revision.
+    """
+    connection = op.get_bind()
+    rows = NUM_PERMUTATIONS // bands
+    connection.execute(sa.text("TRUNCATE TABLE paper_lsh_buckets"))
+    last_paper_id = None
+    while True:
+        batch = connection.execute(
+            sa.text(
+                "SELECT paper_id, signature FROM paper_fingerprints "
+                "WHERE CAST(:last_paper_id AS uuid) IS NULL "
+                "OR paper_id > CAST(:last_paper_id AS uuid) "
+                "ORDER BY paper_id LIMIT :limit"
+            ),
+            {"last_paper_id": last_paper_id, "limit": BATCH_SIZE},
+        ).all()
+        if not batch:
+            break
+        buckets = []
+        for paper_id, signature in batch:
+            values = struct.unpack(f"<{NUM_PERMUTATIONS}I", signature)
+            for band in range(bands):
+                digest = hashlib.blake2b(
+                    struct.pack(f"<{rows}I", *values[band * rows : (band + 1) * rows]),
+                    digest_size=8,
+                ).digest()
+                buckets.append(
+                    {
+                        "band": band,
+                        "bucket": int.from_bytes(digest, "big", signed=True),
+                        "paper_id": paper_id,
+                    }
+                )
+        connection.execute(
+            sa.text(
+                "INSERT INTO paper_lsh_buckets (band, bucket, paper_id) "
+                "VALUES (:band, :bucket, :paper_id) ON CONFLICT DO NOTHING"
+            ),
+            buckets,
+        )
+        last_paper_id = batch[-1][0]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _rebuild_buckets(bands=32)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _rebuild_buckets(bands=16)
@@ -0,0 +1,58 @@
+"""papers publish date id index.
+
+Supports keyset pagination over papers in (publish_date, id) order.
+CREATE INDEX CONCURRENTLY is not supported on a partitioned table, so the
+index is created on the parent only, built CONCURRENTLY on each partition and
+then attached; the parent index becomes valid once every partition is
+attached. A concurrent build that fails leaves an INVALID index behind; drop
+it before running the migration again.
+
+Revision ID: 5e7c21a9d4b8
+Revises: 14a0ecc17214
+Create Date: 2026-10-19 15:37:12.408316
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "5e7c21a9d4b8"
+down_revision: Union[str, Sequence[str], None] = "14a0ecc17214"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "ix_papers_publish_date_id"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(f"CREATE INDEX {INDEX_NAME} ON ONLY papers (publish_date, id)")
+    partitions = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT inhrelid::regclass::text FROM pg_inherits "
+                "WHERE inhparent = 'papers'::regclass ORDER BY 1"
+            )
+        )
+        .scalars()
+        .all()
+    )
+    with op.get_context().autocommit_block():
+        for partition in partitions:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+                f"ix_{partition}_publish_date_id ON {partition} (publish_date, id)"
+            )
+            op.execute(
+                f"ALTER INDEX {INDEX_NAME} "
+                f"ATTACH PARTITION ix_{partition}_publish_date_id"
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(INDEX_NAME, table_name="papers")
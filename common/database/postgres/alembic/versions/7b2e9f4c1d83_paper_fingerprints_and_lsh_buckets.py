@@ -0,0 +1,90 @@
+"""paper fingerprints and lsh buckets.
+
+Creates the MinHash near-duplicate index. Existing papers are not
+backfilled; they are fingerprinted when ingested again.
+
+Revision ID: 7b2e9f4c1d83
+Revises: e41b9c7d5a06
+Create Date: 2026-10-19 18:04:51.327410
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "7b2e9f4c1d83"
+down_revision: Union[str, Sequence[str], None] = "e41b9c7d5a06"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "paper_fingerprints",
+        sa.Column("paper_id", sa.UUID(), nullable=False, comment="ID of the paper"),
+        sa.Column(
+            "signature",
+            sa.LargeBinary(),
+            nullable=False,
+            comment="MinHash signature of the title and abstract shingles",
+        ),
+        sa.Column(
+            "duplicate_of_id",
+            sa.UUID(),
+            nullable=True,
+            comment="ID of the canonical paper this paper is a near duplicate of",
+        ),
+        sa.Column(
+            "similarity",
+            sa.Float(),
+            nullable=True,
+            comment="Estimated Jaccard similarity to the canonical paper",
+        ),
+        sa.PrimaryKeyConstraint("paper_id"),
+        comment="MinHash signatures of papers and their near-duplicate links",
+    )
+    op.create_index(
+        op.f("ix_paper_fingerprints_duplicate_of_id"),
+        "paper_fingerprints",
+        ["duplicate_of_id"],
+        unique=False,
+    )
+    op.create_table(
+        "paper_lsh_buckets",
+        sa.Column(
+            "band",
+            sa.SmallInteger(),
+            nullable=False,
+            comment="Index of the signature band",
+        ),
+        sa.Column(
+            "bucket",
+            sa.BigInteger(),
+            nullable=False,
+            comment="Hash of the signature rows in the band",
+        ),
+        sa.Column("paper_id", sa.UUID(), nullable=False, comment="ID of the paper"),
+        sa.PrimaryKeyConstraint("band", "bucket", "paper_id"),
+        comment="LSH band buckets of the paper signatures, for candidate lookup",
+    )
+    op.create_index(
+        op.f("ix_paper_lsh_buckets_paper_id"),
+        "paper_lsh_buckets",
+        ["paper_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_paper_lsh_buckets_paper_id"), table_name="paper_lsh_buckets")
+    op.drop_table("paper_lsh_buckets")
+    op.drop_index(
+        op.f("ix_paper_fingerprints_duplicate_of_id"),
+        table_name="paper_fingerprints",
+    )
+    op.drop_table("paper_fingerprints")
@@ -0,0 +1,74 @@
+"""papers full text search.
+
+Adds a stored generated tsvector column over the title (weight A) and the
+abstract (weight B), and a GIN index on it. Adding a stored generated column
+rewrites every papers partition under an ACCESS EXCLUSIVE lock, so pause
+ingestion while the upgrade runs. The index is then built CONCURRENTLY on each
+partition and attached to the parent index.
+
+Revision ID: a83d5f0e27c4
+Revises: 0c3f8be61a72
+Create Date: 2026-10-19 16:48:20.573961
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "a83d5f0e27c4"
+down_revision: Union[str, Sequence[str], None] = "0c3f8be61a72"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEX_NAME = "ix_papers_search_vector"
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', title), 'A') || "
+    "setweight(to_tsvector('english', abstract), 'B')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "papers",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_SQL, persisted=True),
+            nullable=True,
+            comment="Weighted full-text search vector of the title and abstract",
+        ),
+    )
+    op.execute(f"CREATE INDEX {INDEX_NAME} ON ONLY papers USING gin (search_vector)")
+    partitions = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT inhrelid::regclass::text FROM pg_inherits "
+                "WHERE inhparent = 'papers'::regclass ORDER BY 1"
+            )
+        )
+        .scalars()
+        .all()
+    )
+    with op.get_context().autocommit_block():
+        for partition in partitions:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+                f"ix_{partition}_search_vector ON {partition} "
+                "USING gin (search_vector)"
+            )
+            op.execute(
+                f"ALTER INDEX {INDEX_NAME} "
+                f"ATTACH PARTITION ix_{partition}_search_vector"
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(INDEX_NAME, table_name="papers")
+    op.drop_column("papers", "search_vector")
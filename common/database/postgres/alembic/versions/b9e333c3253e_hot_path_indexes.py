@@ -0,0 +1,61 @@
+"""hot path indexes.
+
+Indexes are built CONCURRENTLY so ingestion keeps writing while they are
+created. A concurrent build that fails leaves an INVALID index behind; drop it
+before running the migration again.
+
+Revision ID: b9e333c3253e
+Revises: cd97500c5f06
+Create Date: 2026-10-19 12:26:48.731905
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b9e333c3253e"
+down_revision: Union[str, Sequence[str], None] = "cd97500c5f06"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ("ix_subjects_code_domain_id", "subjects", ["code", "domain_id"]),
+    ("ix_subjects_domain_id", "subjects", ["domain_id"]),
+    (
+        "ix_papers_datasource_id_domain_id_publish_date",
+        "papers",
+        ["datasource_id", "domain_id", "publish_date"],
+    ),
+    (
+        "ix_paper_subjects_subject_id_paper_id",
+        "paper_subjects",
+        ["subject_id", "paper_id"],
+    ),
+    ("ix_paper_authors_paper_id", "paper_authors", ["paper_id"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table_name, columns in INDEXES:
+            op.create_index(
+                name,
+                table_name,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table_name, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table_name,
+                postgresql_concurrently=True,
+            )
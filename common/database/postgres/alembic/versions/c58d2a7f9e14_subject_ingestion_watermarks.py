@@ -0,0 +1,66 @@
+"""subject ingestion watermarks.
+
+Creates the per-subject harvest watermarks. Subjects of domains with a
+cursor start the day before it, so the first run after the migration
+harvests from the domain cursor as before.
+
+Revision ID: c58d2a7f9e14
+Revises: 3f6a1c9e8b52
+Create Date: 2026-10-19 19:12:58.640271
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c58d2a7f9e14"
+down_revision: Union[str, Sequence[str], None] = "3f6a1c9e8b52"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "subject_ingestion_watermarks",
+        sa.Column("subject_id", sa.UUID(), nullable=False, comment="ID of the subject"),
+        sa.Column(
+            "datasource_id",
+            sa.UUID(),
+            nullable=False,
+            comment="ID of the data source (e.g., arXiv, PubMed)",
+        ),
+        sa.Column(
+            "harvested_until",
+            sa.Date(),
+            nullable=False,
+            comment="Last day up to which all papers of the subject are harvested",
+        ),
+        sa.ForeignKeyConstraint(
+            ["datasource_id"],
+            ["datasources.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["subject_id"],
+            ["subjects.id"],
+        ),
+        sa.PrimaryKeyConstraint("subject_id"),
+        comment="Harvest progress of the paper ingestion per subject",
+    )
+    op.execute("""
+        INSERT INTO subject_ingestion_watermarks
+            (subject_id, datasource_id, harvested_until)
+        SELECT subjects.id, paper_ingestion_state.datasource_id,
+            paper_ingestion_state.cursor_date - 1
+        FROM paper_ingestion_state
+        JOIN subjects ON subjects.domain_id = paper_ingestion_state.domain_id
+        WHERE paper_ingestion_state.cursor_date IS NOT NULL
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("subject_ingestion_watermarks")
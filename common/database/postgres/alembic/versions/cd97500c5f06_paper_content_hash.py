@@ -0,0 +1,41 @@
+"""paper content hash.
+
+Existing papers keep a NULL hash, so they are refreshed the next time they
+are harvested.
+
+Revision ID: cd97500c5f06
+Revises: 4af0cd182cc8
+Create Date: 2026-10-19 11:03:17.208114
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "cd97500c5f06"
+down_revision: Union[str, Sequence[str], None] = "4af0cd182cc8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "papers",
+        sa.Column(
+            "content_hash",
+            sa.String(length=64),
+            nullable=True,
+            comment=(
+                "SHA-256 hash of title, abstract, authors, subjects and publish date"
+            ),
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("papers", "content_hash")
@@ -0,0 +1,91 @@
+"""paper statistics table.
+
+The counters are backfilled from the existing papers. Papers written while
+the backfill runs are not counted, so pause ingestion during the upgrade.
+
+Revision ID: dcdd5edf5974
+Revises: b9e333c3253e
+Create Date: 2026-10-19 13:41:05.662310
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "dcdd5edf5974"
+down_revision: Union[str, Sequence[str], None] = "b9e333c3253e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "paper_statistics",
+        sa.Column(
+            "datasource_id",
+            sa.UUID(),
+            nullable=False,
+            comment="ID of the data source (e.g., arXiv, PubMed)",
+        ),
+        sa.Column(
+            "subject_id",
+            sa.UUID(),
+            nullable=False,
+            comment="ID of the subject",
+        ),
+        sa.Column(
+            "day",
+            sa.Date(),
+            nullable=False,
+            comment="Publish date of the counted papers",
+        ),
+        sa.Column(
+            "paper_count",
+            sa.Integer(),
+            nullable=False,
+            comment="Number of papers with the subject",
+        ),
+        sa.Column(
+            "primary_paper_count",
+            sa.Integer(),
+            nullable=False,
+            comment="Number of papers with the subject as primary subject",
+        ),
+        sa.ForeignKeyConstraint(
+            ["datasource_id"],
+            ["datasources.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["subject_id"],
+            ["subjects.id"],
+        ),
+        sa.PrimaryKeyConstraint("datasource_id", "subject_id", "day"),
+        comment="Daily paper counts per datasource and subject, kept by ingestion",
+    )
+    op.execute(
+        """
+        INSERT INTO paper_statistics (
+            datasource_id, subject_id, day, paper_count, primary_paper_count
+        )
+        SELECT
+            papers.datasource_id,
+            paper_subjects.subject_id,
+            papers.publish_date,
+            count(*),
+            count(*) FILTER (WHERE paper_subjects.is_primary)
+        FROM paper_subjects
+        JOIN papers ON papers.id = paper_subjects.paper_id
+        WHERE papers.datasource_id IS NOT NULL
+        GROUP BY
+            papers.datasource_id, paper_subjects.subject_id, papers.publish_date
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("paper_statistics")
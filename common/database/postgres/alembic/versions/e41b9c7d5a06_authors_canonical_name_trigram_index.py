@@ -0,0 +1,47 @@
+"""authors canonical name trigram index.
+
+Creates the pg_trgm extension and a trigram GIN index on the canonical author
+names for fuzzy author search. The index is built CONCURRENTLY so ingestion
+keeps writing; a failed build leaves an INVALID index behind, drop it before
+running the migration again.
+
+Revision ID: e41b9c7d5a06
+Revises: a83d5f0e27c4
+Create Date: 2026-10-19 17:22:09.184652
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e41b9c7d5a06"
+down_revision: Union[str, Sequence[str], None] = "a83d5f0e27c4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_authors_canonical_name_trgm",
+            "authors",
+            ["canonical_name"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"canonical_name": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_authors_canonical_name_trgm",
+            table_name="authors",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,37 @@
+"""ingestion work unit priority.
+
+Revision ID: f09ed0f34c35
+Revises: 1a0e6c9fe07b
+Create Date: 2026-10-19 23:58:12.402117
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "f09ed0f34c35"
+down_revision: Union[str, Sequence[str], None] = "1a0e6c9fe07b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "ingestion_work_units",
+        sa.Column(
+            "priority",
+            sa.Float(),
+            server_default="0",
+            nullable=False,
+            comment="Priority of the subject, higher is claimed first",
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("ingestion_work_units", "priority")
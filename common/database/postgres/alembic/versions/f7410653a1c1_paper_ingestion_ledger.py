@@ -0,0 +1,154 @@
+"""paper ingestion ledger.
+
+Revision ID: f7410653a1c1
+Revises: c58d2a7f9e14
+Create Date: 2026-10-19 21:12:48.310264
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "f7410653a1c1"
+down_revision: Union[str, Sequence[str], None] = "c58d2a7f9e14"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "paper_ingestion_ledger",
+        sa.Column(
+            "id",
+            sa.Integer(),
+            nullable=False,
+            comment="Unique identifier for the ledger entry",
+        ),
+        sa.Column(
+            "datasource_id",
+            sa.UUID(),
+            nullable=False,
+            comment="ID of the data source (e.g., arXiv, PubMed)",
+        ),
+        sa.Column(
+            "subject_id",
+            sa.UUID(),
+            nullable=False,
+            comment="ID of the harvested subject",
+        ),
+        sa.Column(
+            "from_date", sa.Date(), nullable=False, comment="First day of the window"
+        ),
+        sa.Column(
+            "until_date",
+            sa.Date(),
+            nullable=False,
+            comment="Last day of the window, inclusive",
+        ),
+        sa.Column(
+            "status",
+            sa.String(length=16),
+            nullable=False,
+            comment="Status of the window: running, succeeded or failed",
+        ),
+        sa.Column(
+            "pages",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+            comment="Number of pages requested from the datasource",
+        ),
+        sa.Column(
+            "fetched",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+            comment="Number of paper records fetched",
+        ),
+        sa.Column(
+            "inserted",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+            comment="Number of papers created or updated",
+        ),
+        sa.Column(
+            "skipped",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+            comment="Number of papers already up to date",
+        ),
+        sa.Column(
+            "failed",
+            sa.Integer(),
+            server_default="0",
+            nullable=False,
+            comment="Number of paper records that could not be ingested",
+        ),
+        sa.Column(
+            "duration_seconds",
+            sa.Float(),
+            nullable=True,
+            comment="Wall time of the window, NULL while running",
+        ),
+        sa.Column(
+            "error",
+            sa.Text(),
+            nullable=True,
+            comment="Error the window failed with, if any",
+        ),
+        sa.Column(
+            "started_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="Timestamp of when the window started",
+        ),
+        sa.Column(
+            "finished_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="Timestamp of when the window finished, NULL while running",
+        ),
+        sa.ForeignKeyConstraint(
+            ["datasource_id"],
+            ["datasources.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["subject_id"],
+            ["subjects.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        comment="Outcome of each paper ingestion window",
+    )
+    op.create_index(
+        "ix_paper_ingestion_ledger_succeeded",
+        "paper_ingestion_ledger",
+        ["subject_id", "until_date"],
+        unique=False,
+        postgresql_where=sa.text("status = 'succeeded'"),
+    )
+    op.create_index(
+        "ix_paper_ingestion_ledger_started_at",
+        "paper_ingestion_ledger",
+        ["started_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_paper_ingestion_ledger_started_at", table_name="paper_ingestion_ledger"
+    )
+    op.drop_index(
+        "ix_paper_ingestion_ledger_succeeded",
+        table_name="paper_ingestion_ledger",
+        postgresql_where=sa.text("status = 'succeeded'"),
+    )
+    op.drop_table("paper_ingestion_ledger")
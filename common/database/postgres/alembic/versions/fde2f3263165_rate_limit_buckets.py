@@ -0,0 +1,57 @@
+"""rate limit buckets.
+
+Revision ID: fde2f3263165
+Revises: f7410653a1c1
+Create Date: 2026-10-19 22:03:17.552940
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "fde2f3263165"
+down_revision: Union[str, Sequence[str], None] = "f7410653a1c1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "rate_limit_buckets",
+        sa.Column(
+            "name",
+            sa.String(),
+            nullable=False,
+            comment="Name of the bucket, e.g. the API host",
+        ),
+        sa.Column(
+            "rate", sa.Float(), nullable=False, comment="Tokens added per second"
+        ),
+        sa.Column(
+            "burst", sa.Float(), nullable=False, comment="Maximum number of tokens"
+        ),
+        sa.Column(
+            "tokens",
+            sa.Float(),
+            nullable=False,
+            comment="Tokens left at updated_at, negative when requests are queued",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="Timestamp of the last token taken",
+        ),
+        sa.PrimaryKeyConstraint("name"),
+        comment="Token buckets shared by the workers calling a datasource",
+        prefixes=["UNLOGGED"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("rate_limit_buckets")
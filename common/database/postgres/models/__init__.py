@@ -2,19 +2,36 @@ from .author import Author
 from .base import BaseModel
 from .datasource import Datasource
 from .domain import Domain
+from .ingestion_work_unit import IngestionWorkUnit
 from .paper import Paper
+from .paper_backfill_window import PaperBackfillWindow
+from .paper_fingerprint import PaperFingerprint, PaperLshBucket
+from .paper_identifier import PaperIdentifier
+from .paper_ingestion_ledger import PaperIngestionLedgerEntry
 from .paper_ingestion_state import PaperIngestionState
+from .paper_statistics import PaperStatistics
+from .rate_limit_bucket import RateLimitBucket
 from .relationships import paper_authors, paper_subject
 from .subject import Subject
+from .subject_ingestion_watermark import SubjectIngestionWatermark
 
 __all__ = [
     "Author",
     "BaseModel",
     "Datasource",
     "Domain",
+    "IngestionWorkUnit",
     "Paper",
+    "PaperBackfillWindow",
+    "PaperFingerprint",
+    "PaperIdentifier",
+    "PaperIngestionLedgerEntry",
     "PaperIngestionState",
+    "PaperLshBucket",
+    "PaperStatistics",
+    "RateLimitBucket",
     "Subject",
+    "SubjectIngestionWatermark",
     "paper_authors",
     "paper_subject",
 ]
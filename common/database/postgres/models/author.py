@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING, List
 from uuid import uuid4
 
-from sqlalchemy import UUID, String
+from sqlalchemy import DDL, UUID, BigInteger, Index, String, Text, event
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import BaseModel
@@ -13,6 +13,14 @@ if TYPE_CHECKING:
 
 class Author(BaseModel):
     __tablename__ = "authors"
+    __table_args__ = (
+        Index(
+            "ix_authors_canonical_name_trgm",
+            "canonical_name",
+            postgresql_using="gin",
+            postgresql_ops={"canonical_name": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -21,14 +29,33 @@ class Author(BaseModel):
         primary_key=True,
         comment="Unique identifier for the author",
     )
-    name: Mapped[str] = mapped_column(
-        String, unique=True, comment="Full name of the author"
+    canonical_name: Mapped[str] = mapped_column(
+        Text,
+        nullable=False,
+        comment="Unicode-normalized, case-folded name used to match the author",
+    )
+    canonical_name_hash: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        unique=True,
+        index=True,
+        comment="64-bit hash of the canonical name, unique per author",
     )
+    name: Mapped[str] = mapped_column(String, comment="Full name of the author")
     primary_papers: Mapped[List["Paper"]] = relationship(
         back_populates="main_author",
         foreign_keys="Paper.main_author_id",
     )
     publications: Mapped[List["Paper"]] = relationship(
         secondary=paper_authors,
+        primaryjoin="Author.id == foreign(paper_authors.c.author_id)",
+        secondaryjoin="Paper.id == foreign(paper_authors.c.paper_id)",
         back_populates="authors",
     )
+
+
+event.listen(
+    Author.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+)
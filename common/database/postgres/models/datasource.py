@@ -26,12 +26,10 @@ class Datasource(BaseModel):
     )
     papers: Mapped[List["Paper"]] = relationship(
         back_populates="datasource",
-        lazy="selectin",
     )
 
     domains: Mapped[List["Domain"]] = relationship(
         back_populates="datasource",
-        lazy="selectin",
     )
 
     paper_ingestion_states: Mapped["PaperIngestionState"] = relationship(
@@ -0,0 +1,114 @@
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy import (
+    UUID,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    Sequence,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+    text,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseModel
+
+
+class IngestionWorkUnit(BaseModel):
+    __tablename__ = "ingestion_work_units"
+
+    id: Mapped[int] = mapped_column(
+        Integer,
+        Sequence("ingestion_work_units_id_seq"),
+        primary_key=True,
+        comment="Unique identifier for the work unit",
+    )
+    batch_id: Mapped[str] = mapped_column(
+        String, nullable=False, comment="ID of the batch, e.g. the DAG run ID"
+    )
+    datasource_id: Mapped[UUID] = mapped_column(
+        ForeignKey("datasources.id"),
+        nullable=False,
+        comment="ID of the data source (e.g., arXiv, PubMed)",
+    )
+    subject_id: Mapped[UUID] = mapped_column(
+        ForeignKey("subjects.id"),
+        nullable=False,
+        comment="ID of the subject to harvest",
+    )
+    from_date: Mapped[date] = mapped_column(
+        Date, nullable=False, comment="First day of the window"
+    )
+    until_date: Mapped[date] = mapped_column(
+        Date, nullable=False, comment="Last day of the window, inclusive"
+    )
+    expected_records: Mapped[Optional[float]] = mapped_column(
+        Float, nullable=True, comment="Expected number of papers in the window"
+    )
+    priority: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        server_default="0",
+        comment="Priority of the subject, higher is claimed first",
+    )
+    status: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+        server_default="pending",
+        comment="Status of the unit: pending, running, succeeded or failed",
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default="0",
+        comment="Number of times the unit was claimed",
+    )
+    claimed_by: Mapped[Optional[str]] = mapped_column(
+        String, nullable=True, comment="ID of the worker of the last claim"
+    )
+    heartbeat_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Timestamp of the last heartbeat of the worker running the unit",
+    )
+    paper_count: Mapped[Optional[int]] = mapped_column(
+        Integer, nullable=True, comment="Number of papers fetched for the unit"
+    )
+    error: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True, comment="Error of the last failed attempt, if any"
+    )
+    enqueued_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        comment="Timestamp of when the unit was enqueued",
+    )
+    finished_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Timestamp of when the unit succeeded or failed for good",
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "batch_id",
+            "subject_id",
+            "from_date",
+            "until_date",
+            name="uq_ingestion_work_units_batch_window",
+        ),
+        Index(
+            "ix_ingestion_work_units_open",
+            "subject_id",
+            "from_date",
+            postgresql_where=text("status IN ('pending', 'running')"),
+        ),
+        {"comment": "Queue of paper ingestion windows drained by workers"},
+    )
@@ -1,10 +1,22 @@
 from datetime import date
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 from uuid import uuid4
 
-from sqlalchemy import UUID, Date, ForeignKey, String, Text
+from sqlalchemy import (
+    DDL,
+    UUID,
+    Computed,
+    Date,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    event,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from ..partitions import PAPERS_DEFAULT_PARTITION
 from .base import BaseModel, TimestampModel
 from .relationships import paper_authors
 
@@ -14,9 +26,35 @@ if TYPE_CHECKING:
     from .domain import Domain
     from .relationships.paper_subject import PaperSubject
 
+# Text search configuration of the search vector; queries must use the same.
+PAPER_SEARCH_CONFIG = "english"
+PAPER_SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{PAPER_SEARCH_CONFIG}', title), 'A') || "
+    f"setweight(to_tsvector('{PAPER_SEARCH_CONFIG}', abstract), 'B')"
+)
+
 
 class Paper(BaseModel, TimestampModel):
+    """Paper metadata, range-partitioned by month of publish date.
+
+    The primary key includes the partition key, so a paper is addressed by
+    (id, publish_date). The paper identifier is kept unique across all
+    partitions by the `PaperIdentifier` registry.
+    """
+
     __tablename__ = "papers"
+    __table_args__ = (
+        Index(
+            "ix_papers_datasource_id_domain_id_publish_date",
+            "datasource_id",
+            "domain_id",
+            "publish_date",
+        ),
+        Index("ix_papers_publish_date_id", "publish_date", "id"),
+        Index("ix_papers_updated_at_id", "updated_at", "id"),
+        Index("ix_papers_search_vector", "search_vector", postgresql_using="gin"),
+        {"postgresql_partition_by": "RANGE (publish_date)"},
+    )
 
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -31,9 +69,17 @@ class Paper(BaseModel, TimestampModel):
 
     authors: Mapped[List["Author"]] = relationship(
         secondary=paper_authors,
+        primaryjoin="Paper.id == foreign(paper_authors.c.paper_id)",
+        secondaryjoin="Author.id == foreign(paper_authors.c.author_id)",
         back_populates="publications",
     )
 
+    content_hash: Mapped[Optional[str]] = mapped_column(
+        String(64),
+        nullable=True,
+        comment="SHA-256 hash of title, abstract, authors, subjects and publish date",
+    )
+
     datasource_id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("datasources.id"),
@@ -72,10 +118,18 @@ class Paper(BaseModel, TimestampModel):
     )
 
     paper_subjects: Mapped[List["PaperSubject"]] = relationship(
+        primaryjoin="Paper.id == foreign(PaperSubject.paper_id)",
         back_populates="paper",
     )
     publish_date: Mapped[date] = mapped_column(
-        Date, nullable=False, comment="Date of publication"
+        Date, nullable=False, primary_key=True, comment="Date of publication"
+    )
+
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(PAPER_SEARCH_VECTOR_SQL, persisted=True),
+        deferred=True,
+        comment="Weighted full-text search vector of the title and abstract",
     )
 
     title: Mapped[str] = mapped_column(
@@ -85,6 +139,15 @@ class Paper(BaseModel, TimestampModel):
     paper_identifier: Mapped[str] = mapped_column(
         String,
         nullable=False,
-        unique=True,
         comment="Permanent URL or DOI of the paper",
     )
+
+
+event.listen(
+    Paper.__table__,
+    "after_create",
+    DDL(
+        f"CREATE TABLE IF NOT EXISTS {PAPERS_DEFAULT_PARTITION} "
+        "PARTITION OF papers DEFAULT"
+    ),
+)
@@ -0,0 +1,73 @@
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy import (
+    UUID,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Sequence,
+    UniqueConstraint,
+    text,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseModel
+
+
+class PaperBackfillWindow(BaseModel):
+    __tablename__ = "paper_backfill_windows"
+
+    id: Mapped[int] = mapped_column(
+        Integer,
+        Sequence("paper_backfill_windows_id_seq"),
+        primary_key=True,
+        comment="Unique identifier for the backfill window",
+    )
+    datasource_id: Mapped[UUID] = mapped_column(
+        ForeignKey("datasources.id"),
+        nullable=False,
+        comment="ID of the data source (e.g., arXiv, PubMed)",
+    )
+    domain_id: Mapped[UUID] = mapped_column(
+        ForeignKey("domains.id"),
+        nullable=False,
+        comment="ID of the domain (e.g., Physics)",
+    )
+    subject_id: Mapped[UUID] = mapped_column(
+        ForeignKey("subjects.id"),
+        nullable=False,
+        comment="ID of the subject to harvest",
+    )
+    from_date: Mapped[date] = mapped_column(
+        Date, nullable=False, comment="First day of the window"
+    )
+    until_date: Mapped[date] = mapped_column(
+        Date, nullable=False, comment="Last day of the window, inclusive"
+    )
+    paper_count: Mapped[Optional[int]] = mapped_column(
+        Integer, nullable=True, comment="Number of papers harvested in the window"
+    )
+    completed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Timestamp of when the window was harvested, NULL while pending",
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "subject_id",
+            "from_date",
+            "until_date",
+            name="uq_paper_backfill_windows_subject_range",
+        ),
+        Index(
+            "ix_paper_backfill_windows_pending",
+            "domain_id",
+            "from_date",
+            postgresql_where=text("completed_at IS NULL"),
+        ),
+        {"comment": "Historical harvesting windows of the paper backfill"},
+    )
@@ -0,0 +1,59 @@
+from typing import Optional
+
+from sqlalchemy import UUID, BigInteger, Float, LargeBinary, SmallInteger
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseModel
+
+
+class PaperFingerprint(BaseModel):
+    __tablename__ = "paper_fingerprints"
+    __table_args__ = {
+        "comment": "MinHash signatures of papers and their near-duplicate links"
+    }
+
+    paper_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        comment="ID of the paper",
+    )
+    signature: Mapped[bytes] = mapped_column(
+        LargeBinary,
+        nullable=False,
+        comment="MinHash signature of the title and abstract shingles",
+    )
+    duplicate_of_id: Mapped[Optional[UUID]] = mapped_column(
+        UUID(as_uuid=True),
+        nullable=True,
+        index=True,
+        comment="ID of the canonical paper this paper is a near duplicate of",
+    )
+    similarity: Mapped[Optional[float]] = mapped_column(
+        Float,
+        nullable=True,
+        comment="Estimated Jaccard similarity to the canonical paper",
+    )
+
+
+class PaperLshBucket(BaseModel):
+    __tablename__ = "paper_lsh_buckets"
+    __table_args__ = {
+        "comment": "LSH band buckets of the paper signatures, for candidate lookup"
+    }
+
+    band: Mapped[int] = mapped_column(
+        SmallInteger,
+        primary_key=True,
+        comment="Index of the signature band",
+    )
+    bucket: Mapped[int] = mapped_column(
+        BigInteger,
+        primary_key=True,
+        comment="Hash of the signature rows in the band",
+    )
+    paper_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        index=True,
+        comment="ID of the paper",
+    )
@@ -0,0 +1,32 @@
+from datetime import date
+
+from sqlalchemy import UUID, Date, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseModel
+
+
+class PaperIdentifier(BaseModel):
+    __tablename__ = "paper_identifiers"
+    __table_args__ = {
+        "comment": (
+            "Unique paper identifiers, pointing to the paper key in the"
+            " partitioned papers table"
+        )
+    }
+
+    paper_identifier: Mapped[str] = mapped_column(
+        String,
+        primary_key=True,
+        comment="Permanent URL or DOI of the paper",
+    )
+    paper_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        nullable=False,
+        comment="ID of the paper",
+    )
+    publish_date: Mapped[date] = mapped_column(
+        Date,
+        nullable=False,
+        comment="Publish date of the paper, selecting its partition",
+    )
@@ -0,0 +1,110 @@
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy import (
+    UUID,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    Sequence,
+    String,
+    Text,
+    func,
+    text,
+)
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseModel
+
+
+class PaperIngestionLedgerEntry(BaseModel):
+    __tablename__ = "paper_ingestion_ledger"
+
+    id: Mapped[int] = mapped_column(
+        Integer,
+        Sequence("paper_ingestion_ledger_id_seq"),
+        primary_key=True,
+        comment="Unique identifier for the ledger entry",
+    )
+    datasource_id: Mapped[UUID] = mapped_column(
+        ForeignKey("datasources.id"),
+        nullable=False,
+        comment="ID of the data source (e.g., arXiv, PubMed)",
+    )
+    subject_id: Mapped[UUID] = mapped_column(
+        ForeignKey("subjects.id"),
+        nullable=False,
+        comment="ID of the harvested subject",
+    )
+    from_date: Mapped[date] = mapped_column(
+        Date, nullable=False, comment="First day of the window"
+    )
+    until_date: Mapped[date] = mapped_column(
+        Date, nullable=False, comment="Last day of the window, inclusive"
+    )
+    status: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+        comment="Status of the window: running, succeeded or failed",
+    )
+    pages: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default="0",
+        comment="Number of pages requested from the datasource",
+    )
+    fetched: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default="0",
+        comment="Number of paper records fetched",
+    )
+    inserted: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default="0",
+        comment="Number of papers created or updated",
+    )
+    skipped: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default="0",
+        comment="Number of papers already up to date",
+    )
+    failed: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default="0",
+        comment="Number of paper records that could not be ingested",
+    )
+    duration_seconds: Mapped[Optional[float]] = mapped_column(
+        Float, nullable=True, comment="Wall time of the window, NULL while running"
+    )
+    error: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True, comment="Error the window failed with, if any"
+    )
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        comment="Timestamp of when the window started",
+    )
+    finished_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="Timestamp of when the window finished, NULL while running",
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_paper_ingestion_ledger_succeeded",
+            "subject_id",
+            "until_date",
+            postgresql_where=text("status = 'succeeded'"),
+        ),
+        Index("ix_paper_ingestion_ledger_started_at", "started_at"),
+        {"comment": "Outcome of each paper ingestion window"},
+    )
@@ -0,0 +1,43 @@
+from datetime import date
+
+from sqlalchemy import UUID, Date, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseModel
+
+
+class PaperStatistics(BaseModel):
+    __tablename__ = "paper_statistics"
+    __table_args__ = {
+        "comment": "Daily paper counts per datasource and subject, kept by ingestion"
+    }
+
+    datasource_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("datasources.id"),
+        primary_key=True,
+        comment="ID of the data source (e.g., arXiv, PubMed)",
+    )
+    subject_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("subjects.id"),
+        primary_key=True,
+        comment="ID of the subject",
+    )
+    day: Mapped[date] = mapped_column(
+        Date,
+        primary_key=True,
+        comment="Publish date of the counted papers",
+    )
+    paper_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Number of papers with the subject",
+    )
+    primary_paper_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Number of papers with the subject as primary subject",
+    )
@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseModel
+
+
+class RateLimitBucket(BaseModel):
+    __tablename__ = "rate_limit_buckets"
+    # The buckets only hold transient state, so they skip the WAL.
+    __table_args__ = {
+        "comment": "Token buckets shared by the workers calling a datasource",
+        "prefixes": ["UNLOGGED"],
+    }
+
+    name: Mapped[str] = mapped_column(
+        String, primary_key=True, comment="Name of the bucket, e.g. the API host"
+    )
+    rate: Mapped[float] = mapped_column(
+        Float, nullable=False, comment="Tokens added per second"
+    )
+    burst: Mapped[float] = mapped_column(
+        Float, nullable=False, comment="Maximum number of tokens"
+    )
+    tokens: Mapped[float] = mapped_column(
+        Float,
+        nullable=False,
+        comment="Tokens left at updated_at, negative when requests are queued",
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="Timestamp of the last token taken",
+    )
@@ -12,11 +12,13 @@ paper_authors = Table(
         primary_key=True,
         comment="Reference to Author ID",
     ),
+    # No foreign key: the partitioned papers table is keyed by
+    # (id, publish_date).
     Column(
         "paper_id",
         UUID(as_uuid=True),
-        ForeignKey("papers.id"),
         primary_key=True,
+        index=True,
         comment="Reference to Paper ID",
     ),
     comment=(
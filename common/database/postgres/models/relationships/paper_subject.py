@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import UUID, Boolean, ForeignKey
+from sqlalchemy import UUID, Boolean, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..base import BaseModel
@@ -12,6 +12,9 @@ if TYPE_CHECKING:
 
 class PaperSubject(BaseModel):
     __tablename__ = "paper_subjects"
+    __table_args__ = (
+        Index("ix_paper_subjects_subject_id_paper_id", "subject_id", "paper_id"),
+    )
 
     is_primary: Mapped[bool] = mapped_column(
         Boolean,
@@ -19,11 +22,15 @@ class PaperSubject(BaseModel):
         default=False,
         comment="Primary subject flag",
     )
-    paper: Mapped["Paper"] = relationship(back_populates="paper_subjects")
+    paper: Mapped["Paper"] = relationship(
+        primaryjoin="foreign(PaperSubject.paper_id) == Paper.id",
+        back_populates="paper_subjects",
+    )
 
+    # No foreign key: the partitioned papers table is keyed by
+    # (id, publish_date).
     paper_id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
-        ForeignKey("papers.id"),
         primary_key=True,
         comment="Reference to Paper ID",
     )
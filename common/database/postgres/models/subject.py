@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING, List
 from uuid import uuid4
 
-from sqlalchemy import UUID, ForeignKey, Text
+from sqlalchemy import UUID, ForeignKey, Index, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import BaseModel
@@ -13,6 +13,7 @@ if TYPE_CHECKING:
 
 class Subject(BaseModel):
     __tablename__ = "subjects"
+    __table_args__ = (Index("ix_subjects_code_domain_id", "code", "domain_id"),)
 
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -34,6 +35,7 @@ class Subject(BaseModel):
         UUID(as_uuid=True),
         ForeignKey("domains.id"),
         nullable=False,
+        index=True,
         comment="ID of the high-level academic domain (e.g. Physics)",
     )
 
@@ -44,5 +46,4 @@ class Subject(BaseModel):
     )
     paper_subjects: Mapped[List["PaperSubject"]] = relationship(
         back_populates="subject",
-        lazy="selectin",
     )
@@ -0,0 +1,27 @@
+from datetime import date
+
+from sqlalchemy import UUID, Date, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseModel
+
+
+class SubjectIngestionWatermark(BaseModel):
+    __tablename__ = "subject_ingestion_watermarks"
+    __table_args__ = {"comment": "Harvest progress of the paper ingestion per subject"}
+
+    subject_id: Mapped[UUID] = mapped_column(
+        ForeignKey("subjects.id"),
+        primary_key=True,
+        comment="ID of the subject",
+    )
+    datasource_id: Mapped[UUID] = mapped_column(
+        ForeignKey("datasources.id"),
+        nullable=False,
+        comment="ID of the data source (e.g., arXiv, PubMed)",
+    )
+    harvested_until: Mapped[date] = mapped_column(
+        Date,
+        nullable=False,
+        comment="Last day up to which all papers of the subject are harvested",
+    )
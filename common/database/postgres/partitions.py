@@ -0,0 +1,82 @@
+from datetime import date
+from typing import List, Tuple
+
+PAPERS_DEFAULT_PARTITION = "papers_default"
+PAPER_PARTITION_MONTHS_AHEAD = 3
+
+
+def month_start(day: date) -> date:
+    """Returns the first day of the month of the given date."""
+    return day.replace(day=1)
+
+
+def next_month_start(day: date) -> date:
+    """Returns the first day of the month after the given date."""
+    if day.month == 12:
+        return date(day.year + 1, 1, 1)
+    return date(day.year, day.month + 1, 1)
+
+
+def paper_partition_horizon(
+    day: date, months_ahead: int = PAPER_PARTITION_MONTHS_AHEAD
+) -> date:
+    """Returns the first day of the month a number of months after a date.
+
+    Partitions are created up to this date, so papers never land in the
+    default partition during normal ingestion.
+
+    Examples:
+        >>> paper_partition_horizon(date(2024, 11, 15))
+        datetime.date(2025, 2, 1)
+    """
+    horizon = month_start(day)
+    for _ in range(months_ahead):
+        horizon = next_month_start(horizon)
+    return horizon
+
+
+def paper_partition_name(day: date) -> str:
+    """Returns the name of the papers partition holding the given date.
+
+    Examples:
+        >>> paper_partition_name(date(2024, 3, 15))
+        'papers_2024_03'
+    """
+    return f"papers_{day:%Y_%m}"
+
+
+def paper_partition_ranges(start: date, end: date) -> List[Tuple[str, date, date]]:
+    """Returns the monthly papers partitions covering a date range.
+
+    Args:
+        start (date): The first date to cover.
+        end (date): The last date to cover.
+
+    Returns:
+        List[Tuple[str, date, date]]: A list of (partition name, first day,
+            first day of the next month), one per month.
+    """
+    ranges = []
+    current = month_start(start)
+    while current <= end:
+        upper = next_month_start(current)
+        ranges.append((paper_partition_name(current), current, upper))
+        current = upper
+    return ranges
+
+
+def create_paper_partition_sql(name: str, lower: date, upper: date) -> str:
+    """Returns the DDL creating a papers partition if it does not exist.
+
+    Args:
+        name (str): The partition name.
+        lower (date): The first day held by the partition.
+        upper (date): The first day after the partition.
+
+    Returns:
+        str: The CREATE TABLE statement.
+    """
+    return (
+        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF papers "
+        f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+    )
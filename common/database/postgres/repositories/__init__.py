@@ -1,17 +1,34 @@
 from .author_repository import AuthorRespotitory
 from .datasource_repository import DatasourceRepository
 from .domain_repository import DomainRepository
+from .ingestion_work_queue_repository import IngestionWorkQueueRepository
+from .paper_backfill_window_repository import PaperBackfillWindowRepository
+from .paper_fingerprint_repository import PaperFingerprintRepository
+from .paper_ingestion_ledger_repository import PaperIngestionLedgerRepository
 from .paper_ingestion_state_repository import PaperIngestionStateRepository
-from .paper_repository import PaperRepository
+from .paper_repository import PaperRepository, PaperSearchFilters
+from .paper_statistics_repository import PaperStatisticsRepository
 from .paper_subject_repository import PaperSubjectRepository
+from .rate_limit_bucket_repository import RateLimitBucketRepository
+from .subject_ingestion_watermark_repository import (
+    SubjectIngestionWatermarkRepository,
+)
 from .subject_repository import SubjectRepository
 
 __all__ = [
     "AuthorRespotitory",
     "DatasourceRepository",
     "DomainRepository",
+    "IngestionWorkQueueRepository",
+    "PaperBackfillWindowRepository",
+    "PaperFingerprintRepository",
+    "PaperIngestionLedgerRepository",
     "PaperRepository",
+    "PaperSearchFilters",
+    "PaperStatisticsRepository",
     "PaperSubjectRepository",
+    "RateLimitBucketRepository",
+    "SubjectIngestionWatermarkRepository",
     "SubjectRepository",
     "PaperIngestionStateRepository",
 ]
@@ -22,7 +39,14 @@ class DatabaseRepository:
         self.author = AuthorRespotitory()
         self.datasource = DatasourceRepository()
         self.domain = DomainRepository()
+        self.ingestion_work_queue = IngestionWorkQueueRepository()
         self.paper = PaperRepository()
+        self.paper_backfill_window = PaperBackfillWindowRepository()
+        self.paper_fingerprint = PaperFingerprintRepository()
+        self.paper_ingestion_ledger = PaperIngestionLedgerRepository()
+        self.paper_statistics = PaperStatisticsRepository()
         self.paper_subject = PaperSubjectRepository()
+        self.rate_limit_bucket = RateLimitBucketRepository()
         self.subject = SubjectRepository()
+        self.subject_watermark = SubjectIngestionWatermarkRepository()
         self.paper_ingestion_state = PaperIngestionStateRepository()
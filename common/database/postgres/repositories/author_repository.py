@@ -1,13 +1,20 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
+from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, bindparam, func, literal, or_, select
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from common.database.postgres.models import Author
+from common.database.postgres.models import Author, paper_authors
+from common.utils.author_name import author_name_hash, canonicalize_author_name
 
 from .base_repository import BaseRepository
 
+# Hot lookups are built once; SQLAlchemy caches their compiled form.
+_SELECT_BY_NAME_HASH = select(Author).where(
+    Author.canonical_name_hash == bindparam("name_hash")
+)
+
 
 class AuthorRespotitory(BaseRepository[Author]):
     """Repository for Author."""
@@ -20,23 +27,95 @@ class AuthorRespotitory(BaseRepository[Author]):
         super().__init__(Author)
 
     async def create(self, model: Author, session: AsyncSession) -> Author:
-        """Creates a model."""
+        """Creates a model.
+
+        Authors are matched on the hash of their canonical name, so an
+        existing author with an equivalent name is returned instead.
+        """
+        canonical_name = canonicalize_author_name(model.name)
+        canonical_name_hash = author_name_hash(canonical_name)
         stmt = (
             insert(Author)
-            .values(name=model.name)
-            .on_conflict_do_nothing(index_elements=["name"])
+            .values(
+                name=model.name,
+                canonical_name=canonical_name,
+                canonical_name_hash=canonical_name_hash,
+            )
+            .on_conflict_do_nothing(index_elements=["canonical_name_hash"])
             .returning(Author)
         )
         result = await session.execute(stmt)
         row = result.scalar_one_or_none()
         if row is None:
             result = await session.execute(
-                select(Author).where(Author.name == model.name)
+                select(Author).where(Author.canonical_name_hash == canonical_name_hash)
             )
             row = result.scalar_one()
 
         return row
 
+    async def get_or_create_ids(
+        self, names: Dict[str, str], session: AsyncSession
+    ) -> Dict[str, UUID]:
+        """Returns the author UUIDs for the given names, creating missing authors.
+
+        All authors are upserted with a single statement. Rows are inserted in
+        hash order so concurrent writers lock them in the same order.
+
+        Args:
+            names: Mapping of canonical author name to the raw author name.
+            session: The database session.
+
+        Returns:
+            Dict[str, UUID]: Mapping of canonical author name to author UUID.
+        """
+        if not names:
+            return {}
+
+        hashes = {
+            canonical_name: author_name_hash(canonical_name) for canonical_name in names
+        }
+        values = sorted(
+            (
+                {
+                    "name": name,
+                    "canonical_name": canonical_name,
+                    "canonical_name_hash": hashes[canonical_name],
+                }
+                for canonical_name, name in names.items()
+            ),
+            key=lambda value: value["canonical_name_hash"],
+        )
+        stmt = (
+            insert(Author)
+            .values(values)
+            .on_conflict_do_nothing(index_elements=["canonical_name_hash"])
+            .returning(Author.canonical_name_hash, Author.id)
+        )
+        rows = await session.execute(stmt)
+        hash_to_id = {name_hash: author_id for name_hash, author_id in rows.all()}
+
+        missing = [
+            name_hash
+            for name_hash in set(hashes.values())
+            if name_hash not in hash_to_id
+        ]
+        if missing:
+            rows = await session.execute(
+                select(Author.canonical_name_hash, Author.id).where(
+                    Author.canonical_name_hash.in_(missing)
+                )
+            )
+            hash_to_id.update(
+                {name_hash: author_id for name_hash, author_id in rows.all()}
+            )
+
+        return {
+            canonical_name: hash_to_id[name_hash]
+            for canonical_name, name_hash in hashes.items()
+            if name_hash in hash_to_id
+        }
+
     async def get_by_name(self, name: str, session: AsyncSession) -> Optional[Author]:
         """Returns the Author with the given name.
 
@@ -47,8 +126,8 @@ class AuthorRespotitory(BaseRepository[Author]):
         Returns:
             Optional[Author]: The Author with the given name, or None if not found.
         """
-        query = select(Author).where(Author.name == name)
-        rows = await session.execute(query)
+        name_hash = author_name_hash(canonicalize_author_name(name))
+        rows = await session.execute(_SELECT_BY_NAME_HASH, {"name_hash": name_hash})
         return rows.scalar_one_or_none()
 
     async def get_by_names(
@@ -63,6 +142,56 @@ class AuthorRespotitory(BaseRepository[Author]):
         Returns:
             List[Author]: The Authors with the given names.
         """
-        query = select(Author).where(Author.name.in_(names))
+        name_hashes = [author_name_hash(canonicalize_author_name(n)) for n in names]
+        query = select(Author).where(Author.canonical_name_hash.in_(name_hashes))
         rows = await session.execute(query)
         return rows.scalars().all()
+
+    async def search_authors(
+        self, query: str, session: AsyncSession, limit: int = 10
+    ) -> List[Row]:
+        """Returns the authors whose names match a prefix or a fuzzy query.
+
+        The query is canonicalized like stored names, so case, accents and
+        "Last, First" order do not matter. Names starting with the query come
+        first, then names ranked by trigram word similarity; both conditions
+        are served by the trigram index on the canonical names.
+
+        Args:
+            query (str): The partial or misspelled author name.
+            session (AsyncSession): The database session.
+            limit (int): The maximum number of authors to return.
+
+        Returns:
+            List[Row]: Rows of (Author, paper_count, similarity), best match
+                first.
+        """
+        canonical_query = canonicalize_author_name(query)
+        if not canonical_query:
+            return []
+
+        is_prefix = Author.canonical_name.startswith(canonical_query, autoescape=True)
+        similarity = func.word_similarity(canonical_query, Author.canonical_name)
+        paper_count = (
+            select(func.count())
+            .select_from(paper_authors)
+            .where(paper_authors.c.author_id == Author.id)
+            .scalar_subquery()
+        )
+        stmt = (
+            select(
+                Author,
+                paper_count.label("paper_count"),
+                similarity.label("similarity"),
+            )
+            .where(
+                or_(
+                    is_prefix,
+                    literal(canonical_query).op("<%")(Author.canonical_name),
+                )
+            )
+            .order_by(is_prefix.desc(), similarity.desc(), Author.canonical_name)
+            .limit(limit)
+        )
+        rows = await session.execute(stmt)
+        return rows.all()
@@ -1,10 +1,14 @@
-from typing import Generic, Type, TypeVar
+from typing import AsyncIterator, Generic, Type, TypeVar
 
+from sqlalchemy import Select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeMeta
 
 ModelType = TypeVar("ModelType", bound=DeclarativeMeta)
 
+# Number of rows fetched per round trip by streaming reads.
+DEFAULT_YIELD_PER = 1000
+
 
 class BaseRepository(Generic[ModelType]):
     """Base repository with common CRUD operations.
@@ -23,3 +27,29 @@ class BaseRepository(Generic[ModelType]):
     async def delete(self, model: ModelType, session: AsyncSession):
         """Deletes a model."""
         await session.delete(model)
+
+    async def stream(
+        self,
+        query: Select,
+        session: AsyncSession,
+        yield_per: int = DEFAULT_YIELD_PER,
+    ) -> AsyncIterator[ModelType]:
+        """Streams the models of a query through a server-side cursor.
+
+        Only `yield_per` rows are held in memory at a time. The cursor lives
+        in the session's transaction, so the session must not be used for
+        other statements until the stream is exhausted or closed.
+
+        Args:
+            query (Select): The query selecting models.
+            session (AsyncSession): The database session.
+            yield_per (int): The number of rows fetched per round trip.
+
+        Yields:
+            ModelType: The models returned by the query.
+        """
+        result = await session.stream_scalars(
+            query.execution_options(yield_per=yield_per)
+        )
+        async for model in result:
+            yield model
@@ -1,7 +1,7 @@
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -10,6 +10,14 @@ from common.database.postgres.models import Datasource
 
 from .base_repository import BaseRepository
 
+# Hot lookups are built once; SQLAlchemy caches their compiled form.
+_SELECT_UUID_BY_NAME = select(Datasource.id).where(
+    Datasource.name == bindparam("datasource_name")
+)
+_SELECT_BY_UUID = select(Datasource).where(
+    Datasource.id == bindparam("datasource_uuid")
+)
+
 
 class DatasourceRepository(BaseRepository[Datasource]):
     """Repository for Datasource."""
@@ -46,8 +54,9 @@ class DatasourceRepository(BaseRepository[Datasource]):
         Returns:
             UUID: The UUID of the datasource.
         """
-        query = select(Datasource.id).where(Datasource.name == datasource_name)
-        rows = await session.execute(query)
+        rows = await session.execute(
+            _SELECT_UUID_BY_NAME, {"datasource_name": datasource_name}
+        )
         return rows.scalar_one_or_none()
 
     async def get_by_uuid(self, datasource_uuid: UUID, session: AsyncSession):
@@ -60,6 +69,7 @@ class DatasourceRepository(BaseRepository[Datasource]):
         Returns:
             Datasource: The Datasource with the given UUID, or None if not found.
         """
-        query = select(Datasource).where(Datasource.id == datasource_uuid)
-        rows = await session.execute(query)
+        rows = await session.execute(
+            _SELECT_BY_UUID, {"datasource_uuid": datasource_uuid}
+        )
         return rows.scalar_one_or_none()
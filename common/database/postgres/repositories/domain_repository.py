@@ -1,12 +1,18 @@
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
-from sqlalchemy import UUID, select
+from sqlalchemy import UUID, bindparam, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from common.database.postgres.models import Domain
 
-from .base_repository import BaseRepository
+from .base_repository import DEFAULT_YIELD_PER, BaseRepository
+
+# Hot lookups are built once; SQLAlchemy caches their compiled form.
+_SELECT_BY_CODE = select(Domain).where(
+    Domain.code == bindparam("code"),
+    Domain.datasource_id == bindparam("datasource_uuid"),
+)
 
 
 class DomainRepository(BaseRepository[Domain]):
@@ -36,8 +42,9 @@ class DomainRepository(BaseRepository[Domain]):
         self, code: str, datasource_uuid: UUID, session: AsyncSession
     ) -> Optional[Domain]:
         """Returns a domain by code."""
-        query = select(Domain).filter_by(code=code, datasource_id=datasource_uuid)
-        rows = await session.execute(query)
+        rows = await session.execute(
+            _SELECT_BY_CODE, {"code": code, "datasource_uuid": datasource_uuid}
+        )
         return rows.scalar_one_or_none()
 
     async def get_by_codes(
@@ -61,3 +68,13 @@ class DomainRepository(BaseRepository[Domain]):
         query = select(Domain).where(Domain.datasource_id == datasource_uuid)
         rows = await session.execute(query)
         return rows.scalars().all()
+
+    def stream_by_datasource_uuid(
+        self,
+        datasource_uuid: UUID,
+        session: AsyncSession,
+        yield_per: int = DEFAULT_YIELD_PER,
+    ) -> AsyncIterator[Domain]:
+        """Streams the domains of a datasource through a server-side cursor."""
+        query = select(Domain).where(Domain.datasource_id == datasource_uuid)
+        return self.stream(query, session, yield_per)
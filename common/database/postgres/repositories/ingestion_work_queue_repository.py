@@ -0,0 +1,287 @@
+from datetime import timedelta
+from typing import Any, Dict, List
+
+from sqlalchemy import and_, case, exists, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from common.constants import IngestionStatus
+from common.database.postgres.models import IngestionWorkUnit
+
+from .base_repository import BaseRepository
+
+_OPEN_STATUSES = (IngestionStatus.PENDING.value, IngestionStatus.RUNNING.value)
+
+
+class IngestionWorkQueueRepository(BaseRepository[IngestionWorkUnit]):
+    """Repository for the queue of ingestion windows drained by workers.
+
+    Workers claim units with `FOR UPDATE SKIP LOCKED`, so any number of them
+    drain the queue without blocking each other. A claimed unit is owned by
+    its worker as long as the worker heartbeats it; once the heartbeat is
+    older than `stale_after`, another worker may claim it again.
+    """
+
+    def __init__(self):
+        """Initializes an IngestionWorkQueueRepository object."""
+        super().__init__(IngestionWorkUnit)
+
+    async def enqueue(
+        self, batch_id: str, units: List[Dict[str, Any]], session: AsyncSession
+    ) -> int:
+        """Enqueues ingestion windows, skipping the ones already in the batch.
+
+        Args:
+            batch_id (str): The ID of the batch, e.g. the DAG run ID.
+            units (List[Dict[str, Any]]): The datasource_id, subject_id,
+                from_date, until_date and optional expected_records and
+                priority of each window.
+            session (AsyncSession): The database session.
+
+        Returns:
+            int: The number of units enqueued.
+        """
+        if not units:
+            return 0
+        stmt = (
+            insert(IngestionWorkUnit)
+            .values(
+                [
+                    {
+                        "expected_records": None,
+                        "priority": 0.0,
+                        **unit,
+                        "batch_id": batch_id,
+                    }
+                    for unit in units
+                ]
+            )
+            .on_conflict_do_nothing(constraint="uq_ingestion_work_units_batch_window")
+            .returning(IngestionWorkUnit.id)
+        )
+        rows = await session.execute(stmt)
+        return len(rows.all())
+
+    async def claim(
+        self,
+        worker_id: str,
+        limit: int,
+        stale_after: timedelta,
+        max_attempts: int,
+        session: AsyncSession,
+    ) -> List[IngestionWorkUnit]:
+        """Claims pending or stale units, highest priority first, then oldest.
+
+        A unit is only claimable once no earlier window of its subject is
+        pending or running, so the windows of a subject run one after the
+        other in date order and its watermark advances window by window.
+
+        Args:
+            worker_id (str): The ID of the claiming worker.
+            limit (int): The maximum number of units to claim.
+            stale_after (timedelta): The age of the heartbeat after which a
+                running unit is considered abandoned.
+            max_attempts (int): The number of claims after which a unit is no
+                longer claimed.
+            session (AsyncSession): The database session.
+
+        Returns:
+            List[IngestionWorkUnit]: The claimed units.
+        """
+        unit = IngestionWorkUnit
+        earlier = aliased(IngestionWorkUnit, name="earlier")
+        claimable = (
+            select(unit.id)
+            .where(
+                or_(
+                    unit.status == IngestionStatus.PENDING.value,
+                    and_(
+                        unit.status == IngestionStatus.RUNNING.value,
+                        unit.heartbeat_at < func.now() - stale_after,
+                    ),
+                ),
+                unit.attempts < max_attempts,
+                ~exists().where(
+                    earlier.subject_id == unit.subject_id,
+                    earlier.status.in_(_OPEN_STATUSES),
+                    earlier.from_date < unit.from_date,
+                ),
+            )
+            .order_by(unit.priority.desc(), unit.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(unit)
+            .where(unit.id.in_(claimable.scalar_subquery()))
+            .values(
+                status=IngestionStatus.RUNNING.value,
+                claimed_by=worker_id,
+                heartbeat_at=func.now(),
+                attempts=unit.attempts + 1,
+            )
+            .returning(unit)
+            .execution_options(synchronize_session=False)
+        )
+        rows = await session.execute(stmt)
+        return rows.scalars().all()
+
+    async def heartbeat(
+        self, unit_ids: List[int], worker_id: str, session: AsyncSession
+    ) -> List[int]:
+        """Extends the claims of a worker.
+
+        Args:
+            unit_ids (List[int]): The IDs of the units the worker is running.
+            worker_id (str): The ID of the worker.
+            session (AsyncSession): The database session.
+
+        Returns:
+            List[int]: The IDs of the units still claimed by the worker.
+        """
+        if not unit_ids:
+            return []
+        stmt = (
+            update(IngestionWorkUnit)
+            .where(
+                IngestionWorkUnit.id.in_(unit_ids),
+                IngestionWorkUnit.claimed_by == worker_id,
+                IngestionWorkUnit.status == IngestionStatus.RUNNING.value,
+            )
+            .values(heartbeat_at=func.now())
+            .returning(IngestionWorkUnit.id)
+            .execution_options(synchronize_session=False)
+        )
+        rows = await session.execute(stmt)
+        return rows.scalars().all()
+
+    async def complete(
+        self, unit_id: int, worker_id: str, paper_count: int, session: AsyncSession
+    ) -> bool:
+        """Marks a claimed unit as succeeded.
+
+        Args:
+            unit_id (int): The ID of the unit.
+            worker_id (str): The ID of the worker that ran it.
+            paper_count (int): The number of papers fetched.
+            session (AsyncSession): The database session.
+
+        Returns:
+            bool: Whether the unit was still claimed by the worker.
+        """
+        stmt = (
+            update(IngestionWorkUnit)
+            .where(
+                IngestionWorkUnit.id == unit_id,
+                IngestionWorkUnit.claimed_by == worker_id,
+                IngestionWorkUnit.status == IngestionStatus.RUNNING.value,
+            )
+            .values(
+                status=IngestionStatus.SUCCEEDED.value,
+                paper_count=paper_count,
+                error=None,
+                finished_at=func.now(),
+            )
+            .returning(IngestionWorkUnit.id)
+            .execution_options(synchronize_session=False)
+        )
+        rows = await session.execute(stmt)
+        return rows.first() is not None
+
+    async def fail(
+        self,
+        unit_id: int,
+        worker_id: str,
+        error: str,
+        max_attempts: int,
+        session: AsyncSession,
+    ) -> bool:
+        """Releases a claimed unit after a failed attempt.
+
+        The unit goes back to pending, or fails for good once it was claimed
+        max_attempts times.
+
+        Args:
+            unit_id (int): The ID of the unit.
+            worker_id (str): The ID of the worker that ran it.
+            error (str): The error of the attempt.
+            max_attempts (int): The number of attempts of a unit.
+            session (AsyncSession): The database session.
+
+        Returns:
+            bool: Whether the unit was still claimed by the worker.
+        """
+        exhausted = IngestionWorkUnit.attempts >= max_attempts
+        stmt = (
+            update(IngestionWorkUnit)
+            .where(
+                IngestionWorkUnit.id == unit_id,
+                IngestionWorkUnit.claimed_by == worker_id,
+                IngestionWorkUnit.status == IngestionStatus.RUNNING.value,
+            )
+            .values(
+                status=case(
+                    (exhausted, IngestionStatus.FAILED.value),
+                    else_=IngestionStatus.PENDING.value,
+                ),
+                error=error,
+                finished_at=case((exhausted, func.now()), else_=None),
+            )
+            .returning(IngestionWorkUnit.id)
+            .execution_options(synchronize_session=False)
+        )
+        rows = await session.execute(stmt)
+        return rows.first() is not None
+
+    async def expire_stale(
+        self, stale_after: timedelta, max_attempts: int, session: AsyncSession
+    ) -> int:
+        """Fails the abandoned units that cannot be claimed again.
+
+        Args:
+            stale_after (timedelta): The age of the heartbeat after which a
+                running unit is considered abandoned.
+            max_attempts (int): The number of attempts of a unit.
+            session (AsyncSession): The database session.
+
+        Returns:
+            int: The number of units failed.
+        """
+        stmt = (
+            update(IngestionWorkUnit)
+            .where(
+                IngestionWorkUnit.status == IngestionStatus.RUNNING.value,
+                IngestionWorkUnit.heartbeat_at < func.now() - stale_after,
+                IngestionWorkUnit.attempts >= max_attempts,
+            )
+            .values(
+                status=IngestionStatus.FAILED.value,
+                error="Worker stopped heartbeating",
+                finished_at=func.now(),
+            )
+            .returning(IngestionWorkUnit.id)
+            .execution_options(synchronize_session=False)
+        )
+        rows = await session.execute(stmt)
+        return len(rows.all())
+
+    async def get_batch_status(
+        self, batch_id: str, session: AsyncSession
+    ) -> Dict[str, int]:
+        """Returns the number of units of a batch per status.
+
+        Args:
+            batch_id (str): The ID of the batch.
+            session (AsyncSession): The database session.
+
+        Returns:
+            Dict[str, int]: Mapping of status to number of units.
+        """
+        query = (
+            select(IngestionWorkUnit.status, func.count())
+            .where(IngestionWorkUnit.batch_id == batch_id)
+            .group_by(IngestionWorkUnit.status)
+        )
+        rows = await session.execute(query)
+        return dict(rows.all())
@@ -0,0 +1,115 @@
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import exists, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.database.postgres.models import PaperBackfillWindow
+
+from .base_repository import BaseRepository
+
+
+class PaperBackfillWindowRepository(BaseRepository[PaperBackfillWindow]):
+    """Repository for the historical harvesting windows of the backfill."""
+
+    def __init__(self):
+        """Initializes a PaperBackfillWindowRepository object."""
+        super().__init__(PaperBackfillWindow)
+
+    async def create_windows(
+        self, windows: List[Dict[str, Any]], session: AsyncSession
+    ) -> int:
+        """Inserts backfill windows, skipping the ones already planned.
+
+        Args:
+            windows (List[Dict[str, Any]]): The column values of the windows.
+            session (AsyncSession): The database session.
+
+        Returns:
+            int: The number of windows inserted.
+        """
+        if not windows:
+            return 0
+        stmt = (
+            insert(PaperBackfillWindow)
+            .values(windows)
+            .on_conflict_do_nothing(
+                constraint="uq_paper_backfill_windows_subject_range"
+            )
+            .returning(PaperBackfillWindow.id)
+        )
+        rows = await session.execute(stmt)
+        return len(rows.all())
+
+    async def get_pending(
+        self,
+        session: AsyncSession,
+        domain_id: Optional[UUID] = None,
+        limit: Optional[int] = None,
+    ) -> List[PaperBackfillWindow]:
+        """Returns the windows not harvested yet, oldest first.
+
+        Args:
+            session (AsyncSession): The database session.
+            domain_id (Optional[UUID]): Only return the windows of this domain.
+            limit (Optional[int]): The maximum number of windows to return.
+
+        Returns:
+            List[PaperBackfillWindow]: The pending windows.
+        """
+        query = (
+            select(PaperBackfillWindow)
+            .where(PaperBackfillWindow.completed_at.is_(None))
+            .order_by(PaperBackfillWindow.from_date, PaperBackfillWindow.id)
+            .limit(limit)
+        )
+        if domain_id is not None:
+            query = query.where(PaperBackfillWindow.domain_id == domain_id)
+        rows = await session.execute(query)
+        return rows.scalars().all()
+
+    async def complete(self, window_id: int, paper_count: int, session: AsyncSession):
+        """Marks a window as harvested.
+
+        Args:
+            window_id (int): The ID of the window.
+            paper_count (int): The number of papers harvested in the window.
+            session (AsyncSession): The database session.
+        """
+        query = (
+            update(PaperBackfillWindow)
+            .values(paper_count=paper_count, completed_at=func.now())
+            .where(PaperBackfillWindow.id == window_id)
+            .execution_options(synchronize_session=False)
+        )
+        await session.execute(query)
+
+    async def get_completed_range(
+        self, domain_id: UUID, session: AsyncSession
+    ) -> Optional[Tuple[date, date]]:
+        """Returns the days backfilled for a domain, once fully harvested.
+
+        Args:
+            domain_id (UUID): The UUID of the domain.
+            session (AsyncSession): The database session.
+
+        Returns:
+            Optional[Tuple[date, date]]: The first from date and the last
+                until date of the domain windows, or None if the domain has no
+                windows or some are still pending.
+        """
+        pending = exists().where(
+            PaperBackfillWindow.domain_id == domain_id,
+            PaperBackfillWindow.completed_at.is_(None),
+        )
+        query = select(
+            func.min(PaperBackfillWindow.from_date),
+            func.max(PaperBackfillWindow.until_date),
+        ).where(PaperBackfillWindow.domain_id == domain_id, ~pending)
+        rows = await session.execute(query)
+        row = rows.one_or_none()
+        if row is None or row[1] is None:
+            return None
+        return row[0], row[1]
@@ -0,0 +1,130 @@
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.database.postgres.models import PaperFingerprint, PaperLshBucket
+from common.utils.minhash import (
+    DUPLICATE_THRESHOLD,
+    estimate_similarity,
+    lsh_buckets,
+    signature_from_bytes,
+    signature_to_bytes,
+)
+
+from .base_repository import BaseRepository
+
+
+class PaperFingerprintRepository(BaseRepository[PaperFingerprint]):
+    """Repository for the MinHash near-duplicate index."""
+
+    def __init__(self):
+        """Initializes a PaperFingerprintRepository object."""
+        super().__init__(PaperFingerprint)
+
+    async def index_paper(
+        self, paper_id: UUID, signature: List[int], session: AsyncSession
+    ) -> Optional[Tuple[UUID, float]]:
+        """Stores the signature of a paper and links it to a near duplicate.
+
+        Candidates are the papers sharing at least one LSH band bucket, found
+        with one indexed lookup per band. The most similar candidate at or
+        above DUPLICATE_THRESHOLD becomes the duplicate link, pointing at its
+        own canonical paper if it is itself a duplicate. A previous fingerprint
+        of the paper is replaced.
+
+        Args:
+            paper_id (UUID): The UUID of the paper.
+            signature (List[int]): The MinHash signature of the paper.
+            session (AsyncSession): The database session.
+
+        Returns:
+            Optional[Tuple[UUID, float]]: The (canonical paper UUID, estimated
+                similarity) if the paper is a near duplicate, or None.
+        """
+        await session.execute(
+            delete(PaperLshBucket).where(PaperLshBucket.paper_id == paper_id)
+        )
+        await session.execute(
+            delete(PaperFingerprint).where(PaperFingerprint.paper_id == paper_id)
+        )
+
+        buckets = lsh_buckets(signature)
+        duplicate_of_id, best_similarity = None, None
+        for candidate in await self.get_candidates(buckets, paper_id, session):
+            similarity = estimate_similarity(
+                signature, signature_from_bytes(candidate.signature)
+            )
+            if similarity >= DUPLICATE_THRESHOLD and (
+                best_similarity is None or similarity > best_similarity
+            ):
+                duplicate_of_id = candidate.duplicate_of_id or candidate.paper_id
+                best_similarity = similarity
+
+        await session.execute(
+            insert(PaperFingerprint).values(
+                paper_id=paper_id,
+                signature=signature_to_bytes(signature),
+                duplicate_of_id=duplicate_of_id,
+                similarity=best_similarity,
+            )
+        )
+        await session.execute(
+            insert(PaperLshBucket)
+            .values(
+                [
+                    {"band": band, "bucket": bucket, "paper_id": paper_id}
+                    for band, bucket in buckets
+                ]
+            )
+            .on_conflict_do_nothing()
+        )
+        if duplicate_of_id is None:
+            return None
+        return duplicate_of_id, best_similarity
+
+    async def get_candidates(
+        self,
+        buckets: List[Tuple[int, int]],
+        paper_id: UUID,
+        session: AsyncSession,
+    ) -> List[PaperFingerprint]:
+        """Returns the fingerprints of the papers sharing a band bucket.
+
+        Args:
+            buckets (List[Tuple[int, int]]): The (band, bucket) pairs to look up.
+            paper_id (UUID): The UUID of the paper itself, excluded.
+            session (AsyncSession): The database session.
+
+        Returns:
+            List[PaperFingerprint]: The candidate fingerprints.
+        """
+        candidate_ids = select(PaperLshBucket.paper_id).where(
+            tuple_(PaperLshBucket.band, PaperLshBucket.bucket).in_(buckets)
+        )
+        query = select(PaperFingerprint).where(
+            PaperFingerprint.paper_id.in_(candidate_ids),
+            PaperFingerprint.paper_id != paper_id,
+        )
+        rows = await session.execute(query)
+        return rows.scalars().all()
+
+    async def get_duplicate_ids(
+        self, paper_id: UUID, session: AsyncSession
+    ) -> List[UUID]:
+        """Returns the UUIDs of the near duplicates of a canonical paper.
+
+        Args:
+            paper_id (UUID): The UUID of the canonical paper.
+            session (AsyncSession): The database session.
+
+        Returns:
+            List[UUID]: The UUIDs of the papers linked to it.
+        """
+        query = select(PaperFingerprint.paper_id).where(
+            PaperFingerprint.duplicate_of_id == paper_id
+        )
+        rows = await session.execute(query)
+        return rows.scalars().all()
@@ -0,0 +1,171 @@
+from datetime import date, datetime
+from typing import Iterable, List, Mapping, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import Date, Row, column, exists, func, insert, select, update, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.constants import IngestionStatus
+from common.database.postgres.models import Datasource, PaperIngestionLedgerEntry
+
+from .base_repository import BaseRepository
+
+LEDGER_COUNTERS = ("pages", "fetched", "inserted", "skipped", "failed")
+
+
+class PaperIngestionLedgerRepository(BaseRepository[PaperIngestionLedgerEntry]):
+    """Repository for the ledger of paper ingestion windows."""
+
+    def __init__(self):
+        """Initializes a PaperIngestionLedgerRepository object."""
+        super().__init__(PaperIngestionLedgerEntry)
+
+    async def start(
+        self,
+        datasource_id: UUID,
+        subject_id: UUID,
+        from_date: date,
+        until_date: date,
+        session: AsyncSession,
+    ) -> int:
+        """Records that the ingestion of a window started.
+
+        Args:
+            datasource_id (UUID): The UUID of the datasource.
+            subject_id (UUID): The UUID of the subject.
+            from_date (date): The first day of the window.
+            until_date (date): The last day of the window.
+            session (AsyncSession): The database session.
+
+        Returns:
+            int: The ID of the ledger entry.
+        """
+        stmt = (
+            insert(PaperIngestionLedgerEntry)
+            .values(
+                datasource_id=datasource_id,
+                subject_id=subject_id,
+                from_date=from_date,
+                until_date=until_date,
+                status=IngestionStatus.RUNNING.value,
+            )
+            .returning(PaperIngestionLedgerEntry.id)
+        )
+        rows = await session.execute(stmt)
+        return rows.scalar_one()
+
+    async def finish(
+        self,
+        entry_id: int,
+        status: IngestionStatus,
+        counts: Mapping[str, int],
+        duration_seconds: float,
+        session: AsyncSession,
+        error: Optional[str] = None,
+    ):
+        """Records the outcome of a window.
+
+        Args:
+            entry_id (int): The ID of the ledger entry.
+            status (IngestionStatus): The final status of the window.
+            counts (Mapping[str, int]): The window counters, keyed by the
+                names in LEDGER_COUNTERS. Missing counters are left at 0.
+            duration_seconds (float): The wall time of the window.
+            session (AsyncSession): The database session.
+            error (Optional[str]): The error the window failed with.
+        """
+        query = (
+            update(PaperIngestionLedgerEntry)
+            .values(
+                status=status.value,
+                duration_seconds=duration_seconds,
+                error=error,
+                finished_at=func.now(),
+                **{name: counts[name] for name in LEDGER_COUNTERS if name in counts},
+            )
+            .where(PaperIngestionLedgerEntry.id == entry_id)
+            .execution_options(synchronize_session=False)
+        )
+        await session.execute(query)
+
+    async def get_completed_windows(
+        self, windows: Iterable[Tuple[UUID, date, date]], session: AsyncSession
+    ) -> Set[Tuple[UUID, date, date]]:
+        """Returns the windows covered by a window that succeeded.
+
+        A succeeded window only covers the days before the UTC day it
+        finished on, since papers of that day may still appear and the
+        subject watermark stops at the day before. Otherwise a window ending
+        today would count as completed while its last day is never harvested
+        again, and the watermark could not move past it.
+
+        Args:
+            windows (Iterable[Tuple[UUID, date, date]]): The (subject UUID,
+                from date, until date) windows to look up.
+            session (AsyncSession): The database session.
+
+        Returns:
+            Set[Tuple[UUID, date, date]]: The windows inside the covered
+                range of a succeeded ledger entry of the same subject.
+        """
+        windows = list(windows)
+        if not windows:
+            return set()
+        planned = values(
+            column("subject_id", PG_UUID(as_uuid=True)),
+            column("from_date", Date),
+            column("until_date", Date),
+            name="planned",
+        ).data(windows)
+        finished_on = func.date(
+            func.timezone("UTC", PaperIngestionLedgerEntry.finished_at)
+        )
+        covered = exists().where(
+            PaperIngestionLedgerEntry.subject_id == planned.c.subject_id,
+            PaperIngestionLedgerEntry.status == IngestionStatus.SUCCEEDED.value,
+            PaperIngestionLedgerEntry.until_date >= planned.c.until_date,
+            finished_on > planned.c.until_date,
+            PaperIngestionLedgerEntry.from_date <= planned.c.from_date,
+        )
+        query = select(
+            planned.c.subject_id, planned.c.from_date, planned.c.until_date
+        ).where(covered)
+        rows = await session.execute(query)
+        return {tuple(row) for row in rows.all()}
+
+    async def get_throughput(self, since: datetime, session: AsyncSession) -> List[Row]:
+        """Returns the ingestion totals per datasource of the finished windows.
+
+        Args:
+            since (datetime): Only count the windows started at or after this.
+            session (AsyncSession): The database session.
+
+        Returns:
+            List[Row]: One row per datasource with its name, the number of
+                windows and failed windows, the sum of each counter in
+                LEDGER_COUNTERS, and the total duration in seconds.
+        """
+        ledger = PaperIngestionLedgerEntry
+        query = (
+            select(
+                Datasource.name.label("datasource"),
+                func.count().label("windows"),
+                func.count()
+                .filter(ledger.status == IngestionStatus.FAILED.value)
+                .label("failed_windows"),
+                *(
+                    func.sum(getattr(ledger, name)).label(name)
+                    for name in LEDGER_COUNTERS
+                ),
+                func.sum(ledger.duration_seconds).label("duration_seconds"),
+            )
+            .join(Datasource, Datasource.id == ledger.datasource_id)
+            .where(
+                ledger.started_at >= since,
+                ledger.status != IngestionStatus.RUNNING.value,
+            )
+            .group_by(Datasource.name)
+        )
+        rows = await session.execute(query)
+        return rows.all()
@@ -1,12 +1,25 @@
-from typing import List, Optional
+from datetime import date
+from typing import AsyncIterator, List, Optional
 
-from sqlalchemy import UUID, func, select, update
+from sqlalchemy import UUID, Row, bindparam, func, or_, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from common.database.postgres.models import Paper, PaperIngestionState
+from common.database.postgres.models import (
+    Domain,
+    Paper,
+    PaperIngestionState,
+    Subject,
+    SubjectIngestionWatermark,
+)
 
-from .base_repository import BaseRepository
+from .base_repository import DEFAULT_YIELD_PER, BaseRepository
+
+# Hot lookups are built once; SQLAlchemy caches their compiled form.
+_SELECT_BY_DATASOURCE_DOMAIN = select(PaperIngestionState).where(
+    PaperIngestionState.domain_id == bindparam("domain_id"),
+    PaperIngestionState.datasource_id == bindparam("datasource_id"),
+)
 
 
 class PaperIngestionStateRepository(BaseRepository[PaperIngestionState]):
@@ -36,11 +49,10 @@ class PaperIngestionStateRepository(BaseRepository[PaperIngestionState]):
         self, domain_id: UUID, datasource_id: UUID, session: AsyncSession
     ) -> Optional[PaperIngestionState]:
         """Get the ingestion state for a specific domain."""
-        query = select(PaperIngestionState).where(
-            PaperIngestionState.domain_id == domain_id,
-            PaperIngestionState.datasource_id == datasource_id,
+        rows = await session.execute(
+            _SELECT_BY_DATASOURCE_DOMAIN,
+            {"domain_id": domain_id, "datasource_id": datasource_id},
         )
-        rows = await session.execute(query)
         return rows.scalar_one_or_none()
 
     async def get_by_datasource_uuid(
@@ -59,11 +71,144 @@ class PaperIngestionStateRepository(BaseRepository[PaperIngestionState]):
         rows = await session.execute(query)
         return rows.scalars().all()
 
+    async def get_subject_plan(self, session: AsyncSession) -> List[Row]:
+        """Returns the subjects to ingest with the first day to harvest.
+
+        One join over the active ingestion states, their domains, the domain
+        subjects and their watermarks. A subject resumes the day after its
+        watermark, or from the domain cursor date before its first harvest.
+        Subjects with neither are skipped.
+
+        Args:
+            session (AsyncSession): The database session.
+
+        Returns:
+            List[Row]: Rows of (datasource_id, domain_id, subject_id,
+                from_date, subject_code), ordered by datasource, domain and
+                subject code.
+        """
+        from_date = func.coalesce(
+            SubjectIngestionWatermark.harvested_until + 1,
+            PaperIngestionState.cursor_date,
+        )
+        query = (
+            select(
+                PaperIngestionState.datasource_id,
+                PaperIngestionState.domain_id,
+                Subject.id.label("subject_id"),
+                from_date.label("from_date"),
+                Subject.code.label("subject_code"),
+            )
+            .join(
+                Domain,
+                (Domain.id == PaperIngestionState.domain_id)
+                & (Domain.datasource_id == PaperIngestionState.datasource_id),
+            )
+            .join(Subject, Subject.domain_id == Domain.id)
+            .outerjoin(
+                SubjectIngestionWatermark,
+                SubjectIngestionWatermark.subject_id == Subject.id,
+            )
+            .where(PaperIngestionState.is_active, from_date.is_not(None))
+            .order_by(
+                PaperIngestionState.datasource_id,
+                PaperIngestionState.domain_id,
+                Subject.code,
+            )
+        )
+        rows = await session.execute(query)
+        return rows.all()
+
+    def stream_active(
+        self, session: AsyncSession, yield_per: int = DEFAULT_YIELD_PER
+    ) -> AsyncIterator[PaperIngestionState]:
+        """Streams all active ingestion states through a server-side cursor."""
+        query = select(PaperIngestionState).where(PaperIngestionState.is_active)
+        return self.stream(query, session, yield_per)
+
+    async def advance_cursor_date(
+        self,
+        domain_id: UUID,
+        datasource_id: UUID,
+        cursor_date: date,
+        session: AsyncSession,
+    ):
+        """Moves the cursor date of a domain forward to the given date.
+
+        The cursor never moves backwards, so ranges can advance it in any
+        order. Run it once per harvested range, with the latest publish date
+        of its committed papers.
+
+        Args:
+            domain_id (UUID): The UUID of the domain.
+            datasource_id (UUID): The UUID of the datasource.
+            cursor_date (date): The latest publish date of the ingested papers.
+            session (AsyncSession): The database session.
+        """
+        query = (
+            update(PaperIngestionState)
+            .values(cursor_date=cursor_date)
+            .where(
+                PaperIngestionState.domain_id == domain_id,
+                PaperIngestionState.datasource_id == datasource_id,
+                or_(
+                    PaperIngestionState.cursor_date.is_(None),
+                    PaperIngestionState.cursor_date < cursor_date,
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await session.execute(query)
+
+    async def activate(
+        self,
+        domain_id: UUID,
+        datasource_id: UUID,
+        cursor_date: date,
+        session: AsyncSession,
+    ) -> bool:
+        """Activates daily ingestion of a domain from at least the given date.
+
+        Used to hand a backfilled domain over to daily ingestion; a cursor
+        already past the date is kept.
+
+        Args:
+            domain_id (UUID): The UUID of the domain.
+            datasource_id (UUID): The UUID of the datasource.
+            cursor_date (date): The last day covered by the backfill.
+            session (AsyncSession): The database session.
+
+        Returns:
+            bool: Whether the domain has an ingestion state.
+        """
+        query = (
+            update(PaperIngestionState)
+            .values(
+                is_active=True,
+                cursor_date=func.greatest(
+                    func.coalesce(PaperIngestionState.cursor_date, cursor_date),
+                    cursor_date,
+                ),
+            )
+            .where(
+                PaperIngestionState.domain_id == domain_id,
+                PaperIngestionState.datasource_id == datasource_id,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await session.execute(query)
+        return result.rowcount > 0
+
     async def update_cursor_date_from_papers(
         self,
         session: AsyncSession,
     ):
-        """Update the cursor date for a specific domain."""
+        """Recomputes the cursor dates of all domains from the papers table.
+
+        This scans every paper, so it is only meant to repair cursors, e.g.
+        after papers were loaded outside of the ingestion service. Ingestion
+        keeps the cursors current through `advance_cursor_date`.
+        """
         sub_query = (
             select(
                 Paper.domain_id,
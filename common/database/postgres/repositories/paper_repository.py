@@ -1,14 +1,79 @@
-from typing import List, Optional
-from uuid import UUID
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
 
-from sqlalchemy import func, select
+from pydantic import BaseModel, Field
+from sqlalchemy import (
+    Row,
+    and_,
+    bindparam,
+    delete,
+    exists,
+    func,
+    literal,
+    or_,
+    select,
+    text,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from common.database.postgres.models import Datasource, Paper
+from common.database.postgres.models import (
+    Author,
+    Datasource,
+    Domain,
+    Paper,
+    PaperIdentifier,
+    Subject,
+    paper_authors,
+)
+from common.database.postgres.models.paper import PAPER_SEARCH_CONFIG
 from common.database.postgres.models.relationships import PaperSubject
+from common.database.postgres.partitions import (
+    create_paper_partition_sql,
+    month_start,
+    paper_partition_ranges,
+)
 
-from .base_repository import BaseRepository
+from .base_repository import DEFAULT_YIELD_PER, BaseRepository
+
+# Joins the identifier registry to the partition holding its paper.
+_REGISTRY_JOIN = and_(
+    Paper.id == PaperIdentifier.paper_id,
+    Paper.publish_date == PaperIdentifier.publish_date,
+)
+# Hot lookups are built once; SQLAlchemy caches their compiled form.
+_SELECT_CONTENT_HASH = (
+    select(Paper.id, Paper.content_hash, Paper.publish_date)
+    .select_from(PaperIdentifier)
+    .join(Paper, _REGISTRY_JOIN)
+    .where(PaperIdentifier.paper_identifier == bindparam("paper_id"))
+)
+_SELECT_BY_PAPER_ID = (
+    select(Paper)
+    .select_from(PaperIdentifier)
+    .join(Paper, _REGISTRY_JOIN)
+    .where(PaperIdentifier.paper_identifier == bindparam("paper_id"))
+)
+
+
+class PaperSearchFilters(BaseModel):
+    datasource_id: Optional[UUID] = Field(
+        default=None, description="Only match papers of this datasource"
+    )
+    subject_ids: Optional[List[UUID]] = Field(
+        default=None, description="Only match papers with any of these subjects"
+    )
+    since: Optional[date] = Field(
+        default=None, description="Only match papers published on or after"
+    )
+    until: Optional[date] = Field(
+        default=None, description="Only match papers published on or before"
+    )
 
 
 class PaperRepository(BaseRepository[Paper]):
@@ -28,16 +93,128 @@ class PaperRepository(BaseRepository[Paper]):
             async with session.begin_nested():
                 session.add(model)
                 await session.flush()
+                await session.execute(
+                    insert(PaperIdentifier).values(
+                        paper_identifier=model.paper_identifier,
+                        paper_id=model.id,
+                        publish_date=model.publish_date,
+                    )
+                )
                 return model
         except IntegrityError:
-            query = select(Paper).where(
-                Paper.domain_id == model.domain_id,
-                Paper.datasource_id == model.datasource_id,
-                Paper.paper_identifier == model.paper_identifier,
-                Paper.title == model.title,
+            return await self.get_by_paper_id(model.paper_identifier, session)
+
+    async def ensure_partitions(
+        self, until: date, session: AsyncSession, since: Optional[date] = None
+    ):
+        """Creates the missing monthly papers partitions up to a date.
+
+        Args:
+            until (date): The last date that must have a partition.
+            session (AsyncSession): The database session.
+            since (Optional[date]): The first date that must have a partition.
+                Defaults to today.
+        """
+        since = month_start(since or date.today())
+        for name, lower, upper in paper_partition_ranges(since, until):
+            await session.execute(text(create_paper_partition_sql(name, lower, upper)))
+
+    async def insert_if_absent(
+        self, values: Dict[str, Any], session: AsyncSession
+    ) -> Optional[Paper]:
+        """Inserts a paper unless its paper identifier already exists.
+
+        The identifier is claimed in the `PaperIdentifier` registry first,
+        since the partitioned papers table cannot enforce its uniqueness.
+
+        Args:
+            values (Dict[str, Any]): The column values of the paper.
+            session (AsyncSession): The database session.
+
+        Returns:
+            Optional[Paper]: The inserted paper, or None if it already exists.
+        """
+        paper_uuid = uuid4()
+        stmt = (
+            insert(PaperIdentifier)
+            .values(
+                paper_identifier=values["paper_identifier"],
+                paper_id=paper_uuid,
+                publish_date=values["publish_date"],
+            )
+            .on_conflict_do_nothing(index_elements=["paper_identifier"])
+            .returning(PaperIdentifier.paper_id)
+        )
+        result = await session.execute(stmt)
+        if result.scalar_one_or_none() is None:
+            return None
+
+        stmt = insert(Paper).values(id=paper_uuid, **values).returning(Paper)
+        result = await session.execute(stmt)
+        return result.scalar_one()
+
+    async def update_if_changed(
+        self,
+        paper_uuid: UUID,
+        publish_date: date,
+        values: Dict[str, Any],
+        session: AsyncSession,
+    ) -> bool:
+        """Updates a paper only if its content hash differs from the new one.
+
+        A new publish date moves the paper to another partition, and the
+        `PaperIdentifier` registry is pointed at it.
+
+        Args:
+            paper_uuid (UUID): The UUID of the paper to update.
+            publish_date (date): The current publish date of the paper.
+            values (Dict[str, Any]): The new column values, including
+                ``content_hash``, ``paper_identifier`` and ``publish_date``.
+            session (AsyncSession): The database session.
+
+        Returns:
+            bool: True if the paper was updated, False if it was unchanged.
+        """
+        stmt = (
+            update(Paper)
+            .where(
+                Paper.id == paper_uuid,
+                Paper.publish_date == publish_date,
+                Paper.content_hash.is_distinct_from(values["content_hash"]),
+            )
+            .values(**values, updated_at=func.now())
+            .returning(Paper.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await session.execute(stmt)
+        if result.scalar_one_or_none() is None:
+            return False
+
+        if values["publish_date"] != publish_date:
+            stmt = (
+                update(PaperIdentifier)
+                .where(PaperIdentifier.paper_identifier == values["paper_identifier"])
+                .values(publish_date=values["publish_date"])
+                .execution_options(synchronize_session=False)
             )
-            result = await session.execute(query)
-            return result.scalar_one()
+            await session.execute(stmt)
+        return True
+
+    async def get_content_hash(
+        self, paper_id: str, session: AsyncSession
+    ) -> Optional[Row]:
+        """Returns the UUID, content hash and publish date of a paper by source ID.
+
+        Args:
+            paper_id (str): The source ID of the paper.
+            session (AsyncSession): The database session.
+
+        Returns:
+            Optional[Row]: A row of (id, content_hash, publish_date), or None if
+                not found.
+        """
+        rows = await session.execute(_SELECT_CONTENT_HASH, {"paper_id": paper_id})
+        return rows.one_or_none()
 
     async def get_by_title(self, title: str, session: AsyncSession) -> Optional[Paper]:
         """Get a paper by title."""
@@ -49,15 +226,273 @@ class PaperRepository(BaseRepository[Paper]):
         self, paper_id: str, session: AsyncSession
     ) -> Optional[Paper]:
         """Get a paper by source ID (URL)."""
-        query = select(Paper).where(Paper.paper_identifier == paper_id)
-        rows = await session.execute(query)
+        rows = await session.execute(_SELECT_BY_PAPER_ID, {"paper_id": paper_id})
         return rows.scalar_one_or_none()
 
+    def stream_by_publish_date(
+        self,
+        since: date,
+        until: date,
+        session: AsyncSession,
+        yield_per: int = DEFAULT_YIELD_PER,
+    ) -> AsyncIterator[Paper]:
+        """Streams the papers published in a date range.
+
+        The papers are read through a server-side cursor in (publish_date, id)
+        order, touching only the partitions of the range.
+
+        Args:
+            since (date): The first publish date, inclusive.
+            until (date): The last publish date, inclusive.
+            session (AsyncSession): The database session.
+            yield_per (int): The number of rows fetched per round trip.
+
+        Returns:
+            AsyncIterator[Paper]: The papers.
+        """
+        query = (
+            select(Paper)
+            .where(Paper.publish_date >= since, Paper.publish_date <= until)
+            .order_by(Paper.publish_date, Paper.id)
+        )
+        return self.stream(query, session, yield_per)
+
+    async def get_page(
+        self,
+        session: AsyncSession,
+        after: Optional[Tuple[date, UUID]] = None,
+        limit: int = DEFAULT_YIELD_PER,
+        datasource_id: Optional[UUID] = None,
+    ) -> List[Paper]:
+        """Returns the next page of papers in (publish_date, id) order.
+
+        Keyset pagination: each page starts after the key of the last paper
+        of the previous page, so every page is an index range scan no matter
+        how deep into the table it is.
+
+        Args:
+            session (AsyncSession): The database session.
+            after (Optional[Tuple[date, UUID]]): The (publish_date, id) of the
+                last paper of the previous page, or None for the first page.
+            limit (int): The maximum number of papers in the page.
+            datasource_id (Optional[UUID]): Only return papers of this
+                datasource.
+
+        Returns:
+            List[Paper]: The papers of the page; fewer than `limit` on the
+                last page.
+        """
+        query = select(Paper).order_by(Paper.publish_date, Paper.id).limit(limit)
+        if after is not None:
+            query = query.where(tuple_(Paper.publish_date, Paper.id) > tuple_(*after))
+        if datasource_id is not None:
+            query = query.where(Paper.datasource_id == datasource_id)
+        rows = await session.execute(query)
+        return rows.scalars().all()
+
+    async def iter_pages(
+        self,
+        session: AsyncSession,
+        page_size: int = DEFAULT_YIELD_PER,
+        after: Optional[Tuple[date, UUID]] = None,
+        datasource_id: Optional[UUID] = None,
+    ) -> AsyncIterator[List[Paper]]:
+        """Walks all papers page by page with keyset pagination.
+
+        Unlike a streaming read, no cursor is held between pages, so a walk
+        over the whole table can be interrupted and resumed from the key of
+        the last paper it processed. The papers of each page are expunged from
+        the session once the next page is requested so memory stays flat;
+        other objects of the session are left attached.
+
+        Args:
+            session (AsyncSession): The database session.
+            page_size (int): The number of papers per page.
+            after (Optional[Tuple[date, UUID]]): The (publish_date, id) to
+                resume after, or None to start from the oldest paper.
+            datasource_id (Optional[UUID]): Only walk papers of this
+                datasource.
+
+        Yields:
+            List[Paper]: The pages of papers.
+        """
+        while True:
+            page = await self.get_page(session, after, page_size, datasource_id)
+            if not page:
+                return
+            after = (page[-1].publish_date, page[-1].id)
+            yield page
+            for paper in page:
+                if paper in session:
+                    session.expunge(paper)
+            if len(page) < page_size:
+                return
+
+    async def get_export_page(
+        self,
+        until: datetime,
+        session: AsyncSession,
+        after: Optional[Tuple[datetime, UUID]] = None,
+        limit: int = DEFAULT_YIELD_PER,
+    ) -> List[Row]:
+        """Returns the next page of papers to export in (updated_at, id) order.
+
+        Each row carries the paper with its datasource name, domain code, main
+        author name, author names and subject codes.
+
+        Args:
+            until (datetime): Only papers updated before this time are returned.
+            session (AsyncSession): The database session.
+            after (Optional[Tuple[datetime, UUID]]): The (updated_at, id) of the
+                last exported paper, or None to start from the oldest update.
+            limit (int): The maximum number of rows in the page.
+
+        Returns:
+            List[Row]: The rows of the page; fewer than `limit` on the last page.
+        """
+        main_author = aliased(Author)
+        authors = (
+            select(func.array_agg(Author.name))
+            .select_from(paper_authors)
+            .join(Author, Author.id == paper_authors.c.author_id)
+            .where(paper_authors.c.paper_id == Paper.id)
+            .scalar_subquery()
+        )
+        subjects = (
+            select(func.array_agg(Subject.code))
+            .select_from(PaperSubject)
+            .join(Subject, Subject.id == PaperSubject.subject_id)
+            .where(PaperSubject.paper_id == Paper.id)
+            .scalar_subquery()
+        )
+        primary_subject = (
+            select(Subject.code)
+            .select_from(PaperSubject)
+            .join(Subject, Subject.id == PaperSubject.subject_id)
+            .where(PaperSubject.paper_id == Paper.id, PaperSubject.is_primary)
+            .limit(1)
+            .scalar_subquery()
+        )
+        query = (
+            select(
+                Paper.id,
+                Paper.paper_identifier,
+                Datasource.name.label("datasource"),
+                Domain.code.label("domain"),
+                Paper.title,
+                Paper.abstract,
+                Paper.publish_date,
+                main_author.name.label("main_author"),
+                authors.label("authors"),
+                subjects.label("subjects"),
+                primary_subject.label("primary_subject"),
+                Paper.content_hash,
+                Paper.created_at,
+                Paper.updated_at,
+            )
+            .join(Datasource, Datasource.id == Paper.datasource_id)
+            .join(Domain, Domain.id == Paper.domain_id)
+            .join(main_author, main_author.id == Paper.main_author_id)
+            .where(Paper.updated_at < until)
+            .order_by(Paper.updated_at, Paper.id)
+            .limit(limit)
+        )
+        if after is not None:
+            after_key = tuple_(
+                literal(after[0], Paper.updated_at.type),
+                literal(after[1], Paper.id.type),
+            )
+            query = query.where(tuple_(Paper.updated_at, Paper.id) > after_key)
+        rows = await session.execute(query)
+        return rows.all()
+
+    async def search(
+        self,
+        query: str,
+        session: AsyncSession,
+        filters: Optional[PaperSearchFilters] = None,
+        limit: int = 20,
+        cursor: Optional[Tuple[float, UUID]] = None,
+    ) -> List[Row]:
+        """Returns the papers matching a full-text query, best ranked first.
+
+        The query uses web search syntax: quoted phrases, `or` and `-` for
+        negation. Matches are found through the GIN index on the search vector
+        and ranked with ts_rank_cd, title matches weighing more than abstract
+        matches. Date filters also restrict the partitions read.
+
+        Args:
+            query (str): The search query.
+            session (AsyncSession): The database session.
+            filters (Optional[PaperSearchFilters]): Datasource, subject and
+                publish date filters.
+            limit (int): The maximum number of results.
+            cursor (Optional[Tuple[float, UUID]]): The (rank, id) of the last
+                result of the previous page, or None for the first page.
+
+        Returns:
+            List[Row]: Rows of (Paper, rank) in (rank desc, id) order.
+        """
+        ts_query = func.websearch_to_tsquery(PAPER_SEARCH_CONFIG, query)
+        rank = func.ts_rank_cd(Paper.search_vector, ts_query)
+        stmt = (
+            select(Paper, rank.label("rank"))
+            .where(Paper.search_vector.op("@@")(ts_query))
+            .order_by(rank.desc(), Paper.id)
+            .limit(limit)
+        )
+
+        filters = filters or PaperSearchFilters()
+        if filters.datasource_id is not None:
+            stmt = stmt.where(Paper.datasource_id == filters.datasource_id)
+        if filters.since is not None:
+            stmt = stmt.where(Paper.publish_date >= filters.since)
+        if filters.until is not None:
+            stmt = stmt.where(Paper.publish_date <= filters.until)
+        if filters.subject_ids:
+            stmt = stmt.where(
+                exists().where(
+                    PaperSubject.paper_id == Paper.id,
+                    PaperSubject.subject_id.in_(filters.subject_ids),
+                )
+            )
+        if cursor is not None:
+            last_rank, last_id = cursor
+            stmt = stmt.where(
+                or_(rank < last_rank, and_(rank == last_rank, Paper.id > last_id))
+            )
+
+        rows = await session.execute(stmt)
+        return rows.all()
+
     async def add_subjects(self, subjects: List[PaperSubject], session: AsyncSession):
         """Add subjects to a paper."""
         session.add_all(subjects)
         await session.flush()
 
+    async def add_authors(
+        self, paper_uuid: UUID, author_ids: List[UUID], session: AsyncSession
+    ):
+        """Links authors to a paper."""
+        if not author_ids:
+            return
+        stmt = (
+            insert(paper_authors)
+            .values(
+                [
+                    {"author_id": author_id, "paper_id": paper_uuid}
+                    for author_id in author_ids
+                ]
+            )
+            .on_conflict_do_nothing()
+        )
+        await session.execute(stmt)
+
+    async def delete_authors(self, paper_uuid: UUID, session: AsyncSession):
+        """Unlinks all authors from a paper."""
+        stmt = delete(paper_authors).where(paper_authors.c.paper_id == paper_uuid)
+        await session.execute(stmt)
+
     async def count_papers(self, datasource_id: UUID, session: AsyncSession) -> int:
         """Counts the number of papers from a given datasource."""
         query = (
@@ -79,7 +514,7 @@ class PaperRepository(BaseRepository[Paper]):
                 and the paper count.
         """
         stmt = (
-            select(Datasource.name, func.count(Paper.id).label("paper_count"))
+            select(Datasource.name, func.count().label("paper_count"))
             .select_from(Paper)
             .join(Datasource, Paper.datasource_id == Datasource.id)
             .group_by(Datasource.name)
@@ -0,0 +1,175 @@
+from datetime import date
+from typing import Dict, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.database.postgres.models import (
+    Datasource,
+    Paper,
+    PaperStatistics,
+    Subject,
+)
+from common.database.postgres.models.relationships import PaperSubject
+
+from .base_repository import BaseRepository
+
+
+class PaperStatisticsRepository(BaseRepository[PaperStatistics]):
+    """Repository for the daily paper counters."""
+
+    def __init__(self):
+        """Initializes a PaperStatisticsRepository object."""
+        super().__init__(PaperStatistics)
+
+    async def increment(
+        self,
+        counts: Dict[Tuple[UUID, UUID, date], Tuple[int, int]],
+        session: AsyncSession,
+    ):
+        """Adds paper counts to the daily counters.
+
+        Counters are upserted in key order, so concurrent writers lock the
+        rows in the same order. Negative counts decrement the counters.
+
+        Args:
+            counts (Dict[Tuple[UUID, UUID, date], Tuple[int, int]]): Mapping of
+                (datasource UUID, subject UUID, day) to the (paper count,
+                primary paper count) to add.
+            session (AsyncSession): The database session.
+        """
+        values = [
+            {
+                "datasource_id": datasource_id,
+                "subject_id": subject_id,
+                "day": day,
+                "paper_count": paper_count,
+                "primary_paper_count": primary_paper_count,
+            }
+            for (datasource_id, subject_id, day), (
+                paper_count,
+                primary_paper_count,
+            ) in sorted(counts.items())
+            if paper_count or primary_paper_count
+        ]
+        if not values:
+            return
+
+        stmt = insert(PaperStatistics).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["datasource_id", "subject_id", "day"],
+            set_={
+                "paper_count": PaperStatistics.paper_count + stmt.excluded.paper_count,
+                "primary_paper_count": (
+                    PaperStatistics.primary_paper_count
+                    + stmt.excluded.primary_paper_count
+                ),
+            },
+        )
+        await session.execute(stmt)
+
+    async def recompute_from_papers(self, session: AsyncSession):
+        """Recomputes all the daily counters from the papers table.
+
+        This scans every paper subject, so it is only meant to repair the
+        counters, e.g. after an ingestion was killed between committing its
+        papers and writing their counts. Ingestion keeps the counters current
+        through `increment`; run this while no ingestion runs, or the papers
+        committed meanwhile may be counted twice.
+
+        Args:
+            session (AsyncSession): The database session.
+        """
+        counts = (
+            select(
+                Paper.datasource_id,
+                PaperSubject.subject_id,
+                Paper.publish_date,
+                func.count(),
+                func.count().filter(PaperSubject.is_primary),
+            )
+            .join(Paper, Paper.id == PaperSubject.paper_id)
+            .group_by(Paper.datasource_id, PaperSubject.subject_id, Paper.publish_date)
+        )
+        await session.execute(delete(PaperStatistics))
+        await session.execute(
+            insert(PaperStatistics).from_select(
+                [
+                    "datasource_id",
+                    "subject_id",
+                    "day",
+                    "paper_count",
+                    "primary_paper_count",
+                ],
+                counts,
+            )
+        )
+
+    async def get_paper_count_by_datasource(self, session: AsyncSession):
+        """Returns the number of papers by datasource.
+
+        Each paper has exactly one primary subject, so the primary counters
+        add up to the number of papers.
+
+        Args:
+            session (AsyncSession): The database session.
+
+        Returns:
+            List[Tuple[str, int]]: A list of tuples (datasource name, paper count).
+        """
+        stmt = (
+            select(
+                Datasource.name,
+                func.sum(PaperStatistics.primary_paper_count).label("paper_count"),
+            )
+            .select_from(PaperStatistics)
+            .join(Datasource, PaperStatistics.datasource_id == Datasource.id)
+            .group_by(Datasource.name)
+        )
+        row = await session.execute(stmt)
+        return row.all()
+
+    async def get_paper_count_by_subject(self, session: AsyncSession):
+        """Returns the number of papers by subject.
+
+        Args:
+            session (AsyncSession): The database session.
+
+        Returns:
+            List[Tuple[str, int]]: A list of tuples (subject name, paper count).
+        """
+        stmt = (
+            select(
+                Subject.name,
+                func.sum(PaperStatistics.paper_count).label("paper_count"),
+            )
+            .select_from(PaperStatistics)
+            .join(Subject, PaperStatistics.subject_id == Subject.id)
+            .group_by(Subject.name)
+        )
+        row = await session.execute(stmt)
+        return row.all()
+
+    async def get_paper_count_by_subject_uuid(
+        self, session: AsyncSession, since: Optional[date] = None
+    ) -> Dict[UUID, int]:
+        """Returns the number of papers by subject UUID.
+
+        Args:
+            session (AsyncSession): The database session.
+            since (Optional[date]): Only count the papers published on or
+                after this day.
+
+        Returns:
+            Dict[UUID, int]: Mapping of subject UUID to paper count. Subjects
+                without papers are missing.
+        """
+        stmt = select(
+            PaperStatistics.subject_id, func.sum(PaperStatistics.paper_count)
+        ).group_by(PaperStatistics.subject_id)
+        if since is not None:
+            stmt = stmt.where(PaperStatistics.day >= since)
+        rows = await session.execute(stmt)
+        return {subject_id: int(paper_count) for subject_id, paper_count in rows}
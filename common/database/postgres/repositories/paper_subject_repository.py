@@ -1,6 +1,7 @@
 from typing import List
+from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from common.database.postgres.models import Subject
@@ -30,6 +31,26 @@ class PaperSubjectRepository(BaseRepository[PaperSubject]):
         session.add_all(paper_subjects)
         await session.flush()
 
+    async def delete_by_paper_uuid(
+        self, paper_uuid: UUID, session: AsyncSession
+    ) -> List[Row]:
+        """Removes all subjects from a paper.
+
+        Args:
+            paper_uuid (UUID): The UUID of the paper.
+            session (AsyncSession): The database session.
+
+        Returns:
+            List[Row]: The removed rows of (subject_id, is_primary).
+        """
+        stmt = (
+            delete(PaperSubject)
+            .where(PaperSubject.paper_id == paper_uuid)
+            .returning(PaperSubject.subject_id, PaperSubject.is_primary)
+        )
+        rows = await session.execute(stmt)
+        return rows.all()
+
     async def get_paper_count_by_subject(self, session: AsyncSession):
         """Returns a list of tuples containing the subject name and the paper count.
 
@@ -0,0 +1,56 @@
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.database.postgres.models import RateLimitBucket
+
+from .base_repository import BaseRepository
+
+
+class RateLimitBucketRepository(BaseRepository[RateLimitBucket]):
+    """Repository for the token buckets shared across workers."""
+
+    def __init__(self):
+        """Initializes a RateLimitBucketRepository object."""
+        super().__init__(RateLimitBucket)
+
+    async def take(
+        self, name: str, rate: float, burst: float, session: AsyncSession
+    ) -> float:
+        """Takes a token from a bucket, creating the bucket if needed.
+
+        The bucket is refilled for the time elapsed since the last token was
+        taken, capped at the burst, and one token is taken in the same
+        statement, so concurrent callers queue on the row lock rather than
+        racing. The tokens may go negative: each caller then owns the slot
+        `-tokens / rate` seconds ahead, without polling the bucket again.
+
+        Args:
+            name (str): The name of the bucket.
+            rate (float): The tokens added per second. Replaces the stored
+                rate, so the bucket follows configuration changes.
+            burst (float): The maximum number of tokens.
+            session (AsyncSession): The database session.
+
+        Returns:
+            float: The number of seconds to wait before using the token.
+        """
+        now = func.clock_timestamp()
+        stmt = insert(RateLimitBucket).values(
+            name=name, rate=rate, burst=burst, tokens=burst - 1, updated_at=now
+        )
+        refilled = RateLimitBucket.tokens + (
+            func.extract("epoch", now - RateLimitBucket.updated_at) * stmt.excluded.rate
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["name"],
+            set_={
+                "rate": stmt.excluded.rate,
+                "burst": stmt.excluded.burst,
+                "tokens": func.least(stmt.excluded.burst, refilled) - 1,
+                "updated_at": now,
+            },
+        ).returning(RateLimitBucket.tokens)
+        rows = await session.execute(stmt)
+        tokens = rows.scalar_one()
+        return max(0.0, -tokens / rate)
@@ -0,0 +1,123 @@
+from datetime import date, timedelta
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import bindparam, func, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from common.database.postgres.models import Subject, SubjectIngestionWatermark
+
+from .base_repository import BaseRepository
+
+# Hot lookups are built once; SQLAlchemy caches their compiled form.
+_SELECT_HARVESTED_UNTIL = select(SubjectIngestionWatermark.harvested_until).where(
+    SubjectIngestionWatermark.subject_id == bindparam("subject_id")
+)
+
+
+class SubjectIngestionWatermarkRepository(BaseRepository[SubjectIngestionWatermark]):
+    """Repository for the per-subject harvest watermarks."""
+
+    def __init__(self):
+        """Initializes a SubjectIngestionWatermarkRepository object."""
+        super().__init__(SubjectIngestionWatermark)
+
+    async def get_harvested_until(
+        self, subject_id: UUID, session: AsyncSession
+    ) -> Optional[date]:
+        """Returns the last day harvested for a subject, if any."""
+        rows = await session.execute(
+            _SELECT_HARVESTED_UNTIL, {"subject_id": subject_id}
+        )
+        return rows.scalar_one_or_none()
+
+    async def advance(
+        self,
+        subject_id: UUID,
+        datasource_id: UUID,
+        from_date: date,
+        until_date: date,
+        session: AsyncSession,
+    ) -> bool:
+        """Records that a window of a subject has been harvested.
+
+        The watermark only moves forward, and only when the window starts at
+        or before the day after it, so a window harvested out of order never
+        skips over a window that is not harvested yet.
+
+        Args:
+            subject_id (UUID): The UUID of the subject.
+            datasource_id (UUID): The UUID of the datasource.
+            from_date (date): The first day of the harvested window.
+            until_date (date): The last day of the harvested window.
+            session (AsyncSession): The database session.
+
+        Returns:
+            bool: Whether the watermark moved.
+        """
+        stmt = insert(SubjectIngestionWatermark).values(
+            subject_id=subject_id,
+            datasource_id=datasource_id,
+            harvested_until=until_date,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["subject_id"],
+            set_={"harvested_until": stmt.excluded.harvested_until},
+            where=(
+                SubjectIngestionWatermark.harvested_until
+                >= from_date - timedelta(days=1)
+            )
+            & (
+                SubjectIngestionWatermark.harvested_until
+                < stmt.excluded.harvested_until
+            ),
+        ).returning(SubjectIngestionWatermark.subject_id)
+        rows = await session.execute(stmt)
+        return rows.first() is not None
+
+    async def raise_for_domain(
+        self,
+        domain_id: UUID,
+        datasource_id: UUID,
+        harvested_from: date,
+        harvested_until: date,
+        session: AsyncSession,
+    ):
+        """Moves the watermarks of all subjects of a domain up to a day.
+
+        Used when a domain was harvested outside of the daily ingestion, e.g.
+        by a backfill. Watermarks already past the day are kept, and so are
+        watermarks before the day preceding the harvested range, since
+        raising them would skip the days in between, as in `advance`.
+        Subjects without a watermark get one.
+
+        Args:
+            domain_id (UUID): The UUID of the domain.
+            datasource_id (UUID): The UUID of the datasource.
+            harvested_from (date): The first day harvested for the domain.
+            harvested_until (date): The last day harvested for the domain.
+            session (AsyncSession): The database session.
+        """
+        subjects = select(
+            Subject.id,
+            literal(datasource_id, SubjectIngestionWatermark.datasource_id.type),
+            literal(harvested_until, SubjectIngestionWatermark.harvested_until.type),
+        ).where(Subject.domain_id == domain_id)
+        stmt = insert(SubjectIngestionWatermark).from_select(
+            ["subject_id", "datasource_id", "harvested_until"], subjects
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["subject_id"],
+            set_={
+                "harvested_until": func.greatest(
+                    SubjectIngestionWatermark.harvested_until,
+                    stmt.excluded.harvested_until,
+                )
+            },
+            where=(
+                SubjectIngestionWatermark.harvested_until
+                >= harvested_from - timedelta(days=1)
+            ),
+        )
+        await session.execute(stmt)
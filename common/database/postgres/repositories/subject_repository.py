@@ -1,11 +1,24 @@
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
-from sqlalchemy import UUID, func, select
+from sqlalchemy import UUID, bindparam, func, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from common.database.postgres.models import Domain, Subject
-from common.database.postgres.repositories.base_repository import BaseRepository
+from common.database.postgres.repositories.base_repository import (
+    DEFAULT_YIELD_PER,
+    BaseRepository,
+)
+
+# Hot lookups are built once; SQLAlchemy caches their compiled form.
+_SELECT_BY_CODE = select(Subject).where(Subject.code == bindparam("code"))
+_SELECT_BY_CODES = select(Subject).where(
+    Subject.code.in_(bindparam("codes", expanding=True))
+)
+_SELECT_BY_DOMAIN_UUID = select(Subject).where(
+    Subject.domain_id == bindparam("domain_uuid")
+)
+_SELECT_BY_UUID = select(Subject).where(Subject.id == bindparam("subject_uuid"))
 
 
 class SubjectRepository(BaseRepository[Subject]):
@@ -31,30 +44,38 @@ class SubjectRepository(BaseRepository[Subject]):
 
     async def get_by_code(self, code: str, session: AsyncSession) -> Optional[Subject]:
         """Returns a subject by code."""
-        query = select(Subject).filter_by(code=code)
-        rows = await session.execute(query)
+        rows = await session.execute(_SELECT_BY_CODE, {"code": code})
         return rows.scalar_one_or_none()
 
     async def get_by_codes(
         self, codes: List[str], session: AsyncSession
     ) -> List[Subject]:
         """Returns a list of subjects by codes."""
-        query = select(Subject).filter(Subject.code.in_(codes))
-        rows = await session.execute(query)
+        rows = await session.execute(_SELECT_BY_CODES, {"codes": list(codes)})
         return rows.scalars().all()
 
     async def get_by_domain_uuid(
         self, domain_uuid: UUID, session: AsyncSession
     ) -> List[Subject]:
         """Returns a list of subjects by domain UUID."""
-        query = select(Subject).where(Subject.domain_id == domain_uuid)
-        rows = await session.execute(query)
+        rows = await session.execute(
+            _SELECT_BY_DOMAIN_UUID, {"domain_uuid": domain_uuid}
+        )
         return rows.scalars().all()
 
+    def stream_by_domain_uuid(
+        self,
+        domain_uuid: UUID,
+        session: AsyncSession,
+        yield_per: int = DEFAULT_YIELD_PER,
+    ) -> AsyncIterator[Subject]:
+        """Streams the subjects of a domain through a server-side cursor."""
+        query = select(Subject).where(Subject.domain_id == domain_uuid)
+        return self.stream(query, session, yield_per)
+
     async def get_by_uuid(self, subject_uuid: UUID, session: AsyncSession):
         """Returns a subject by UUID."""
-        query = select(Subject).where(Subject.id == subject_uuid)
-        rows = await session.execute(query)
+        rows = await session.execute(_SELECT_BY_UUID, {"subject_uuid": subject_uuid})
         return rows.scalar_one_or_none()
 
     async def delete_subject(self, subject: Subject, session: AsyncSession):
@@ -71,7 +92,7 @@ class SubjectRepository(BaseRepository[Subject]):
             List[Tuple[str, int]]: A list of tuples (domain name, subject count).
         """
         stmt = (
-            select(Domain.name, func.count(Subject.id).label("subject_count"))
+            select(Domain.name, func.count().label("subject_count"))
             .select_from(Subject)
             .join(Domain, Subject.domain_id == Domain.id)
             .group_by(Domain.name)
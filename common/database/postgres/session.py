@@ -1,7 +1,10 @@
+import asyncio
 from contextlib import asynccontextmanager
 import os
-from typing import AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, Dict, Optional
+from uuid import uuid4
 
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -9,48 +12,233 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
+from common.utils.logger import LoggerManager
+
 _async_engine: Optional[AsyncEngine] = None
 _async_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+_async_read_engine: Optional[AsyncEngine] = None
+_async_read_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+_engine_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_env(name: str, prefix: str, default: Optional[str] = None) -> Optional[str]:
+    """Returns a POSTGRES_* setting, preferring the prefixed variable.
+
+    Empty variables count as unset, as an .env file leaves them.
+
+    Args:
+        name (str): The setting name, e.g. "HOST".
+        prefix (str): The variable prefix, e.g. "POSTGRES_READ_".
+        default (Optional[str]): The value if neither variable is set.
+
+    Returns:
+        Optional[str]: The value of the prefixed variable, falling back to the
+            POSTGRES_* variable and then to the default.
+    """
+    return os.getenv(f"{prefix}{name}") or os.getenv(f"POSTGRES_{name}") or default
+
+
+def _prepared_statement_name() -> str:
+    """Returns a unique prepared statement name.
+
+    PgBouncer in transaction mode may hand a connection's prepared statements
+    to another client, so names must never be reused.
+    """
+    return f"__asyncpg_{uuid4()}__"
+
+
+def _pool_settings(prefix: str) -> Dict[str, int]:
+    """Returns the pool size settings of an engine.
+
+    When a connection budget is set, the pool is sized so that all concurrent
+    tasks of a worker stay within it: each task gets the budget divided by
+    POSTGRES_TASK_CONCURRENCY connections and no overflow. Otherwise the
+    POOL_SIZE and MAX_OVERFLOW settings are used. The ingestion service sizes
+    its number of papers in flight from the pool it is given, see
+    `get_pool_capacity`, so a small budget slows it down rather than starving
+    the pool.
+
+    Args:
+        prefix (str): The variable prefix of the engine.
+
+    Returns:
+        Dict[str, int]: The pool_size and max_overflow engine arguments.
+
+    Examples:
+        >>> os.environ["POSTGRES_CONNECTION_BUDGET"] = "64"
+        >>> os.environ["POSTGRES_TASK_CONCURRENCY"] = "16"
+        >>> _pool_settings("POSTGRES_")
+        {'pool_size': 4, 'max_overflow': 0}
+        >>> del os.environ["POSTGRES_CONNECTION_BUDGET"]
+        >>> del os.environ["POSTGRES_TASK_CONCURRENCY"]
+    """
+    budget = _get_env("CONNECTION_BUDGET", prefix)
+    if budget:
+        concurrency = int(os.getenv("POSTGRES_TASK_CONCURRENCY", "16"))
+        return {"pool_size": max(1, int(budget) // concurrency), "max_overflow": 0}
+    return {
+        "pool_size": int(_get_env("POOL_SIZE", prefix, "30")),
+        "max_overflow": int(_get_env("MAX_OVERFLOW", prefix, "10")),
+    }
+
+
+def _create_engine(prefix: str) -> AsyncEngine:
+    """Creates an async engine from the environment variables.
+
+    Args:
+        prefix (str): The variable prefix, "POSTGRES_" for the primary and
+            "POSTGRES_READ_" for the read replica. Unset replica variables
+            fall back to the primary ones.
+
+    Returns:
+        AsyncEngine: The async engine.
+    """
+    database_url = (
+        "postgresql+asyncpg://"
+        f"{_get_env('USER', prefix)}:{_get_env('PASSWORD', prefix)}"
+        f"@{_get_env('HOST', prefix)}:{_get_env('PORT', prefix)}"
+        f"/{_get_env('DATABASE', prefix)}"
+    )
+
+    connect_args: Dict[str, Any] = {
+        "statement_cache_size": int(_get_env("STATEMENT_CACHE_SIZE", prefix, "100")),
+        "prepared_statement_cache_size": int(
+            _get_env("PREPARED_STATEMENT_CACHE_SIZE", prefix, "100")
+        ),
+    }
+    if _get_env("PGBOUNCER", prefix, "false").lower() == "true":
+        connect_args = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": _prepared_statement_name,
+        }
+
+    return create_async_engine(
+        database_url,
+        echo=False,
+        connect_args=connect_args,
+        query_cache_size=int(_get_env("QUERY_CACHE_SIZE", prefix, "500")),
+        pool_timeout=int(_get_env("POOL_TIMEOUT", prefix, "120")),
+        pool_recycle=int(_get_env("POOL_RECYCLE", prefix, "1800")),
+        **_pool_settings(prefix),
+    )
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Returns the running event loop, or None outside of one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _engines() -> Dict[str, AsyncEngine]:
+    """Returns the initialized engines by name."""
+    engines = {"primary": _async_engine, "read": _async_read_engine}
+    return {name: engine for name, engine in engines.items() if engine is not None}
 
 
 def init_database():
-    """Initializes the global database connection."""
+    """Initializes the global database connections.
+
+    Engines are created once per process and later calls return early. This
+    does not keep connections warm across Airflow tasks: asyncpg connections
+    belong to the event loop that opened them and each task runs its own, so
+    when called from a new event loop the pooled connections of the previous
+    loop are dropped without being closed, and the task opens new ones.
+
+    The read-only engine is only created when POSTGRES_READ_HOST is set;
+    otherwise reads go to the primary.
+    """
     global _async_engine
     global _async_session_factory
+    global _async_read_engine
+    global _async_read_session_factory
+    global _engine_loop
+
+    loop = _running_loop()
+    if _engine_loop is not None and loop is not _engine_loop:
+        for engine in _engines().values():
+            engine.sync_engine.dispose(close=False)
+    _engine_loop = loop
 
     if _async_engine is None:
-        ASYNC_DATABASE_URL = (
-            "postgresql+asyncpg://"
-            f"{os.getenv('POSTGRES_USER')}:{os.getenv('POSTGRES_PASSWORD')}"
-            f"@{os.getenv('POSTGRES_HOST')}:{os.getenv('POSTGRES_PORT')}"
-            f"/{os.getenv('POSTGRES_DATABASE')}"
+        _async_engine = _create_engine("POSTGRES_")
+        _async_session_factory = async_sessionmaker(
+            _async_engine, expire_on_commit=False
         )
 
-        _async_engine = create_async_engine(
-            ASYNC_DATABASE_URL,
-            echo=False,
-            max_overflow=int(os.getenv("POSTGRES_MAX_OVERFLOW", 10)),
-            pool_size=int(os.getenv("POSTGRES_POOL_SIZE", 30)),
-            pool_timeout=int(os.getenv("POSTGRES_POOL_TIMEOUT", 120)),
-            pool_recycle=int(os.getenv("POSTGRES_POOL_RECYCLE", 1800)),
+    if _async_read_engine is None and os.getenv("POSTGRES_READ_HOST"):
+        _async_read_engine = _create_engine("POSTGRES_READ_")
+        _async_read_session_factory = async_sessionmaker(
+            _async_read_engine, expire_on_commit=False
         )
 
-        _async_session_factory = async_sessionmaker(
-            _async_engine, expire_on_commit=False
-        )
 
+def get_pool_statistics() -> Dict[str, Dict[str, int]]:
+    """Returns the connection pool statistics of the initialized engines.
+
+    Returns:
+        Dict[str, Dict[str, int]]: Mapping of engine name ("primary" or "read")
+            to its pool size and its checked-in, checked-out and overflow
+            connection counts.
+    """
+    statistics = {}
+    for name, engine in _engines().items():
+        pool = engine.pool
+        statistics[name] = {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        }
+    return statistics
+
+
+def get_pool_capacity(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> Optional[int]:
+    """Returns the number of connections the pool of a session factory opens.
 
-def get_session_factory() -> async_sessionmaker[AsyncSession]:
-    """Returns the global async SQLAlchemy session factory."""
+    Args:
+        session_factory (async_sessionmaker): The session factory.
+
+    Returns:
+        Optional[int]: The pool size plus its maximum overflow, or None if
+            the pool is not bounded.
+    """
+    pool = getattr(getattr(session_factory, "kw", {}).get("bind"), "pool", None)
+    max_overflow = getattr(pool, "_max_overflow", -1)
+    if not hasattr(pool, "size") or max_overflow < 0:
+        return None
+    return pool.size() + max_overflow
+
+
+def get_session_factory(read_only: bool = False) -> async_sessionmaker[AsyncSession]:
+    """Returns the global async SQLAlchemy session factory.
+
+    Args:
+        read_only (bool): Whether the sessions only read. Read-only sessions
+            go to the read replica when one is configured.
+
+    Returns:
+        async_sessionmaker[AsyncSession]: The session factory.
+    """
+    if read_only and _async_read_session_factory is not None:
+        return _async_read_session_factory
     return _async_session_factory
 
 
 @asynccontextmanager
-async def get_session() -> AsyncGenerator:
+async def get_session(read_only: bool = False) -> AsyncGenerator:
     """Yields an async SQLAlchemy session.
 
     The session is yielded to the caller, and then closed
-    after the caller is finished with it.
+    after the caller is finished with it. Read-only sessions fall back to the
+    primary when the read replica cannot be reached.
+
+    Args:
+        read_only (bool): Whether the session only reads.
 
     Raises:
         RuntimeError: if init_database() has not been called first.
@@ -58,15 +246,51 @@ async def get_session() -> AsyncGenerator:
     if _async_session_factory is None:
         raise RuntimeError("Call init_database() first")
 
-    async with _async_session_factory() as session:
+    session_factory = get_session_factory(read_only)
+    if session_factory is not _async_session_factory:
+        session = session_factory()
+        try:
+            await session.connection()
+        except (DBAPIError, OSError) as e:
+            await session.close()
+            LoggerManager.get_logger(__name__).warning(
+                "Read replica unavailable, reading from the primary", exc_info=e
+            )
+            session_factory = _async_session_factory
+        else:
+            async with session:
+                yield session
+            return
+
+    async with session_factory() as session:
         yield session
 
 
 async def cleanup():
-    """Call on app shutdown."""
+    """Closes the pooled connections at the end of a task.
+
+    The connections cannot outlive the event loop of the task, so they are
+    closed here rather than left for the next task; only the engine objects
+    are kept.
+    """
+    LoggerManager.get_logger(__name__).info(
+        "Database connection pools", extra={"pools": get_pool_statistics()}
+    )
+    for engine in _engines().values():
+        await engine.dispose()
+
+
+async def shutdown_database():
+    """Disposes of the engines. Call on app shutdown."""
     global _async_engine
     global _async_session_factory
-    if _async_engine:
-        await _async_engine.dispose()
-        _async_engine = None
-        _async_session_factory = None
+    global _async_read_engine
+    global _async_read_session_factory
+    global _engine_loop
+    for engine in _engines().values():
+        await engine.dispose()
+    _async_engine = None
+    _async_session_factory = None
+    _async_read_engine = None
+    _async_read_session_factory = None
+    _engine_loop = None
@@ -0,0 +1,89 @@
+"""Measures the overhead of the pre-built repository statements.
+
+Usage:
+    python -m common.database.postgres.statement_benchmark [--code cs.AI]
+        [--iterations 2000] [--db-iterations 200]
+
+The Python overhead is the statement construction and the cache key lookup
+that every execution pays before reaching the driver, timed for a statement
+rebuilt on each call and for the pre-built one. The database latency is the
+rest of a `SubjectRepository.get_by_code` round trip against the configured
+database. The numbers depend on the host, so they are printed rather than
+asserted; tests only check that the pre-built statement is reused.
+"""
+
+import argparse
+import asyncio
+from time import perf_counter
+from typing import Callable
+
+from sqlalchemy import select
+
+from common.database.postgres.models import Subject
+from common.database.postgres.repositories import DatabaseRepository
+from common.database.postgres.repositories.subject_repository import _SELECT_BY_CODE
+from common.database.postgres.session import (
+    get_session_factory,
+    init_database,
+    shutdown_database,
+)
+from common.utils.env import load_environment_variables
+
+
+def _mean_seconds(func: Callable[[], object], iterations: int) -> float:
+    """Returns the mean wall time of a function call in seconds."""
+    start = perf_counter()
+    for _ in range(iterations):
+        func()
+    return (perf_counter() - start) / iterations
+
+
+async def main(args: argparse.Namespace) -> str:
+    """Runs the benchmark against the configured database.
+
+    Returns:
+        str: The mean time per call of each measure.
+    """
+    rebuilt_seconds = _mean_seconds(
+        lambda: select(Subject).filter_by(code=args.code)._generate_cache_key(),
+        args.iterations,
+    )
+    prebuilt_seconds = _mean_seconds(
+        _SELECT_BY_CODE._generate_cache_key, args.iterations
+    )
+
+    init_database()
+    db = DatabaseRepository()
+    try:
+        async with get_session_factory(read_only=True)() as session:
+            # The first call compiles the statement and opens the connection.
+            await db.subject.get_by_code(args.code, session)
+            start = perf_counter()
+            for _ in range(args.db_iterations):
+                await db.subject.get_by_code(args.code, session)
+            call_seconds = (perf_counter() - start) / args.db_iterations
+    finally:
+        await shutdown_database()
+
+    return (
+        f"Rebuilt statement: {rebuilt_seconds * 1e6:.1f} us/call\n"
+        f"Pre-built statement: {prebuilt_seconds * 1e6:.1f} us/call\n"
+        f"get_by_code round trip: {call_seconds * 1e6:.1f} us/call\n"
+        f"Database latency: {(call_seconds - prebuilt_seconds) * 1e6:.1f} us/call"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--code", default="cs.AI", help="Subject code to look up")
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=2000,
+        help="Statement cache key computations timed",
+    )
+    parser.add_argument(
+        "--db-iterations", type=int, default=200, help="Database round trips timed"
+    )
+    load_environment_variables()
+    print(asyncio.run(main(parser.parse_args())))
@@ -1,3 +1,5 @@
+import os
+
 from common.constants import DataSource
 
 DATASOURCE_NAME = DataSource.ARXIV
@@ -7,3 +9,14 @@ NAMESPACE = {
     "oai": "http://www.openarchives.org/OAI/2.0/",
     "oai_dc": "http://www.openarchives.org/OAI/2.0/oai_dc/",
 }
+
+DEFAULT_OAI_URL = "https://oaipmh.arxiv.org/oai"
+
+
+def get_oai_url() -> str:
+    """Returns the OAI-PMH endpoint, overridable to harvest from a mock server.
+
+    ARXIV_OAI_URL is read on each call rather than at import, so a value
+    loaded from .env after the import still applies.
+    """
+    return os.getenv("ARXIV_OAI_URL") or DEFAULT_OAI_URL
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import AsyncIterator, ClassVar, Optional
 
-from common.datasources.arxiv.const import DATASOURCE_NAME
+from common.datasources.arxiv.const import DATASOURCE_NAME, get_oai_url
 from common.datasources.arxiv.schema import ArxivPaperMetadataRecord
 from common.datasources.base import PaperMetadataFetcher
 from common.utils.logger import LoggerManager
@@ -12,8 +12,6 @@ logger = LoggerManager.get_logger(__name__)
 class ArxivPaperMetadataFetcher(PaperMetadataFetcher[ArxivPaperMetadataRecord]):
     DATASOURCE_NAME: ClassVar[str] = DATASOURCE_NAME
 
-    BASE_URL: ClassVar[str] = "https://oaipmh.arxiv.org/oai"
-
     PARAMS = {"verb": "ListRecords"}
 
     @staticmethod
@@ -90,9 +88,10 @@ class ArxivPaperMetadataFetcher(PaperMetadataFetcher[ArxivPaperMetadataRecord]):
             )
 
             response = await self._client.get(
-                self.BASE_URL, params=params, timeout=self.TIMEOUT
+                get_oai_url(), params=params, timeout=self.TIMEOUT
             )
             response.raise_for_status()
+            self.pages_fetched += 1
             resumption_token = self._paper_parser.get_resumption_token(response.text)
             records = self._paper_parser.parse(response.text, subject_code, domain_code)
             for record in records:
@@ -19,7 +19,7 @@ class ArxivPaperMetadataNormalize(PaperMetadataNormalizer[ArxivPaperMetadataReco
         Returns:
             PaperMetadataRecord: The normalized paper metadata object.
         """
-        return PaperMetadataRecord(
+        record = PaperMetadataRecord(
             abstract=paper_record.abstract,
             authors=paper_record.authors,
             domain_code=paper_record.domain_code,
@@ -30,3 +30,5 @@ class ArxivPaperMetadataNormalize(PaperMetadataNormalizer[ArxivPaperMetadataReco
             source=ArxivPaperMetadataRecord.DATASOURCE_NAME,
             title=paper_record.title,
         )
+        record.content_hash = record.compute_content_hash()
+        return record
@@ -1,7 +1,7 @@
 from typing import AsyncIterator, ClassVar, Dict, Optional
 import xml.etree.ElementTree as ET
 
-from common.datasources.arxiv.const import DATASOURCE_NAME, NAMESPACE
+from common.datasources.arxiv.const import DATASOURCE_NAME, NAMESPACE, get_oai_url
 from common.datasources.base import SubjectsFetcher
 from common.datasources.schema import DomainSchema, SubjectSchema
 from common.utils.logger import LOG_MODULES, LoggerManager
@@ -15,7 +15,6 @@ class ArxivSubjectsFetcher(SubjectsFetcher):
 
     PARAMS = {"verb": "ListSets"}
     TIMEOUT = 30
-    URL = "https://oaipmh.arxiv.org/oai"
 
     async def fetch_subjects(self) -> AsyncIterator[SubjectSchema]:
         """Fetches all subjects supported by the arXiv datasource.
@@ -32,7 +31,7 @@ class ArxivSubjectsFetcher(SubjectsFetcher):
         subject_counts = 0
 
         response = await self._client.get(
-            self.URL, params=self.PARAMS, timeout=self.TIMEOUT
+            get_oai_url(), params=self.PARAMS, timeout=self.TIMEOUT
         )
         response.raise_for_status()
 
@@ -120,6 +120,7 @@ class PaperMetadataFetcher(Generic[PaperSchemaType], ABC):
         """
         self._client = client
         self._paper_parser = paper_parser
+        self.pages_fetched = 0
 
     @staticmethod
     @abstractmethod
@@ -163,6 +164,11 @@ class PaperMetadataIngestion(Generic[PaperSchemaType], ABC):
         self._fetcher = fetcher
         self._normalizer = normalizer
 
+    @property
+    def pages_fetched(self) -> int:
+        """Returns the number of pages requested from the datasource so far."""
+        return self._fetcher.pages_fetched
+
     @abstractmethod
     async def run(
         self, subject: str, from_date: datetime, until_date: datetime
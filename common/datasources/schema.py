@@ -1,5 +1,7 @@
 from datetime import date
-from typing import ClassVar, List
+import hashlib
+import json
+from typing import ClassVar, List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -24,6 +26,9 @@ class SubjectSchema(BaseModel):
 class PaperMetadataRecord(BaseModel):
     abstract: str = Field(description="Abstract of the paper")
     authors: List[str] = Field(description="Authors of the paper")
+    content_hash: Optional[str] = Field(
+        default=None, description="SHA-256 hash of the paper content"
+    )
     domain_code: str = Field(description="High-level academic domain")
     paper_id: str = Field(description="Paper ID or URL")
     primary_subject_code: str = Field(description="Primary subject within the domain")
@@ -33,3 +38,23 @@ class PaperMetadataRecord(BaseModel):
     )
     source: str = Field(description="Source of the paper")
     title: str = Field(description="Title of the paper")
+
+    def compute_content_hash(self) -> str:
+        """Returns the SHA-256 hash of the paper content.
+
+        The hash covers the title, abstract, authors, subjects and publish date,
+        so any change to them produces a different hash.
+
+        Returns:
+            str: The hex digest of the content hash.
+        """
+        content = {
+            "abstract": self.abstract,
+            "authors": self.authors,
+            "primary_subject_code": self.primary_subject_code,
+            "publish_date": self.publish_date.isoformat(),
+            "secondary_subject_codes": sorted(self.secondary_subject_codes),
+            "title": self.title,
+        }
+        payload = json.dumps(content, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -0,0 +1,3 @@
+from .paper_export_service import PaperExportService
+
+__all__ = ["PaperExportService"]
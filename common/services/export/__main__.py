@@ -0,0 +1,46 @@
+"""Exports papers to Parquet files.
+
+Usage:
+    python -m common.services.export --output-dir ./export [--full]
+"""
+
+import argparse
+import asyncio
+
+from common.database.postgres.repositories import DatabaseRepository
+from common.database.postgres.session import (
+    get_session_factory,
+    init_database,
+    shutdown_database,
+)
+from common.services.export import PaperExportService
+from common.utils.env import load_environment_variables
+
+
+async def main(args: argparse.Namespace) -> int:
+    """Runs the paper export against the read replica when configured."""
+    init_database()
+    try:
+        service = PaperExportService(
+            DatabaseRepository(),
+            get_session_factory(read_only=True),
+            args.output_dir,
+            chunk_size=args.chunk_size,
+        )
+        return await service.run(full=args.full)
+    finally:
+        await shutdown_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output-dir", required=True, help="Export root directory")
+    parser.add_argument(
+        "--chunk-size", type=int, default=10_000, help="Papers read per query"
+    )
+    parser.add_argument(
+        "--full", action="store_true", help="Ignore the watermark and export all"
+    )
+    load_environment_variables()
+    exported = asyncio.run(main(parser.parse_args()))
+    print(f"Exported {exported} papers")
@@ -0,0 +1,162 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import Row, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from common.database.postgres.repositories import DatabaseRepository
+from common.utils.logger import LoggerManager
+
+logger = LoggerManager.get_logger(__name__)
+
+WATERMARK_FILE = "_watermark.json"
+
+# Columns written to the Parquet files. The datasource and the publish month
+# are Hive partition keys, encoded in the file paths.
+PAPER_EXPORT_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("paper_identifier", pa.string()),
+        ("domain", pa.string()),
+        ("title", pa.string()),
+        ("abstract", pa.string()),
+        ("publish_date", pa.date32()),
+        ("main_author", pa.string()),
+        ("authors", pa.list_(pa.string())),
+        ("subjects", pa.list_(pa.string())),
+        ("primary_subject", pa.string()),
+        ("content_hash", pa.string()),
+        ("created_at", pa.timestamp("us", tz="UTC")),
+        ("updated_at", pa.timestamp("us", tz="UTC")),
+    ]
+)
+
+
+class PaperExportService:
+    """Exports papers to Parquet files partitioned by datasource and month.
+
+    Papers are read in (updated_at, id) keyset-paginated chunks, so memory
+    stays bounded by the chunk size. The key of the last exported paper is
+    kept as a watermark next to the files, and each run only appends the
+    papers created or updated since. An updated paper is written again, so
+    readers keep the row with the latest updated_at per id.
+
+    Files are laid out as
+    `<output_dir>/papers/datasource=<name>/publish_month=<YYYY-MM>/part-*.parquet`.
+    """
+
+    def __init__(
+        self,
+        database_repository: DatabaseRepository,
+        db_session_factory: async_sessionmaker[AsyncSession],
+        output_dir: str,
+        chunk_size: int = 10_000,
+        safety_lag: timedelta = timedelta(minutes=5),
+    ):
+        """Initializes a PaperExportService object.
+
+        Args:
+            database_repository (DatabaseRepository): The database repository.
+            db_session_factory (async_sessionmaker): The async session factory,
+                preferably bound to a read replica.
+            output_dir (str): The root directory of the export.
+            chunk_size (int): The number of papers read per query.
+            safety_lag (timedelta): Papers updated within this lag before the
+                run are left for the next run, so transactions that commit late
+                with an earlier updated_at are not skipped.
+        """
+        self._db = database_repository
+        self._db_session_factory = db_session_factory
+        self._papers_dir = os.path.join(output_dir, "papers")
+        self._chunk_size = chunk_size
+        self._safety_lag = safety_lag
+
+    async def run(self, full: bool = False) -> int:
+        """Exports the papers updated since the last run.
+
+        Args:
+            full (bool): Whether to ignore the watermark and export all papers.
+
+        Returns:
+            int: The number of exported papers.
+        """
+        after = None if full else self._load_watermark()
+        async with self._db_session_factory() as session:
+            db_now = (await session.execute(select(func.now()))).scalar_one()
+        until = db_now - self._safety_lag
+        run_id = until.strftime("%Y%m%dT%H%M%S")
+
+        logger.info(
+            "Start paper export",
+            extra={"after": after, "until": until, "full": full},
+        )
+        exported = 0
+        chunk_index = 0
+        while True:
+            async with self._db_session_factory() as session:
+                rows = await self._db.paper.get_export_page(
+                    until, session, after=after, limit=self._chunk_size
+                )
+            if not rows:
+                break
+
+            self._write_chunk(rows, f"{run_id}-{chunk_index:05d}")
+            after = (rows[-1].updated_at, rows[-1].id)
+            self._save_watermark(after)
+            exported += len(rows)
+            chunk_index += 1
+            if len(rows) < self._chunk_size:
+                break
+
+        logger.info("Paper export completed", extra={"exported": exported})
+        return exported
+
+    def _write_chunk(self, rows: List[Row], part_name: str):
+        """Writes a chunk of papers, one file per datasource and month.
+
+        Args:
+            rows (List[Row]): The rows returned by `get_export_page`.
+            part_name (str): The file name suffix, unique per chunk.
+        """
+        partitions: Dict[Tuple[str, str], List[Dict[str, Any]]] = defaultdict(list)
+        for row in rows:
+            record = row._asdict()
+            datasource = str(record.pop("datasource"))
+            record["id"] = str(record["id"])
+            partitions[(datasource, f"{row.publish_date:%Y-%m}")].append(record)
+
+        for (datasource, month), records in partitions.items():
+            directory = os.path.join(
+                self._papers_dir,
+                f"datasource={datasource}",
+                f"publish_month={month}",
+            )
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f"part-{part_name}.parquet")
+            table = pa.Table.from_pylist(records, schema=PAPER_EXPORT_SCHEMA)
+            pq.write_table(table, f"{path}.tmp", compression="zstd")
+            os.replace(f"{path}.tmp", path)
+
+    def _load_watermark(self) -> Optional[Tuple[datetime, UUID]]:
+        """Returns the (updated_at, id) of the last exported paper, if any."""
+        path = os.path.join(self._papers_dir, WATERMARK_FILE)
+        if not os.path.exists(path):
+            return None
+        with open(path) as file:
+            watermark = json.load(file)
+        return datetime.fromisoformat(watermark["updated_at"]), UUID(watermark["id"])
+
+    def _save_watermark(self, watermark: Tuple[datetime, UUID]):
+        """Atomically stores the (updated_at, id) of the last exported paper."""
+        os.makedirs(self._papers_dir, exist_ok=True)
+        path = os.path.join(self._papers_dir, WATERMARK_FILE)
+        updated_at, paper_id = watermark
+        with open(f"{path}.tmp", "w") as file:
+            json.dump({"updated_at": updated_at.isoformat(), "id": str(paper_id)}, file)
+        os.replace(f"{path}.tmp", path)
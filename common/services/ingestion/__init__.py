@@ -1,4 +1,13 @@
+from .ingestion_worker import IngestionWorker
+from .paper_backfill_service import PaperBackfillService
 from .paper_metadata_ingestion_service import PaperMetadataIngestionService
+from .shared_rate_limiter import SharedRateLimiter
 from .subjects_ingestion_service import SubjectsIngestionService
 
-__all__ = ["SubjectsIngestionService", "PaperMetadataIngestionService"]
+__all__ = [
+    "IngestionWorker",
+    "PaperBackfillService",
+    "SharedRateLimiter",
+    "SubjectsIngestionService",
+    "PaperMetadataIngestionService",
+]
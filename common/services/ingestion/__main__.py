@@ -0,0 +1,359 @@
+"""Runs the ingestion in a single process, without Airflow.
+
+Usage:
+    python -m common.services.ingestion subjects [--datasource arxiv]
+    python -m common.services.ingestion papers --from 2024-01-01 --until 2024-01-31
+        (--subjects cs.AI cs.LG | --domains cs) [--window-days 10]
+        [--concurrency 8] [--requests-per-second 3] [--ignore-watermark]
+        [--backend ray [--ray-address auto] [--actors 16]]
+    python -m common.services.ingestion worker [--concurrency 8]
+        [--exit-when-empty]
+
+The worker mode drains the ingestion work queue filled by the Airflow DAG;
+start it on as many processes and nodes as needed. The ray backend of the
+papers mode spreads the subjects over Ray actors, one per CPU of a local
+single-node cluster unless --ray-address and --actors are given, and no more
+than POSTGRES_CONNECTION_BUDGET (64 if unset) can serve; it needs the ray
+dependency group.
+
+The exit status is 1 if any window or unit failed.
+
+Export ARXIV_OAI_URL to harvest from a mock server instead of arXiv, and
+set DATASOURCE_REQUESTS_PER_SECOND to 0 to lift the shared request limit.
+"""
+
+import argparse
+import asyncio
+from datetime import date
+import signal
+import sys
+import time
+from typing import List, Tuple
+from uuid import UUID
+
+from httpx import AsyncClient, Limits, Request, Timeout
+
+from common.constants import DataSource
+from common.database.postgres.models import Datasource
+from common.database.postgres.repositories import DatabaseRepository
+from common.database.postgres.session import (
+    get_session_factory,
+    init_database,
+    shutdown_database,
+)
+from common.datasources.factories import (
+    PaperMetadataIngestionFactory,
+    SubjectsFetcherFactory,
+)
+from common.services.ingestion import (
+    IngestionWorker,
+    PaperMetadataIngestionService,
+    SharedRateLimiter,
+    SubjectsIngestionService,
+)
+from common.services.ingestion.harvest_windows import split_date_range
+from common.services.ingestion.shared_rate_limiter import rate_limit_hooks
+from common.utils.env import load_environment_variables
+from common.utils.rate_limiter import AsyncRateLimiter
+
+
+class _RequestCounter:
+    """Counts the HTTP requests sent by a client."""
+
+    def __init__(self):
+        """Initializes a _RequestCounter object."""
+        self.count = 0
+
+    async def on_request(self, request: Request):
+        """Counts a request; use as an httpx request event hook."""
+        self.count += 1
+
+
+def _http_client(args: argparse.Namespace, counter: _RequestCounter) -> AsyncClient:
+    """Returns the HTTP client of a run.
+
+    Requests wait for the --requests-per-second limit of this run, if any,
+    and for the limit shared with the Airflow tasks, if configured.
+    """
+    local_rate_limiter = None
+    if args.requests_per_second:
+        local_rate_limiter = AsyncRateLimiter(args.requests_per_second)
+    return AsyncClient(
+        timeout=Timeout(30),
+        limits=Limits(max_connections=args.concurrency),
+        event_hooks=rate_limit_hooks(
+            local_rate_limiter,
+            SharedRateLimiter.from_env(get_session_factory()),
+            counter,
+        ),
+    )
+
+
+async def _get_datasource_uuid(
+    db: DatabaseRepository, datasource: DataSource, create: bool = False
+) -> UUID:
+    """Returns the UUID of a datasource, creating it if requested.
+
+    Raises:
+        ValueError: If the datasource does not exist and is not created.
+    """
+    async with get_session_factory()() as session:
+        async with session.begin():
+            datasource_uuid = await db.datasource.get_uuid_by_name(datasource, session)
+            if datasource_uuid is None and create:
+                created = await db.datasource.create(
+                    Datasource(name=datasource), session
+                )
+                datasource_uuid = created.id
+    if datasource_uuid is None:
+        raise ValueError(
+            f"Datasource {datasource} not found, run the subjects mode first"
+        )
+    return datasource_uuid
+
+
+async def _get_subject_uuids(
+    db: DatabaseRepository, datasource_uuid: UUID, args: argparse.Namespace
+) -> List[Tuple[str, UUID]]:
+    """Returns the (code, UUID) of the subjects given by code or by domain.
+
+    Raises:
+        ValueError: If a subject or domain code is not found.
+    """
+    async with get_session_factory(read_only=True)() as session:
+        subjects = []
+        if args.subjects:
+            subjects = await db.subject.get_by_codes(args.subjects, session)
+            missing = set(args.subjects) - {subject.code for subject in subjects}
+            if missing:
+                raise ValueError(f"Subjects not found: {sorted(missing)}")
+        for domain_code in args.domains or []:
+            domain = await db.domain.get_by_code(domain_code, datasource_uuid, session)
+            if domain is None:
+                raise ValueError(f"Domain {domain_code} not found")
+            subjects.extend(await db.subject.get_by_domain_uuid(domain.id, session))
+    return sorted({(subject.code, subject.id) for subject in subjects})
+
+
+async def ingest_subjects(args: argparse.Namespace) -> Tuple[str, int]:
+    """Fetches the subjects of a datasource and stores the new ones.
+
+    Returns:
+        Tuple[str, int]: The throughput summary and the number of failures,
+            always 0 since any error is raised.
+    """
+    db = DatabaseRepository()
+    datasource_uuid = await _get_datasource_uuid(db, args.datasource, create=True)
+    counter = _RequestCounter()
+    fetched = created = 0
+    started = time.monotonic()
+    async with _http_client(args, counter) as http_client:
+        service = SubjectsIngestionService(get_session_factory())
+        fetcher = SubjectsFetcherFactory.get(
+            args.datasource, datasource_uuid, http_client
+        )
+        async for subject in fetcher.fetch_subjects():
+            fetched += 1
+            created += await service.ingest_subject(subject)
+    elapsed = time.monotonic() - started
+    summary = (
+        f"Subjects: {fetched} fetched, {created} created\n"
+        f"Requests: {counter.count}\n"
+        f"Elapsed: {elapsed:.1f} s"
+    )
+    return summary, 0
+
+
+async def ingest_papers(args: argparse.Namespace) -> Tuple[str, int]:
+    """Harvests the papers of the subjects over the date range.
+
+    Each subject's range is cut into windows of `--window-days` days. With
+    the local backend, all windows run in this process, `--concurrency`
+    subjects at a time, through `PaperMetadataIngestionService.run_subjects`.
+    With the ray backend, each Ray actor does the same for its share of the
+    subjects.
+
+    Returns:
+        Tuple[str, int]: The throughput summary and the number of failed
+            windows.
+    """
+    db = DatabaseRepository()
+    datasource_uuid = await _get_datasource_uuid(db, args.datasource)
+    subjects = await _get_subject_uuids(db, datasource_uuid, args)
+    windows = [
+        (datasource_uuid, subject_uuid, from_date, until_date)
+        for _, subject_uuid in subjects
+        for from_date, until_date in split_date_range(
+            args.from_date, args.until_date, args.window_days
+        )
+    ]
+    counter = None
+    started = time.monotonic()
+    if args.backend == "ray":
+        from common.services.ingestion.ray_backend import run_on_ray
+
+        results = await run_on_ray(
+            windows,
+            actor_count=args.actors,
+            max_concurrency=args.concurrency,
+            track_watermark=not args.ignore_watermark,
+            requests_per_second=args.requests_per_second,
+            address=args.ray_address,
+        )
+    else:
+        counter = _RequestCounter()
+        async with _http_client(args, counter) as http_client:
+            service = PaperMetadataIngestionService(
+                PaperMetadataIngestionFactory(), db, get_session_factory(), http_client
+            )
+            results = await service.run_subjects(
+                windows,
+                max_concurrency=args.concurrency,
+                track_watermark=not args.ignore_watermark,
+            )
+    elapsed = time.monotonic() - started
+
+    failed = [result for result in results if isinstance(result, Exception)]
+    fetched = sum(result for result in results if not isinstance(result, Exception))
+    summary = (
+        f"Subjects: {len(subjects)}\n"
+        f"Windows: {len(windows) - len(failed)} succeeded, {len(failed)} failed\n"
+        f"Papers fetched: {fetched}\n"
+        f"Elapsed: {elapsed:.1f} s\n"
+        f"Throughput: {fetched / max(elapsed, 1e-9):.1f} papers/s"
+    )
+    if counter is not None:
+        summary += (
+            f", {counter.count / max(elapsed, 1e-9):.2f} requests/s\n"
+            f"Requests: {counter.count}"
+        )
+    return summary, len(failed)
+
+
+async def drain_queue(args: argparse.Namespace) -> Tuple[str, int]:
+    """Runs the units of the ingestion work queue until stopped.
+
+    SIGINT and SIGTERM stop claiming units; the worker exits once the
+    running ones finish.
+
+    Returns:
+        Tuple[str, int]: The throughput summary and the number of failed
+            unit runs.
+    """
+    db = DatabaseRepository()
+    counter = _RequestCounter()
+    started = time.monotonic()
+    async with _http_client(args, counter) as http_client:
+        service = PaperMetadataIngestionService(
+            PaperMetadataIngestionFactory(), db, get_session_factory(), http_client
+        )
+        worker = IngestionWorker(
+            service, db, get_session_factory(), concurrency=args.concurrency
+        )
+        loop = asyncio.get_running_loop()
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signal_number, worker.stop)
+        succeeded = await worker.run(exit_when_empty=args.exit_when_empty)
+    elapsed = time.monotonic() - started
+    summary = (
+        f"Worker {worker.worker_id}: {succeeded} units succeeded,"
+        f" {worker.failed} failed\n"
+        f"Requests: {counter.count}\n"
+        f"Elapsed: {elapsed:.1f} s"
+    )
+    return summary, worker.failed
+
+
+async def main(args: argparse.Namespace) -> Tuple[str, int]:
+    """Runs the ingestion mode against the configured database.
+
+    Returns:
+        Tuple[str, int]: The throughput summary and the number of failures.
+    """
+    init_database()
+    try:
+        if args.mode == "subjects":
+            return await ingest_subjects(args)
+        if args.mode == "worker":
+            return await drain_queue(args)
+        return await ingest_papers(args)
+    finally:
+        await shutdown_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "mode", choices=["subjects", "papers", "worker"], help="What to ingest"
+    )
+    parser.add_argument(
+        "--datasource",
+        type=DataSource,
+        default=DataSource.ARXIV,
+        help="Datasource name",
+    )
+    targets = parser.add_argument_group("papers mode")
+    targets.add_argument("--subjects", nargs="+", help="Subject codes to harvest")
+    targets.add_argument(
+        "--domains", nargs="+", help="Domain codes whose subjects to harvest"
+    )
+    targets.add_argument(
+        "--from", dest="from_date", type=date.fromisoformat, help="First day"
+    )
+    targets.add_argument(
+        "--until", dest="until_date", type=date.fromisoformat, help="Last day"
+    )
+    targets.add_argument(
+        "--window-days", type=int, default=10, help="Days per unit of work"
+    )
+    targets.add_argument(
+        "--ignore-watermark",
+        action="store_true",
+        help="Harvest days below the subject watermarks, and leave them as is",
+    )
+    targets.add_argument(
+        "--backend",
+        choices=["local", "ray"],
+        default="local",
+        help="Run the windows in this process or on Ray actors",
+    )
+    targets.add_argument(
+        "--ray-address",
+        default=None,
+        help="Ray cluster to connect to, a local one is started if unset",
+    )
+    targets.add_argument(
+        "--actors",
+        type=int,
+        default=None,
+        help="Ray actors to start, one per CPU of the cluster if unset, within"
+        " the connection budget",
+    )
+    worker_options = parser.add_argument_group("worker mode")
+    worker_options.add_argument(
+        "--exit-when-empty",
+        action="store_true",
+        help="Exit once the queue has no claimable unit instead of polling",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=4, help="Subjects ingested at once"
+    )
+    parser.add_argument(
+        "--requests-per-second",
+        type=float,
+        default=None,
+        help="Limit of requests to the datasource across all actors, unlimited"
+        " if unset",
+    )
+    arguments = parser.parse_args()
+    if arguments.mode == "papers" and not (
+        arguments.from_date
+        and arguments.until_date
+        and (arguments.subjects or arguments.domains)
+    ):
+        parser.error("papers mode needs --from, --until and --subjects or --domains")
+
+    load_environment_variables()
+    summary, failures = asyncio.run(main(arguments))
+    print(summary)
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,82 @@
+from collections import OrderedDict
+import os
+from threading import Lock
+from typing import Optional
+from uuid import UUID
+
+_author_cache: Optional["AuthorCache"] = None
+
+
+class AuthorCache:
+    """Bounded LRU cache of canonical author name to author UUID.
+
+    Authors are never deleted by ingestion, so cached UUIDs stay valid for the
+    lifetime of the process.
+
+    Notes:
+        This class is thread-safe.
+    """
+
+    def __init__(self, max_size: int = 100_000):
+        """Initializes an AuthorCache object.
+
+        Args:
+            max_size (int): The maximum number of cached authors.
+        """
+        self._max_size = max_size
+        self._entries: "OrderedDict[str, UUID]" = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Returns the number of cached authors."""
+        return len(self._entries)
+
+    def get(self, canonical_name: str) -> Optional[UUID]:
+        """Returns the cached author UUID for a canonical name.
+
+        Args:
+            canonical_name (str): The canonical author name.
+
+        Returns:
+            Optional[UUID]: The author UUID, or None if not cached.
+        """
+        with self._lock:
+            author_uuid = self._entries.get(canonical_name)
+            if author_uuid is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(canonical_name)
+            self.hits += 1
+            return author_uuid
+
+    def put(self, canonical_name: str, author_uuid: UUID):
+        """Caches the author UUID for a canonical name.
+
+        Args:
+            canonical_name (str): The canonical author name.
+            author_uuid (UUID): The author UUID.
+        """
+        with self._lock:
+            self._entries[canonical_name] = author_uuid
+            self._entries.move_to_end(canonical_name)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Clears the cache."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def get_author_cache() -> AuthorCache:
+    """Returns the process-wide AuthorCache, creating one if not initialized."""
+    global _author_cache
+    if _author_cache is None:
+        _author_cache = AuthorCache(
+            max_size=int(os.getenv("AUTHOR_CACHE_SIZE", 100_000)),
+        )
+    return _author_cache
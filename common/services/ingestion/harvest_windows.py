@@ -0,0 +1,91 @@
+from datetime import date, timedelta
+import math
+from typing import List, Tuple
+
+
+def split_date_range(
+    start: date, end: date, window_days: int
+) -> List[Tuple[date, date]]:
+    """Splits a date range into consecutive windows.
+
+    Args:
+        start (date): The first day of the range.
+        end (date): The last day of the range, inclusive.
+        window_days (int): The number of days per window.
+
+    Returns:
+        List[Tuple[date, date]]: The (from date, until date) of each window,
+            both inclusive.
+
+    Examples:
+        >>> windows = split_date_range(date(2024, 1, 1), date(2024, 1, 25), 10)
+        >>> [(from_date.day, until_date.day) for from_date, until_date in windows]
+        [(1, 10), (11, 20), (21, 25)]
+    """
+    if window_days < 1:
+        raise ValueError("window_days must be positive")
+
+    windows = []
+    from_date = start
+    while from_date <= end:
+        until_date = min(from_date + timedelta(days=window_days - 1), end)
+        windows.append((from_date, until_date))
+        from_date = until_date + timedelta(days=1)
+    return windows
+
+
+def harvest_window_days(density: float, target_records: int, max_days: int) -> int:
+    """Returns the number of days to harvest per unit of work for a subject.
+
+    Args:
+        density (float): The expected number of papers per day.
+        target_records (int): The number of papers a unit of work targets.
+        max_days (int): The number of days returned for sparse subjects.
+
+    Returns:
+        int: The window size in days, between 1 and max_days.
+
+    Examples:
+        >>> harvest_window_days(450.0, 2000, 11)
+        4
+        >>> harvest_window_days(3.0, 2000, 11)
+        11
+        >>> harvest_window_days(5000.0, 2000, 11)
+        1
+    """
+    if density <= 0:
+        return max_days
+    return max(1, min(max_days, math.floor(target_records / density)))
+
+
+def plan_harvest_windows(
+    start: date, range_days: int, density: float, target_records: int
+) -> List[Tuple[date, date, float]]:
+    """Splits the harvest range of a subject into units of similar size.
+
+    The range covers `range_days` days after the start, both ends included,
+    and is cut into windows expected to hold about `target_records` papers.
+
+    Args:
+        start (date): The first day to harvest.
+        range_days (int): The number of days after the start to harvest.
+        density (float): The expected number of papers per day.
+        target_records (int): The number of papers a unit of work targets.
+
+    Returns:
+        List[Tuple[date, date, float]]: The (from date, until date, expected
+            paper count) of each window.
+
+    Examples:
+        >>> windows = plan_harvest_windows(date(2024, 1, 1), 10, 600.0, 2000)
+        >>> [(f.day, u.day, expected) for f, u, expected in windows]
+        [(1, 3, 1800.0), (4, 6, 1800.0), (7, 9, 1800.0), (10, 11, 1200.0)]
+        >>> len(plan_harvest_windows(date(2024, 1, 1), 10, 2.0, 2000))
+        1
+    """
+    end = start + timedelta(days=range_days)
+    window_days = harvest_window_days(density, target_records, range_days + 1)
+    return [
+        (from_date, until_date, density * ((until_date - from_date).days + 1))
+        for from_date, until_date in split_date_range(start, end, window_days)
+    ]
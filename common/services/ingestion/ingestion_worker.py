@@ -0,0 +1,246 @@
+import asyncio
+from datetime import timedelta
+import os
+import socket
+from typing import Dict, Optional
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from common.database.postgres.models import IngestionWorkUnit
+from common.database.postgres.repositories import DatabaseRepository
+from common.utils.logger import LoggerManager
+
+from .paper_metadata_ingestion_service import PaperMetadataIngestionService
+
+logger = LoggerManager.get_logger(__name__)
+
+
+class IngestionWorker:
+    """Drains the ingestion work queue.
+
+    The worker claims up to `concurrency` units at a time and runs them
+    through the ingestion service. While units run, it heartbeats them every
+    `heartbeat_interval`; a worker that dies stops heartbeating, and its
+    units are claimed again by another worker once `stale_after` elapsed.
+    Any number of workers, in any number of processes or nodes, can drain
+    the same queue.
+    """
+
+    def __init__(
+        self,
+        ingestion_service: PaperMetadataIngestionService,
+        database_repository: DatabaseRepository,
+        db_session_factory: async_sessionmaker[AsyncSession],
+        concurrency: int = 4,
+        worker_id: Optional[str] = None,
+        heartbeat_interval: timedelta = timedelta(seconds=30),
+        stale_after: timedelta = timedelta(minutes=5),
+        max_attempts: int = 3,
+        poll_interval: timedelta = timedelta(seconds=5),
+    ):
+        """Initializes an IngestionWorker object.
+
+        Args:
+            ingestion_service (PaperMetadataIngestionService): The service
+                running the units.
+            database_repository (DatabaseRepository): The database repository.
+            db_session_factory (async_sessionmaker): The async session factory
+                of the primary database.
+            concurrency (int): The maximum number of units run at the same time.
+            worker_id (Optional[str]): The ID of the worker. Defaults to the
+                host name, process ID and a random suffix.
+            heartbeat_interval (timedelta): The interval between heartbeats.
+            stale_after (timedelta): The age of the heartbeat after which a
+                running unit is considered abandoned. Must be well above the
+                heartbeat interval.
+            max_attempts (int): The number of claims after which a failing
+                unit fails for good.
+            poll_interval (timedelta): The wait before polling an empty queue
+                again.
+        """
+        self._ingestion_service = ingestion_service
+        self._db = database_repository
+        self._db_session_factory = db_session_factory
+        self._concurrency = concurrency
+        self.worker_id = (
+            worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid4().hex[:8]}"
+        )
+        self._heartbeat_interval = heartbeat_interval
+        self._stale_after = stale_after
+        self._max_attempts = max_attempts
+        self._poll_interval = poll_interval
+        self.failed = 0
+        self._running: Dict[int, asyncio.Task] = {}
+        self._stopping = asyncio.Event()
+
+    def stop(self):
+        """Stops claiming units; `run` returns once the running ones finish."""
+        self._stopping.set()
+
+    async def run(self, exit_when_empty: bool = False) -> int:
+        """Claims and runs units until stopped.
+
+        Args:
+            exit_when_empty (bool): Whether to return once the queue has no
+                claimable unit and no unit is running.
+
+        Returns:
+            int: The number of units that succeeded. The number of units that
+                did not is kept in `failed`.
+        """
+        logger.info("Start ingestion worker", extra={"worker_id": self.worker_id})
+        heartbeat = asyncio.create_task(self._heartbeat())
+        succeeded = 0
+        try:
+            while not self._stopping.is_set():
+                claimed = await self._claim(self._concurrency - len(self._running))
+                for unit in claimed:
+                    self._running[unit.id] = asyncio.create_task(self._run_unit(unit))
+
+                if exit_when_empty and not self._running:
+                    break
+                if self._running:
+                    done, _ = await asyncio.wait(
+                        self._running.values(),
+                        timeout=self._poll_interval.total_seconds(),
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    succeeded += self._collect(done)
+                else:
+                    await self._wait_or_stop(self._poll_interval)
+
+            if self._running:
+                done, _ = await asyncio.wait(self._running.values())
+                succeeded += self._collect(done)
+        finally:
+            heartbeat.cancel()
+        logger.info(
+            "Ingestion worker stopped",
+            extra={
+                "worker_id": self.worker_id,
+                "succeeded": succeeded,
+                "failed": self.failed,
+            },
+        )
+        return succeeded
+
+    def _collect(self, done) -> int:
+        """Forgets the finished unit tasks and counts the succeeded ones."""
+        succeeded = 0
+        for unit_id, task in list(self._running.items()):
+            if task in done:
+                del self._running[unit_id]
+                if task.result():
+                    succeeded += 1
+                else:
+                    self.failed += 1
+        return succeeded
+
+    async def _wait_or_stop(self, timeout: timedelta):
+        """Waits for the timeout, or less if the worker is stopped."""
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout.total_seconds())
+        except asyncio.TimeoutError:
+            pass
+
+    async def _claim(self, limit: int):
+        """Claims up to limit units, after failing the abandoned ones."""
+        if limit <= 0:
+            return []
+        async with self._db_session_factory() as session:
+            async with session.begin():
+                expired = await self._db.ingestion_work_queue.expire_stale(
+                    self._stale_after, self._max_attempts, session
+                )
+                units = await self._db.ingestion_work_queue.claim(
+                    self.worker_id,
+                    limit,
+                    self._stale_after,
+                    self._max_attempts,
+                    session,
+                )
+        if expired:
+            logger.warning("Abandoned work units failed", extra={"count": expired})
+        return units
+
+    async def _run_unit(self, unit: IngestionWorkUnit) -> bool:
+        """Runs a unit and records its outcome.
+
+        An error recording the outcome is logged rather than raised, so it
+        does not stop the worker; the unit stays running until its claim
+        goes stale and is claimed again.
+
+        Returns:
+            bool: Whether the unit succeeded.
+        """
+        try:
+            paper_count = await self._ingestion_service.run(
+                unit.datasource_id, unit.subject_id, unit.from_date, unit.until_date
+            )
+        except Exception as e:
+            logger.error(
+                "Error running work unit",
+                exc_info=e,
+                extra={"unit_id": unit.id, "subject_uuid": unit.subject_id},
+            )
+            try:
+                async with self._db_session_factory() as session:
+                    async with session.begin():
+                        await self._db.ingestion_work_queue.fail(
+                            unit.id,
+                            self.worker_id,
+                            repr(e),
+                            self._max_attempts,
+                            session,
+                        )
+            except Exception as fail_error:
+                logger.error(
+                    "Error recording failed work unit",
+                    exc_info=fail_error,
+                    extra={"unit_id": unit.id},
+                )
+            return False
+
+        try:
+            async with self._db_session_factory() as session:
+                async with session.begin():
+                    owned = await self._db.ingestion_work_queue.complete(
+                        unit.id, self.worker_id, paper_count, session
+                    )
+        except Exception as e:
+            logger.error(
+                "Error recording succeeded work unit",
+                exc_info=e,
+                extra={"unit_id": unit.id},
+            )
+            return False
+        if not owned:
+            logger.warning(
+                "Work unit was reclaimed before it completed",
+                extra={"unit_id": unit.id, "worker_id": self.worker_id},
+            )
+        return owned
+
+    async def _heartbeat(self):
+        """Extends the claims of the running units until cancelled."""
+        while True:
+            await asyncio.sleep(self._heartbeat_interval.total_seconds())
+            unit_ids = list(self._running)
+            if not unit_ids:
+                continue
+            try:
+                async with self._db_session_factory() as session:
+                    async with session.begin():
+                        owned = await self._db.ingestion_work_queue.heartbeat(
+                            unit_ids, self.worker_id, session
+                        )
+            except Exception as e:
+                logger.warning("Error sending heartbeat", exc_info=e)
+                continue
+            lost = set(unit_ids) - set(owned)
+            if lost:
+                logger.warning(
+                    "Work units claimed by another worker",
+                    extra={"unit_ids": sorted(lost), "worker_id": self.worker_id},
+                )
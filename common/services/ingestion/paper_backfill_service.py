@@ -0,0 +1,219 @@
+import asyncio
+from datetime import date
+from typing import Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from common.database.postgres.models import PaperBackfillWindow
+from common.database.postgres.repositories import DatabaseRepository
+from common.utils.logger import LoggerManager
+
+from .harvest_windows import split_date_range
+from .paper_metadata_ingestion_service import PaperMetadataIngestionService
+
+logger = LoggerManager.get_logger(__name__)
+
+
+class PaperBackfillService:
+    """Harvests the history of a domain in resumable windows.
+
+    A backfill is planned as one window per subject and date range, stored
+    in the paper_backfill_windows table. Windows are harvested with bounded
+    parallelism and marked complete one by one, so an interrupted backfill
+    resumes with the pending windows. Once every window of a domain is
+    complete, the domain is handed over to daily ingestion.
+
+    Requests are not rate limited here; share a rate limited HTTP client
+    between the windows for that.
+    """
+
+    def __init__(
+        self,
+        database_repository: DatabaseRepository,
+        db_session_factory: async_sessionmaker[AsyncSession],
+        ingestion_service: Optional[PaperMetadataIngestionService] = None,
+    ):
+        """Initializes a PaperBackfillService object.
+
+        Args:
+            database_repository (DatabaseRepository): The database repository.
+            db_session_factory (async_sessionmaker): The async session factory.
+            ingestion_service (Optional[PaperMetadataIngestionService]): The
+                service harvesting the windows, only needed to run them.
+        """
+        self._db = database_repository
+        self._db_session_factory = db_session_factory
+        self._ingestion_service = ingestion_service
+
+    async def plan(
+        self,
+        datasource_uuid: UUID,
+        domain_uuid: UUID,
+        start: date,
+        end: date,
+        window_days: int = 30,
+    ) -> int:
+        """Plans the backfill of a domain over a date range.
+
+        Planning again is safe: windows already planned are kept with their
+        progress. The papers partitions covering the range are created.
+
+        Args:
+            datasource_uuid (UUID): The UUID of the datasource.
+            domain_uuid (UUID): The UUID of the domain.
+            start (date): The first day to harvest.
+            end (date): The last day to harvest, inclusive.
+            window_days (int): The number of days per window.
+
+        Returns:
+            int: The number of windows added.
+        """
+        async with self._db_session_factory() as session:
+            async with session.begin():
+                await self._db.paper.ensure_partitions(end, session, since=start)
+                subjects = await self._db.subject.get_by_domain_uuid(
+                    domain_uuid, session
+                )
+                windows = [
+                    {
+                        "datasource_id": datasource_uuid,
+                        "domain_id": domain_uuid,
+                        "subject_id": subject.id,
+                        "from_date": from_date,
+                        "until_date": until_date,
+                    }
+                    for subject in subjects
+                    for from_date, until_date in split_date_range(
+                        start, end, window_days
+                    )
+                ]
+                created = await self._db.paper_backfill_window.create_windows(
+                    windows, session
+                )
+
+        logger.info(
+            "Backfill planned",
+            extra={
+                "domain_uuid": domain_uuid,
+                "start": start,
+                "end": end,
+                "windows": len(windows),
+                "created": created,
+            },
+        )
+        return created
+
+    async def run(
+        self,
+        domain_uuid: Optional[UUID] = None,
+        max_concurrency: int = 4,
+        limit: Optional[int] = None,
+    ) -> Tuple[int, int]:
+        """Harvests the pending backfill windows, oldest first.
+
+        The papers of all the windows share the slots of the ingestion
+        service, sized from its connection pool, so the concurrency only
+        bounds the open harvests, not the pooled connections.
+
+        Args:
+            domain_uuid (Optional[UUID]): Only harvest the windows of this
+                domain.
+            max_concurrency (int): The maximum number of windows harvested at
+                the same time.
+            limit (Optional[int]): The maximum number of windows to harvest.
+
+        Returns:
+            Tuple[int, int]: The number of completed and failed windows.
+
+        Raises:
+            ValueError: If the service has no ingestion service.
+        """
+        if self._ingestion_service is None:
+            raise ValueError("An ingestion service is required to run windows")
+
+        async with self._db_session_factory() as session:
+            windows = await self._db.paper_backfill_window.get_pending(
+                session, domain_id=domain_uuid, limit=limit
+            )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _run_window(window: PaperBackfillWindow) -> bool:
+            async with semaphore:
+                try:
+                    paper_count = await self._ingestion_service.run(
+                        window.datasource_id,
+                        window.subject_id,
+                        window.from_date,
+                        window.until_date,
+                        track_watermark=False,
+                    )
+                    async with self._db_session_factory() as session:
+                        async with session.begin():
+                            await self._db.paper_backfill_window.complete(
+                                window.id, paper_count, session
+                            )
+                except Exception as e:
+                    logger.error(
+                        "Error harvesting backfill window",
+                        exc_info=e,
+                        extra={"window_id": window.id},
+                    )
+                    return False
+                return True
+
+        results = await asyncio.gather(*(_run_window(w) for w in windows))
+        completed = sum(results)
+        logger.info(
+            "Backfill windows harvested",
+            extra={"completed": completed, "failed": len(results) - completed},
+        )
+        return completed, len(results) - completed
+
+    async def hand_over(self, datasource_uuid: UUID, domain_uuid: UUID) -> bool:
+        """Hands a fully backfilled domain over to daily ingestion.
+
+        The domain ingestion state is activated with its cursor at the end of
+        the backfill, and the subject watermarks are moved to it, unless
+        already past it. A watermark before the start of the backfill is
+        kept, so daily ingestion still harvests the gap up to the backfill.
+
+        Args:
+            datasource_uuid (UUID): The UUID of the datasource.
+            domain_uuid (UUID): The UUID of the domain.
+
+        Returns:
+            bool: Whether the domain was handed over, False while windows are
+                pending.
+        """
+        async with self._db_session_factory() as session:
+            async with session.begin():
+                completed_range = (
+                    await self._db.paper_backfill_window.get_completed_range(
+                        domain_uuid, session
+                    )
+                )
+                if completed_range is None:
+                    return False
+                completed_from, completed_until = completed_range
+                handed_over = await self._db.paper_ingestion_state.activate(
+                    domain_uuid, datasource_uuid, completed_until, session
+                )
+                await self._db.subject_watermark.raise_for_domain(
+                    domain_uuid,
+                    datasource_uuid,
+                    completed_from,
+                    completed_until,
+                    session,
+                )
+
+        logger.info(
+            "Backfill handed over",
+            extra={
+                "domain_uuid": domain_uuid,
+                "cursor_date": completed_until,
+                "handed_over": handed_over,
+            },
+        )
+        return handed_over
@@ -1,19 +1,26 @@
 import asyncio
-from datetime import datetime
-from typing import ClassVar, List, Optional
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+import time
+from typing import ClassVar, Dict, Iterable, List, Optional, Tuple, Union
 from uuid import UUID
 
 from httpx import AsyncClient
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from common.constants import DataSource
-from common.database.postgres.models import Author, Domain, Paper, Subject
+from common.constants import DataSource, IngestionStatus
+from common.database.postgres.models import Domain, Paper, Subject
 from common.database.postgres.models.relationships import PaperSubject
 from common.database.postgres.repositories import DatabaseRepository
+from common.database.postgres.session import get_pool_capacity
 from common.datasources.factories import PaperMetadataIngestionFactory
 from common.datasources.schema import PaperMetadataRecord
+from common.utils.author_name import canonicalize_author_name
 from common.utils.logger import LoggerManager
+from common.utils.minhash import minhash_signature
+
+from .author_cache import AuthorCache, get_author_cache
 
 logger = LoggerManager.get_logger(__name__)
 
@@ -27,6 +34,8 @@ class PaperMetadataIngestionService:
         database_repository: DatabaseRepository,
         db_session_factory: async_sessionmaker[AsyncSession],
         http_client: AsyncClient,
+        author_cache: Optional[AuthorCache] = None,
+        max_papers_in_flight: Optional[int] = None,
     ):
         # TODO: paper_repository
         """Initializes a PaperMetadataIngestionService object.
@@ -38,64 +47,115 @@ class PaperMetadataIngestionService:
             db_session_factory (async_sessionmaker): The async session factory.
             http_client (AsyncClient): The httpx client to use for fetching paper
                 metadata.
+            author_cache (Optional[AuthorCache]): The canonical author name to
+                UUID cache. Defaults to the process-wide cache.
+            max_papers_in_flight (Optional[int]): The maximum number of papers
+                written at the same time, across all the subjects run by the
+                service. Each holds a pooled connection, so it defaults to half
+                the pool of the session factory, leaving the other half to the
+                ledger, watermark and rate limiter sessions of the subjects.
 
         """
         self._factory = factory
         self._db = database_repository
         self._http_client = http_client
         self._db_session_factory = db_session_factory
+        self._author_cache = author_cache or get_author_cache()
+        self._datasource_types: Dict[UUID, DataSource] = {}
+        if max_papers_in_flight is None:
+            pool_capacity = get_pool_capacity(db_session_factory)
+            max_papers_in_flight = (
+                self.INGESTION_BATCH_SIZE
+                if pool_capacity is None
+                else max(1, pool_capacity // 2)
+            )
+        self._paper_slots = asyncio.Semaphore(max_papers_in_flight)
 
     async def _get_or_create_paper(
         self,
         paper_metadata: PaperMetadataRecord,
-        authors: List[Author],
+        author_ids: List[UUID],
         domain: Domain,
         primary_subject: Subject,
         secondary_subjects: List[Subject],
         datasource_uuid: UUID,
         session: AsyncSession,
+        counts: Dict[Tuple[UUID, UUID, date], Tuple[int, int]],
     ) -> Optional[Paper]:
-        """Gets or creates a paper from the database.
+        """Creates a paper, or updates it if its content has changed.
+
+        Papers are compared by content hash, so an existing paper whose
+        content is unchanged costs a single indexed lookup. The near-duplicate
+        index is updated in the same transaction, and the changes to the
+        daily paper counters are added to counts for the caller to write.
 
         Args:
             paper_metadata (PaperMetadataRecord): The paper metadata to create.
-            authors (List[Author]): The authors of the paper.
+            author_ids (List[UUID]): The UUIDs of the paper authors.
             domain (Domain): The domain of the paper.
             primary_subject (Subject): The primary subject of the paper.
             secondary_subjects (List[Subject]): The secondary subjects of the paper.
             datasource_uuid (UUID): The UUID of the datasource.
             session (AsyncSession): The database session.
+            counts (Dict[Tuple[UUID, UUID, date], Tuple[int, int]]): The daily
+                paper counter deltas to update in place.
 
         Returns:
-            Paper: The paper found or created, or None.
+            Paper: The paper created or updated, or None if it is unchanged.
         """
-        paper = await self._db.paper.get_by_paper_id(paper_metadata.paper_id, session)
-        if paper:
+        content_hash = (
+            paper_metadata.content_hash or paper_metadata.compute_content_hash()
+        )
+        values = {
+            "abstract": paper_metadata.abstract,
+            "content_hash": content_hash,
+            "datasource_id": datasource_uuid,
+            "domain_id": domain.id,
+            "main_author_id": author_ids[0],
+            "paper_identifier": paper_metadata.paper_id,
+            "publish_date": paper_metadata.publish_date,
+            "title": paper_metadata.title,
+        }
+
+        existing = await self._db.paper.get_content_hash(
+            paper_metadata.paper_id, session
+        )
+        if existing is None:
+            paper = await self._db.paper.insert_if_absent(values, session)
+            if paper is None:
+                logger.debug(
+                    "Paper created concurrently",
+                    extra={"paper_id": paper_metadata.paper_id},
+                )
+                return None
+        elif existing.content_hash == content_hash:
             logger.debug(
                 "Paper already exists",
-                extra={"paper": paper.title, "paper_id": paper.id},
+                extra={"paper": paper_metadata.title, "paper_id": existing.id},
             )
             return None
-
-        paper = Paper(
-            abstract=paper_metadata.abstract,
-            datasource_id=datasource_uuid,
-            domain_id=domain.id,
-            main_author_id=authors[0].id,
-            paper_identifier=paper_metadata.paper_id,
-            publish_date=paper_metadata.publish_date,
-            title=paper_metadata.title,
-        )
-
-        paper = await self._db.paper.create(paper, session)
-        if paper is None:
-            logger.warning(
-                "Failed to create paper",
-                extra={
-                    "paper": paper_metadata.title,
-                },
+        else:
+            updated = await self._db.paper.update_if_changed(
+                existing.id, existing.publish_date, values, session
+            )
+            if not updated:
+                return None
+            logger.debug(
+                "Paper content changed",
+                extra={"paper": paper_metadata.title, "paper_id": existing.id},
+            )
+            removed_subjects = await self._db.paper_subject.delete_by_paper_uuid(
+                existing.id, session
+            )
+            self._count_subjects(
+                counts, datasource_uuid, existing.publish_date, removed_subjects, -1
+            )
+            await self._db.paper.delete_authors(existing.id, session)
+            paper = await session.get(
+                Paper,
+                {"id": existing.id, "publish_date": values["publish_date"]},
+                populate_existing=True,
             )
-            return None
 
         subjects = []
         subjects.append(
@@ -110,116 +170,423 @@ class PaperMetadataIngestionService:
             ]
         )
         await self._db.paper.add_subjects(subjects, session)
+        await self._db.paper.add_authors(paper.id, author_ids, session)
+        duplicate = await self._db.paper_fingerprint.index_paper(
+            paper.id,
+            minhash_signature(f"{paper_metadata.title} {paper_metadata.abstract}"),
+            session,
+        )
+        if duplicate is not None:
+            logger.debug(
+                "Paper is a near duplicate",
+                extra={
+                    "paper_id": paper.id,
+                    "duplicate_of_id": duplicate[0],
+                    "similarity": duplicate[1],
+                },
+            )
+        self._count_subjects(
+            counts,
+            datasource_uuid,
+            paper.publish_date,
+            [(s.subject_id, s.is_primary) for s in subjects],
+            1,
+        )
         await session.refresh(paper)
 
         return paper
 
+    @staticmethod
+    def _count_subjects(
+        counts: Dict[Tuple[UUID, UUID, date], Tuple[int, int]],
+        datasource_uuid: UUID,
+        publish_date: date,
+        subjects: Iterable[Tuple[UUID, bool]],
+        sign: int,
+    ):
+        """Adds the subjects of a paper to the paper counter deltas.
+
+        Args:
+            counts (Dict[Tuple[UUID, UUID, date], Tuple[int, int]]): The counter
+                deltas to update in place.
+            datasource_uuid (UUID): The UUID of the datasource.
+            publish_date (date): The publish date of the paper.
+            subjects (Iterable[Tuple[UUID, bool]]): The (subject UUID, is primary)
+                pairs of the paper.
+            sign (int): 1 to count the paper, -1 to uncount it.
+        """
+        for subject_id, is_primary in subjects:
+            key = (datasource_uuid, subject_id, publish_date)
+            paper_count, primary_paper_count = counts.get(key, (0, 0))
+            counts[key] = (
+                paper_count + sign,
+                primary_paper_count + sign * int(is_primary),
+            )
+
     async def _ingest_one(
         self,
         paper_metadata: PaperMetadataRecord,
         datasource_uuid: UUID,
         datasource_type: DataSource,
+        outcomes: Optional[Counter] = None,
+        cursor_dates: Optional[Dict[UUID, date]] = None,
+        paper_counts: Optional[Dict[Tuple[UUID, UUID, date], Tuple[int, int]]] = None,
     ) -> Optional[Paper]:
         """Orchestrates the ingestion of a paper.
 
+        The authors are resolved before the paper transaction opens, so a
+        paper never holds two pooled connections at once, and the paper waits
+        for one of the `max_papers_in_flight` slots of the service first.
+
         Args:
             paper_metadata (PaperMetadataRecord): The paper metadata to ingest.
             datasource_uuid (UUID): The UUID of the datasource.
             datasource_type (DataSource): The type of the datasource.
-            session (AsyncSession): The database session.
+            outcomes (Optional[Counter]): The outcome counters to update: the
+                paper counts as "inserted" if created or updated, "skipped" if
+                already up to date, and "failed" otherwise.
+            cursor_dates (Optional[Dict[UUID, date]]): The latest publish date
+                of the committed papers per domain UUID, updated once the paper
+                is committed. The caller advances the domain cursors from it.
+            paper_counts (Optional[Dict[Tuple[UUID, UUID, date], Tuple[int, int]]]):
+                The daily paper counter deltas, updated once the paper is
+                committed. The caller writes them with `_flush_paper_counts`.
 
         Returns:
             Optional[Paper]: The ingested paper, or None if the ingestion failed.
         """
-        async with self._db_session_factory() as session:
-            async with session.begin():
-                domain = await self._get_domain(
-                    paper_metadata.domain_code,
-                    datasource_uuid,
-                    datasource_type,
-                    session,
+        outcome = "failed"
+        counts: Dict[Tuple[UUID, UUID, date], Tuple[int, int]] = {}
+        try:
+            async with self._paper_slots:
+                author_ids = await self._get_or_create_authors(
+                    paper_metadata.authors, datasource_uuid, datasource_type
                 )
-                if domain is None:
+                if not author_ids:
                     return None
 
-                # Get subjects
-                subject = await self._get_subject(
-                    paper_metadata.primary_subject_code,
-                    datasource_uuid,
-                    datasource_type,
-                    session,
+                async with self._db_session_factory() as session:
+                    async with session.begin():
+                        domain = await self._get_domain(
+                            paper_metadata.domain_code,
+                            datasource_uuid,
+                            datasource_type,
+                            session,
+                        )
+                        if domain is None:
+                            return None
+
+                        # Get subjects
+                        subject = await self._get_subject(
+                            paper_metadata.primary_subject_code,
+                            datasource_uuid,
+                            datasource_type,
+                            session,
+                        )
+                        if subject is None:
+                            return None
+
+                        secondary_subjects = await self._db.subject.get_by_codes(
+                            paper_metadata.secondary_subject_codes, session
+                        )
+
+                        paper = await self._get_or_create_paper(
+                            paper_metadata,
+                            author_ids,
+                            domain,
+                            subject,
+                            secondary_subjects,
+                            datasource_uuid,
+                            session,
+                            counts,
+                        )
+            if paper_counts is not None:
+                for key, (paper_count, primary_paper_count) in counts.items():
+                    total, primary_total = paper_counts.get(key, (0, 0))
+                    paper_counts[key] = (
+                        total + paper_count,
+                        primary_total + primary_paper_count,
+                    )
+            if paper is not None and cursor_dates is not None:
+                cursor_dates[domain.id] = max(
+                    cursor_dates.get(domain.id, paper.publish_date),
+                    paper.publish_date,
                 )
-                if subject is None:
-                    return None
+            outcome = "skipped" if paper is None else "inserted"
+            return paper
+        finally:
+            if outcomes is not None:
+                outcomes[outcome] += 1
 
-                secondary_subjects = await self._db.subject.get_by_codes(
-                    paper_metadata.secondary_subject_codes, session
-                )
+    @staticmethod
+    async def _gather_batch(jobs: List):
+        """Waits for all the papers of a batch, then raises the first error.
 
-                authors = await self._get_or_create_authors(
-                    paper_metadata.authors, datasource_uuid, datasource_type
-                )
-                if not authors:
-                    return None
+        Unlike a plain gather, no paper of the batch is still running when
+        the error reaches the caller, so the counts it flushes are final.
 
-                paper = await self._get_or_create_paper(
-                    paper_metadata,
-                    authors,
-                    domain,
-                    subject,
-                    secondary_subjects,
-                    datasource_uuid,
-                    session,
-                )
-                return paper
+        Args:
+            jobs (List): The `_ingest_one` coroutines of the batch.
+        """
+        results = await asyncio.gather(*jobs, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def _flush_paper_counts(
+        self,
+        paper_counts: Dict[Tuple[UUID, UUID, date], Tuple[int, int]],
+        session: Optional[AsyncSession] = None,
+    ):
+        """Writes the daily paper counter deltas in one upsert, then clears them.
+
+        Args:
+            paper_counts (Dict[Tuple[UUID, UUID, date], Tuple[int, int]]): The
+                daily paper counter deltas of the committed papers.
+            session (Optional[AsyncSession]): The database session to write
+                in. Defaults to a transaction of its own.
+        """
+        if not paper_counts:
+            return
+        if session is None:
+            async with self._db_session_factory() as session:
+                async with session.begin():
+                    await self._db.paper_statistics.increment(paper_counts, session)
+        else:
+            await self._db.paper_statistics.increment(paper_counts, session)
+        paper_counts.clear()
+
+    async def _advance_cursor_dates(
+        self,
+        datasource_uuid: UUID,
+        cursor_dates: Dict[UUID, date],
+        session: AsyncSession,
+    ):
+        """Advances the domain cursor dates to the dates of a harvested range.
+
+        Args:
+            datasource_uuid (UUID): The UUID of the datasource.
+            cursor_dates (Dict[UUID, date]): The latest publish date of the
+                committed papers per domain UUID.
+            session (AsyncSession): The database session.
+        """
+        for domain_uuid, cursor_date in sorted(cursor_dates.items()):
+            await self._db.paper_ingestion_state.advance_cursor_date(
+                domain_uuid, datasource_uuid, cursor_date, session
+            )
 
     async def run(
         self,
         datasource_uuid: UUID,
         subject_uuid: UUID,
-        from_date: datetime,
-        until_date: datetime,
+        from_date: date,
+        until_date: date,
+        track_watermark: bool = True,
     ) -> int:
         """Runs the paper metadata ingestion given subject and date range.
 
+        Days already covered by the subject watermark are not fetched again.
+        Once all papers of the range are committed, the watermark moves to
+        the end of the range, or to yesterday if the range reaches today,
+        since papers of today may still appear.
+
+        Each harvested range gets an entry in the ingestion ledger, with its
+        page, paper and outcome counts, its duration and its final status.
+        A succeeded entry is committed with the watermark.
+
+        The domain cursor dates advance once per range, to the latest publish
+        date of its committed papers, in the transaction finishing the ledger
+        entry, rather than with each paper, which would lock the domain state
+        row in every paper transaction. The daily paper counters are likewise
+        written once per batch of INGESTION_BATCH_SIZE papers; the counts of
+        a process killed before a batch is written are restored by
+        `PaperStatisticsRepository.recompute_from_papers`.
+
         Args:
             datasource_uuid (UUID): The datasource UUID.
             subject_uuid (str): The subject code to ingest.
-            from_date (datetime): The from date to ingest.
-            until_date (datetime): The until date to ingest.
+            from_date (date): The from date to ingest.
+            until_date (date): The until date to ingest.
+            track_watermark (bool): Whether to skip the days below the subject
+                watermark and advance it. Disable it for ranges before the
+                watermark, e.g. in a backfill.
 
         Returns:
-            int: The number of papers ingested.
+            int: The number of paper records fetched.
         """
-        ingested_papers_count = 0
+        from_date, until_date = self._to_date(from_date), self._to_date(until_date)
         async with self._db_session_factory() as session:
             async with session.begin():
                 subject_code = await self._get_subject_code(subject_uuid, session)
                 datasource_type = await self._get_datasource_type(
                     datasource_uuid, session
                 )
+                harvested_until = None
+                if track_watermark:
+                    harvested_until = (
+                        await self._db.subject_watermark.get_harvested_until(
+                            subject_uuid, session
+                        )
+                    )
+
+        if harvested_until is not None and harvested_until >= until_date:
+            logger.debug(
+                "Subject window already harvested",
+                extra={"subject_code": subject_code, "until_date": until_date},
+            )
+            return 0
+        if harvested_until is not None and harvested_until >= from_date:
+            from_date = harvested_until + timedelta(days=1)
 
         ingestion = self._factory.get(datasource_type, self._http_client)
+        async with self._db_session_factory() as session:
+            async with session.begin():
+                entry_id = await self._db.paper_ingestion_ledger.start(
+                    datasource_uuid, subject_uuid, from_date, until_date, session
+                )
 
-        jobs = []
-        async for paper in ingestion.run(subject_code, from_date, until_date):
-            if paper is None:
-                continue
-            jobs.append(self._ingest_one(paper, datasource_uuid, datasource_type))
-            if len(jobs) >= self.INGESTION_BATCH_SIZE:
-                await asyncio.gather(*jobs)
-                ingested_papers_count += len(jobs)
-                jobs.clear()
+        started = time.monotonic()
+        outcomes: Counter = Counter()
+        cursor_dates: Dict[UUID, date] = {}
+        paper_counts: Dict[Tuple[UUID, UUID, date], Tuple[int, int]] = {}
+        try:
+            jobs = []
+            async for paper in ingestion.run(subject_code, from_date, until_date):
+                if paper is None:
+                    continue
+                outcomes["fetched"] += 1
+                jobs.append(
+                    self._ingest_one(
+                        paper,
+                        datasource_uuid,
+                        datasource_type,
+                        outcomes,
+                        cursor_dates,
+                        paper_counts,
+                    )
+                )
+                if len(jobs) >= self.INGESTION_BATCH_SIZE:
+                    await self._gather_batch(jobs)
+                    jobs.clear()
+                    await self._flush_paper_counts(paper_counts)
+
+            if jobs:
+                await self._gather_batch(jobs)
+        except Exception as e:
+            outcomes["pages"] = ingestion.pages_fetched
+            async with self._db_session_factory() as session:
+                async with session.begin():
+                    await self._flush_paper_counts(paper_counts, session)
+                    await self._advance_cursor_dates(
+                        datasource_uuid, cursor_dates, session
+                    )
+                    await self._db.paper_ingestion_ledger.finish(
+                        entry_id,
+                        IngestionStatus.FAILED,
+                        outcomes,
+                        time.monotonic() - started,
+                        session,
+                        error=repr(e),
+                    )
+            raise
+
+        outcomes["pages"] = ingestion.pages_fetched
+        yesterday = datetime.now(timezone.utc).date() - timedelta(days=1)
+        async with self._db_session_factory() as session:
+            async with session.begin():
+                await self._flush_paper_counts(paper_counts, session)
+                await self._advance_cursor_dates(datasource_uuid, cursor_dates, session)
+                if track_watermark:
+                    await self._db.subject_watermark.advance(
+                        subject_uuid,
+                        datasource_uuid,
+                        from_date,
+                        min(until_date, yesterday),
+                        session,
+                    )
+                await self._db.paper_ingestion_ledger.finish(
+                    entry_id,
+                    IngestionStatus.SUCCEEDED,
+                    outcomes,
+                    time.monotonic() - started,
+                    session,
+                )
+
+        return outcomes["fetched"]
+
+    async def run_subjects(
+        self,
+        subjects: Iterable[Tuple[UUID, UUID, date, date]],
+        max_concurrency: int = 4,
+        track_watermark: bool = True,
+    ) -> List[Union[int, Exception]]:
+        """Runs the paper metadata ingestion of several subjects concurrently.
+
+        The subjects share this service, so its HTTP client, session factory
+        and caches are set up once for all of them, and their papers share the
+        `max_papers_in_flight` slots, so the pool is never oversubscribed
+        whatever the concurrency. A failing subject does not stop the others.
+
+        Subjects start in the order they are first listed, so callers list
+        the most valuable first. A subject may be listed once per date
+        window. Its windows run one after the other in date order, so its
+        watermark advances window by window; after a failed window, the
+        later ones fail with the same error instead of running.
+
+        Args:
+            subjects (Iterable[Tuple[UUID, UUID, date, date]]): The
+                (datasource UUID, subject UUID, from date, until date) to ingest.
+            max_concurrency (int): The maximum number of subjects ingested at
+                the same time.
+            track_watermark (bool): Whether the windows skip the days below
+                the subject watermarks and advance them, see `run`.
 
-        if jobs:
-            await asyncio.gather(*jobs)
-            ingested_papers_count += len(jobs)
+        Returns:
+            List[Union[int, Exception]]: For each window in order, the number
+                of papers ingested or the exception it failed with.
+        """
+        subjects = list(subjects)
+        windows_by_subject: Dict[UUID, List[int]] = {}
+        for index, (_, subject_uuid, _, _) in enumerate(subjects):
+            windows_by_subject.setdefault(subject_uuid, []).append(index)
+
+        results: List[Union[int, Exception]] = [0] * len(subjects)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _run_subject(indexes: List[int]):
+            async with semaphore:
+                error = None
+                for index in sorted(indexes, key=lambda i: subjects[i][2]):
+                    if error is not None:
+                        results[index] = error
+                        continue
+                    try:
+                        results[index] = await self.run(
+                            *subjects[index], track_watermark=track_watermark
+                        )
+                    except Exception as e:
+                        logger.error(
+                            "Error ingesting subject",
+                            exc_info=e,
+                            extra={"subject_uuid": subjects[index][1]},
+                        )
+                        results[index] = error = e
+
+        await asyncio.gather(
+            *(_run_subject(indexes) for indexes in windows_by_subject.values())
+        )
+        return results
 
-        return ingested_papers_count
+    @staticmethod
+    def _to_date(day: date) -> date:
+        """Returns the date of a datetime, or the date itself."""
+        return day.date() if isinstance(day, datetime) else day
 
     async def _get_datasource_type(self, datasource_uuid: UUID, session: AsyncSession):
         """Returns the type of the datasource with the given UUID.
 
+        Datasources are never renamed, so the type is cached on the service.
+
         Args:
             datasource_uuid (UUID): The UUID of the datasource to find.
             session (AsyncSession): The database session.
@@ -230,10 +597,14 @@ class PaperMetadataIngestionService:
         Raises:
             ValueError: If the datasource is not found.
         """
+        if datasource_uuid in self._datasource_types:
+            return self._datasource_types[datasource_uuid]
+
         datasource = await self._db.datasource.get_by_uuid(datasource_uuid, session)
         if not datasource:
             raise ValueError("Datasource not found")
 
+        self._datasource_types[datasource_uuid] = datasource.name
         return datasource.name
 
     async def _get_subject_code(self, subject_uuid: UUID, session: AsyncSession):
@@ -322,49 +693,65 @@ class PaperMetadataIngestionService:
         paper_authors: List[str],
         datasource_uuid: UUID,
         datasource_type: DataSource,
-    ) -> List[Author]:
+    ) -> List[UUID]:
         """Gets or creates authors in the database.
 
+        Authors are matched on their canonical name. Names found in the author
+        cache never reach the database, and the remaining ones are upserted in
+        a single statement.
+
         Args:
             paper_authors (List[str]): The authors of the paper.
             datasource_uuid (UUID): The UUID of the datasource.
             datasource_type (DataSource): The type of the datasource.
-            session (AsyncSession): The database session.
 
         Returns:
-            List[Author]: The authors found or created.
+            List[UUID]: The UUIDs of the authors found or created, in paper order.
         """
-        # Get Authors
-        database_authors = []
-        max_retry = 5
+        raw_names: Dict[str, str] = {}
         for paper_author in paper_authors:
-            for retry in range(max_retry):
+            canonical_name = canonicalize_author_name(paper_author)
+            if canonical_name:
+                raw_names.setdefault(canonical_name, paper_author)
+
+        author_ids = {name: self._author_cache.get(name) for name in raw_names}
+        missing = {
+            name: raw_names[name]
+            for name, author_id in author_ids.items()
+            if author_id is None
+        }
+
+        max_retry = 5
+        for retry in range(max_retry if missing else 0):
+            try:
                 async with self._db_session_factory() as session:
                     async with session.begin():
-                        try:
-                            author = Author(name=paper_author)
-                            database_authors.append(
-                                await self._db.author.create(author, session)
-                            )
-                            break
-                        except DBAPIError as e:
-                            if "deadlock detected" in str(e) and retry < max_retry:
-                                logger.warning(
-                                    "Deadlock detected, retrying",
-                                    exc_info=True,
-                                    extra={
-                                        "paper_author": paper_author,
-                                        "datasource": datasource_type,
-                                        "datasource_uuid": datasource_uuid,
-                                        "retry": retry,
-                                        "max_retry": max_retry,
-                                    },
-                                )
-                                await asyncio.sleep(1)
-                                continue
-                            break
-
-        if len(database_authors) != len(paper_authors):
+                        created_ids = await self._db.author.get_or_create_ids(
+                            missing, session
+                        )
+                for canonical_name, author_id in created_ids.items():
+                    self._author_cache.put(canonical_name, author_id)
+                    author_ids[canonical_name] = author_id
+                break
+            except DBAPIError as e:
+                if "deadlock detected" in str(e) and retry < max_retry - 1:
+                    logger.warning(
+                        "Deadlock detected, retrying",
+                        exc_info=True,
+                        extra={
+                            "paper_authors": paper_authors,
+                            "datasource": datasource_type,
+                            "datasource_uuid": datasource_uuid,
+                            "retry": retry,
+                            "max_retry": max_retry,
+                        },
+                    )
+                    await asyncio.sleep(1)
+                    continue
+                break
+
+        database_authors = [author_id for author_id in author_ids.values() if author_id]
+        if len(database_authors) != len(raw_names):
             logger.warning(
                 "Error getting or creating authors",
                 extra={
@@ -0,0 +1,292 @@
+import asyncio
+from datetime import date
+import os
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from uuid import UUID
+
+from httpx import AsyncClient, Limits, Request, Timeout
+import ray
+
+from common.database.postgres.repositories import DatabaseRepository
+from common.database.postgres.session import (
+    get_session_factory,
+    init_database,
+    shutdown_database,
+)
+from common.datasources.factories import PaperMetadataIngestionFactory
+from common.utils.logger import LoggerManager
+from common.utils.rate_limiter import AsyncRateLimiter
+
+from .paper_metadata_ingestion_service import PaperMetadataIngestionService
+from .shared_rate_limiter import SharedRateLimiter, rate_limit_hooks
+from .subject_groups import pack_by_volume
+
+logger = LoggerManager.get_logger(__name__)
+
+Window = Tuple[UUID, UUID, date, date]
+
+# Connections shared by all the actors of a run when POSTGRES_CONNECTION_BUDGET
+# is unset, and the fewest each actor gets: enough for two papers in flight
+# next to the ledger, watermark and rate limiter sessions of its subjects.
+DEFAULT_CONNECTION_BUDGET = 64
+MIN_ACTOR_CONNECTIONS = 4
+
+
+@ray.remote(num_cpus=0)
+class RateLimitActor:
+    """Token bucket shared by all the ingestion actors of a Ray run."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """Initializes a RateLimitActor object.
+
+        Args:
+            rate (float): The number of requests allowed per second, across
+                all actors.
+            burst (int): The number of requests allowed at once after an idle
+                period.
+        """
+        self._rate_limiter = AsyncRateLimiter(rate, burst)
+
+    async def acquire(self):
+        """Waits until a request is allowed."""
+        await self._rate_limiter.acquire()
+
+
+class _RemoteRateLimiter:
+    """Waits on a RateLimitActor before each request of an actor."""
+
+    def __init__(self, rate_limit_actor):
+        """Initializes a _RemoteRateLimiter object."""
+        self._rate_limit_actor = rate_limit_actor
+
+    async def on_request(self, request: Request):
+        """Waits before an httpx request; use as a request event hook."""
+        await self._rate_limit_actor.acquire.remote()
+
+
+@ray.remote(num_cpus=1)
+class IngestionActor:
+    """Ray actor running subject windows on a warm ingestion service.
+
+    Each actor is a process of its own, so parsing runs on as many cores as
+    there are actors. The database engine, HTTP client and author cache are
+    created on the first call and reused by the next ones.
+    """
+
+    def __init__(self, rate_limit_actor=None, max_connections: int = 10):
+        """Initializes an IngestionActor object.
+
+        Args:
+            rate_limit_actor (Optional[RateLimitActor]): The rate limiter
+                shared by the actors of the run, if any.
+            max_connections (int): The maximum number of HTTP connections of
+                the actor.
+        """
+        self._rate_limit_actor = rate_limit_actor
+        self._max_connections = max_connections
+        self._http_client: Optional[AsyncClient] = None
+        self._service: Optional[PaperMetadataIngestionService] = None
+
+    def _get_service(self) -> PaperMetadataIngestionService:
+        """Returns the ingestion service, creating it on the first call."""
+        if self._service is None:
+            init_database()
+            session_factory = get_session_factory()
+            remote_rate_limiter = None
+            if self._rate_limit_actor is not None:
+                remote_rate_limiter = _RemoteRateLimiter(self._rate_limit_actor)
+            self._http_client = AsyncClient(
+                timeout=Timeout(30),
+                limits=Limits(max_connections=self._max_connections),
+                event_hooks=rate_limit_hooks(
+                    remote_rate_limiter,
+                    SharedRateLimiter.from_env(session_factory),
+                ),
+            )
+            self._service = PaperMetadataIngestionService(
+                PaperMetadataIngestionFactory(),
+                DatabaseRepository(),
+                session_factory,
+                self._http_client,
+            )
+        return self._service
+
+    async def run_windows(
+        self, windows: List[Window], max_concurrency: int, track_watermark: bool
+    ) -> List[Union[int, Exception]]:
+        """Runs subject windows, see `PaperMetadataIngestionService.run_subjects`.
+
+        Failures are returned as RuntimeError with the original representation,
+        since database and HTTP errors do not always pickle.
+        """
+        results = await self._get_service().run_subjects(
+            windows, max_concurrency=max_concurrency, track_watermark=track_watermark
+        )
+        return [
+            RuntimeError(repr(result)) if isinstance(result, Exception) else result
+            for result in results
+        ]
+
+    async def close(self):
+        """Closes the HTTP client and the database engines."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+        await shutdown_database()
+
+
+def max_actor_count(
+    cpu_count: int, connection_budget: int, actor_count: Optional[int] = None
+) -> int:
+    """Returns the number of actors the connection budget can serve.
+
+    Args:
+        cpu_count (int): The number of CPUs of the cluster.
+        connection_budget (int): The connections shared by all the actors.
+        actor_count (Optional[int]): The number of actors requested. Defaults
+            to one per CPU.
+
+    Returns:
+        int: The requested number of actors, capped so that each actor gets
+            at least MIN_ACTOR_CONNECTIONS connections.
+
+    Examples:
+        >>> max_actor_count(32, 64)
+        16
+        >>> max_actor_count(32, 64, actor_count=4)
+        4
+        >>> max_actor_count(8, 2)
+        1
+    """
+    max_actors = max(connection_budget // MIN_ACTOR_CONNECTIONS, 1)
+    return max(min(actor_count or cpu_count, max_actors), 1)
+
+
+def assign_windows(windows: Sequence[Window], actor_count: int) -> List[List[int]]:
+    """Splits windows among actors, keeping the windows of a subject together.
+
+    The windows of a subject must run in date order on the same actor, so
+    its watermark advances window by window. Subjects are packed by number
+    of windows.
+
+    Args:
+        windows (Sequence[Window]): The (datasource UUID, subject UUID, from
+            date, until date) to ingest.
+        actor_count (int): The maximum number of actors.
+
+    Returns:
+        List[List[int]]: The indexes of the windows run by each actor.
+    """
+    indexes_by_subject: Dict[UUID, List[int]] = {}
+    for index, (_, subject_uuid, _, _) in enumerate(windows):
+        indexes_by_subject.setdefault(subject_uuid, []).append(index)
+    subjects = list(indexes_by_subject.values())
+    groups = pack_by_volume(
+        subjects, [len(indexes) for indexes in subjects], actor_count
+    )
+    return [[index for indexes in group for index in indexes] for group in groups]
+
+
+async def run_on_ray(
+    windows: Sequence[Window],
+    actor_count: Optional[int] = None,
+    max_concurrency: int = 4,
+    track_watermark: bool = True,
+    requests_per_second: Optional[float] = None,
+    address: Optional[str] = None,
+    connection_budget: Optional[int] = None,
+) -> List[Union[int, Exception]]:
+    """Runs subject windows on the ingestion actors of a Ray cluster.
+
+    Without an address, a local single-node cluster is started, so a large
+    backfill uses the cores of the machine. The actors inherit the
+    environment of this process on a local cluster; on a remote one, the
+    database and datasource settings must be set on the nodes.
+
+    The connection budget is split evenly between the actors, each sizing
+    its pool, with no overflow, and its papers in flight from its share.
+    There are never more actors than the budget can give
+    MIN_ACTOR_CONNECTIONS each.
+
+    Args:
+        windows (Sequence[Window]): The (datasource UUID, subject UUID, from
+            date, until date) to ingest.
+        actor_count (Optional[int]): The number of actors. Defaults to the
+            number of CPUs of the cluster, within the connection budget.
+        max_concurrency (int): The maximum number of subjects ingested at the
+            same time by each actor.
+        track_watermark (bool): Whether the windows skip the days below the
+            subject watermarks and advance them.
+        requests_per_second (Optional[float]): The limit of requests across
+            all actors, on top of the limit shared through Postgres.
+        address (Optional[str]): The address of the Ray cluster, e.g. "auto".
+        connection_budget (Optional[int]): The Postgres connections shared by
+            all the actors. Defaults to POSTGRES_CONNECTION_BUDGET, or
+            DEFAULT_CONNECTION_BUDGET if unset.
+
+    Returns:
+        List[Union[int, Exception]]: For each window in order, the number of
+            papers ingested or the exception it failed with.
+    """
+    windows = list(windows)
+    if not windows:
+        return []
+    connection_budget = connection_budget or int(
+        os.getenv("POSTGRES_CONNECTION_BUDGET") or DEFAULT_CONNECTION_BUDGET
+    )
+    ray.init(address=address, ignore_reinit_error=True)
+    actor_count = max_actor_count(
+        int(ray.cluster_resources().get("CPU", 1)), connection_budget, actor_count
+    )
+    groups = assign_windows(windows, actor_count)
+    pool_size = max(connection_budget // len(groups), 1)
+    rate_limit_actor = (
+        RateLimitActor.remote(requests_per_second) if requests_per_second else None
+    )
+    # Each actor is a process of its own: a budget equal to its share and a
+    # task concurrency of 1 give it a pool of that many connections.
+    actor_options = {
+        "runtime_env": {
+            "env_vars": {
+                "POSTGRES_CONNECTION_BUDGET": str(pool_size),
+                "POSTGRES_TASK_CONCURRENCY": "1",
+            }
+        }
+    }
+    actors = [
+        IngestionActor.options(**actor_options).remote(rate_limit_actor) for _ in groups
+    ]
+    logger.info(
+        "Start ray ingestion",
+        extra={
+            "windows": len(windows),
+            "actors": len(actors),
+            "pool_size": pool_size,
+        },
+    )
+
+    results: List[Union[int, Exception]] = [0] * len(windows)
+    try:
+        group_results = await asyncio.gather(
+            *(
+                actor.run_windows.remote(
+                    [windows[index] for index in group],
+                    max_concurrency,
+                    track_watermark,
+                )
+                for actor, group in zip(actors, groups, strict=True)
+            ),
+            return_exceptions=True,
+        )
+        for group, group_result in zip(groups, group_results, strict=True):
+            if isinstance(group_result, Exception):
+                logger.error("Ingestion actor failed", exc_info=group_result)
+                group_result = [group_result] * len(group)
+            for index, result in zip(group, group_result, strict=True):
+                results[index] = result
+    finally:
+        await asyncio.gather(
+            *(actor.close.remote() for actor in actors), return_exceptions=True
+        )
+        for actor in actors:
+            ray.kill(actor)
+    return results
@@ -0,0 +1,107 @@
+import asyncio
+import os
+from typing import Callable, Dict, List, Optional
+
+from httpx import Request
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from common.database.postgres.repositories import DatabaseRepository
+
+
+class SharedRateLimiter:
+    """Token bucket shared by all the workers calling the same API host.
+
+    The bucket of each host is a row of the rate_limit_buckets table, so the
+    aggregate request rate stays under the limit whatever the number of tasks
+    and workers. Each `acquire` is a single statement that reserves the next
+    slot; the caller then sleeps until its slot without holding a connection.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        db_session_factory: async_sessionmaker[AsyncSession],
+        burst: float = 1,
+        database_repository: Optional[DatabaseRepository] = None,
+    ):
+        """Initializes a SharedRateLimiter object.
+
+        Args:
+            rate (float): The number of requests allowed per second, across
+                all workers.
+            db_session_factory (async_sessionmaker): The async session factory
+                of the primary database.
+            burst (float): The number of requests allowed at once after an idle
+                period.
+            database_repository (Optional[DatabaseRepository]): The database
+                repository.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self._rate = rate
+        self._burst = burst
+        self._db_session_factory = db_session_factory
+        self._db = database_repository or DatabaseRepository()
+
+    @classmethod
+    def from_env(
+        cls, db_session_factory: async_sessionmaker[AsyncSession]
+    ) -> Optional["SharedRateLimiter"]:
+        """Returns the limiter configured by DATASOURCE_REQUESTS_PER_SECOND.
+
+        Args:
+            db_session_factory (async_sessionmaker): The async session factory
+                of the primary database.
+
+        Returns:
+            Optional[SharedRateLimiter]: The limiter, or None if the rate is
+                unset or 0.
+        """
+        rate = float(os.getenv("DATASOURCE_REQUESTS_PER_SECOND") or 0)
+        if rate <= 0:
+            return None
+        burst = float(os.getenv("DATASOURCE_REQUEST_BURST") or 1)
+        return cls(rate, db_session_factory, burst=burst)
+
+    async def acquire(self, name: str):
+        """Waits until a request to the bucket is allowed.
+
+        Args:
+            name (str): The name of the bucket, e.g. the API host.
+        """
+        async with self._db_session_factory() as session:
+            async with session.begin():
+                wait = await self._db.rate_limit_bucket.take(
+                    name, self._rate, self._burst, session
+                )
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def on_request(self, request: Request):
+        """Waits before an httpx request; use as a request event hook.
+
+        Requests are limited per host.
+
+        Examples:
+            AsyncClient(event_hooks={"request": [rate_limiter.on_request]})
+        """
+        await self.acquire(request.url.host)
+
+
+def rate_limit_hooks(*rate_limiters) -> Dict[str, List[Callable]]:
+    """Returns the httpx event hooks waiting on the given rate limiters.
+
+    Args:
+        *rate_limiters: The rate limiters with an `on_request` hook. None
+            values are skipped.
+
+    Returns:
+        Dict[str, List[Callable]]: The `event_hooks` of an AsyncClient.
+    """
+    return {
+        "request": [
+            rate_limiter.on_request
+            for rate_limiter in rate_limiters
+            if rate_limiter is not None
+        ]
+    }
@@ -0,0 +1,40 @@
+import heapq
+from typing import List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+def pack_by_volume(
+    items: Sequence[T], volumes: Sequence[float], group_count: int
+) -> List[List[T]]:
+    """Splits items into groups of balanced total volume.
+
+    Items are assigned by decreasing volume to the group with the smallest
+    total so far (longest processing time first), which keeps the largest
+    group within 4/3 of the best possible split. Empty groups are dropped.
+
+    Args:
+        items (Sequence[T]): The items to split.
+        volumes (Sequence[float]): The expected volume of each item.
+        group_count (int): The maximum number of groups.
+
+    Returns:
+        List[List[T]]: The groups, each in decreasing item volume.
+
+    Examples:
+        >>> pack_by_volume(["a", "b", "c", "d"], [5, 4, 3, 3], 2)
+        [['a', 'd'], ['b', 'c']]
+        >>> pack_by_volume(["a"], [1], 3)
+        [['a']]
+    """
+    if group_count < 1:
+        raise ValueError("group_count must be positive")
+
+    groups: List[List[T]] = [[] for _ in range(group_count)]
+    totals = [(0.0, index) for index in range(group_count)]
+    order = sorted(range(len(items)), key=lambda index: volumes[index], reverse=True)
+    for index in order:
+        total, group = heapq.heappop(totals)
+        groups[group].append(items[index])
+        heapq.heappush(totals, (total + volumes[index], group))
+    return [group for group in groups if group]
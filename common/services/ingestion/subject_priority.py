@@ -0,0 +1,56 @@
+from typing import Dict, Optional
+
+
+def subject_priority(days_behind: int, density: float, weight: float = 1.0) -> float:
+    """Returns the priority of a subject from its harvest backlog.
+
+    The priority is the number of papers expected between the subject
+    watermark and today, scaled by the configured weight of the subject, so
+    large backlogs of valued subjects are harvested first.
+
+    Args:
+        days_behind (int): The number of days not harvested yet.
+        density (float): The expected number of papers per day.
+        weight (float): The configured weight of the subject.
+
+    Returns:
+        float: The priority, higher first.
+
+    Examples:
+        >>> subject_priority(10, 45.0)
+        450.0
+        >>> subject_priority(10, 45.0, weight=2.0)
+        900.0
+        >>> subject_priority(-1, 45.0)
+        0.0
+    """
+    return max(days_behind, 0) * max(density, 0.0) * weight
+
+
+def parse_subject_weights(value: Optional[str]) -> Dict[str, float]:
+    """Parses subject weights given as comma-separated code=weight pairs.
+
+    Args:
+        value (Optional[str]): The weights, e.g. "cs.AI=3,cs.LG=2".
+
+    Returns:
+        Dict[str, float]: Mapping of subject code to weight.
+
+    Raises:
+        ValueError: If a pair is not code=weight.
+
+    Examples:
+        >>> parse_subject_weights("cs.AI=3, cs.LG=0.5")
+        {'cs.AI': 3.0, 'cs.LG': 0.5}
+        >>> parse_subject_weights("")
+        {}
+    """
+    weights = {}
+    for pair in (value or "").split(","):
+        if not pair.strip():
+            continue
+        code, separator, weight = pair.partition("=")
+        if not separator or not code.strip():
+            raise ValueError(f"Invalid subject weight {pair!r}, expected code=weight")
+        weights[code.strip()] = float(weight)
+    return weights
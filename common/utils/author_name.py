@@ -0,0 +1,57 @@
+import hashlib
+import re
+import unicodedata
+
+_SEPARATORS = re.compile(r"[.\s]+")
+
+
+def canonicalize_author_name(name: str) -> str:
+    """Returns the canonical key of an author name.
+
+    The name is Unicode-normalized, stripped of diacritics and case-folded.
+    A single "Last, First" comma is reordered to "First Last", and dots and
+    whitespace runs are collapsed to a single space.
+
+    Args:
+        name (str): The raw author name.
+
+    Returns:
+        str: The canonical author key.
+
+    Examples:
+        >>> canonicalize_author_name("Smith, John")
+        'john smith'
+        >>> canonicalize_author_name("  JOHN   Smith ")
+        'john smith'
+    """
+    name = unicodedata.normalize("NFKC", name)
+    if name.count(",") == 1:
+        last, first = (part.strip() for part in name.split(","))
+        if last and first:
+            name = f"{first} {last}"
+
+    name = "".join(
+        char
+        for char in unicodedata.normalize("NFKD", name)
+        if not unicodedata.combining(char)
+    )
+    name = _SEPARATORS.sub(" ", name.casefold())
+    return name.strip()
+
+
+def author_name_hash(canonical_name: str) -> int:
+    """Returns a signed 64-bit hash of a canonical author name.
+
+    The hash is the first 8 bytes of the SHA-256 digest, so it can be
+    reproduced in Postgres with
+    ``('x' || left(encode(sha256(convert_to(name, 'UTF8')), 'hex'), 16))
+    ::bit(64)::bigint``.
+
+    Args:
+        canonical_name (str): The canonical author name.
+
+    Returns:
+        int: The signed 64-bit hash.
+    """
+    digest = hashlib.sha256(canonical_name.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
@@ -0,0 +1,122 @@
+import hashlib
+import random
+import re
+import struct
+from typing import List, Set, Tuple
+import unicodedata
+
+NUM_PERMUTATIONS = 128
+# 32 bands of 4 rows: papers sharing a band bucket are candidates. The LSH
+# threshold (1/32)^(1/4) is about 0.42, so pairs at the 0.7 duplicate
+# threshold become candidates more than 99.9% of the time.
+LSH_BANDS = 32
+LSH_ROWS = NUM_PERMUTATIONS // LSH_BANDS
+# Candidates with an estimated similarity at or above this are duplicates.
+DUPLICATE_THRESHOLD = 0.7
+SHINGLE_SIZE = 3
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_NON_ALPHANUMERIC = re.compile(r"[^0-9a-z]+")
+
+# Fixed seed: signatures are stored, so the permutations must never change.
+_random = random.Random(1)
+_PERMUTATIONS = [
+    (_random.randrange(1, _MERSENNE_PRIME), _random.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+_SIGNATURE_FORMAT = f"<{NUM_PERMUTATIONS}I"
+
+
+def normalize_text(text: str) -> str:
+    """Returns the text stripped of diacritics, case and punctuation.
+
+    Examples:
+        >>> normalize_text("Graph Neural-Networks: a Survey (2nd ed.)")
+        'graph neural networks a survey 2nd ed'
+    """
+    text = "".join(
+        char
+        for char in unicodedata.normalize("NFKD", text)
+        if not unicodedata.combining(char)
+    )
+    return _NON_ALPHANUMERIC.sub(" ", text.casefold()).strip()
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """Returns the word shingles of the normalized text.
+
+    Examples:
+        >>> sorted(shingles("Deep graph neural networks"))
+        ['deep graph neural', 'graph neural networks']
+    """
+    words = normalize_text(text).split()
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i : i + size]) for i in range(len(words) - size + 1)}
+
+
+def minhash_signature(text: str) -> List[int]:
+    """Returns the MinHash signature of the word shingles of a text.
+
+    The fraction of equal positions in the signatures of two texts estimates
+    the Jaccard similarity of their shingle sets.
+
+    Args:
+        text (str): The text, e.g. a paper title and abstract.
+
+    Returns:
+        List[int]: NUM_PERMUTATIONS 32-bit minimum hashes.
+    """
+    hashes = [
+        int.from_bytes(
+            hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        for shingle in shingles(text)
+    ]
+    if not hashes:
+        return [_MAX_HASH] * NUM_PERMUTATIONS
+    return [
+        min(((a * value + b) % _MERSENNE_PRIME) & _MAX_HASH for value in hashes)
+        for a, b in _PERMUTATIONS
+    ]
+
+
+def estimate_similarity(signature: List[int], other: List[int]) -> float:
+    """Returns the estimated Jaccard similarity of two signatures."""
+    equal = sum(
+        1
+        for value, other_value in zip(signature, other, strict=True)
+        if value == other_value
+    )
+    return equal / len(signature)
+
+
+def lsh_buckets(signature: List[int]) -> List[Tuple[int, int]]:
+    """Returns the LSH band buckets of a signature.
+
+    Args:
+        signature (List[int]): A MinHash signature.
+
+    Returns:
+        List[Tuple[int, int]]: One (band, bucket) pair per band, the bucket
+            being a signed 64-bit hash of the band's rows.
+    """
+    buckets = []
+    for band in range(LSH_BANDS):
+        rows = signature[band * LSH_ROWS : (band + 1) * LSH_ROWS]
+        digest = hashlib.blake2b(
+            struct.pack(f"<{LSH_ROWS}I", *rows), digest_size=8
+        ).digest()
+        buckets.append((band, int.from_bytes(digest, "big", signed=True)))
+    return buckets
+
+
+def signature_to_bytes(signature: List[int]) -> bytes:
+    """Packs a signature into bytes for storage."""
+    return struct.pack(_SIGNATURE_FORMAT, *signature)
+
+
+def signature_from_bytes(data: bytes) -> List[int]:
+    """Unpacks a signature stored with `signature_to_bytes`."""
+    return list(struct.unpack(_SIGNATURE_FORMAT, data))
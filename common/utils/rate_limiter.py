@@ -0,0 +1,53 @@
+import asyncio
+import time
+from typing import Optional
+
+from httpx import Request
+
+
+class AsyncRateLimiter:
+    """Token bucket limiting the rate of operations across coroutines.
+
+    Tokens refill continuously at `rate` per second up to `burst`. Each
+    `acquire` takes one token, waiting until one is available. Waiters are
+    served in arrival order.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """Initializes an AsyncRateLimiter object.
+
+        Args:
+            rate (float): The number of operations allowed per second.
+            burst (int): The number of operations allowed at once after an
+                idle period.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Waits until an operation is allowed."""
+        async with self._lock:
+            now = time.monotonic()
+            if self._updated_at is not None:
+                self._tokens = min(
+                    self._burst, self._tokens + (now - self._updated_at) * self._rate
+                )
+            self._updated_at = now
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._updated_at = time.monotonic()
+                self._tokens = 1.0
+            self._tokens -= 1
+
+    async def on_request(self, request: Request):
+        """Waits before an httpx request; use as a request event hook.
+
+        Examples:
+            AsyncClient(event_hooks={"request": [rate_limiter.on_request]})
+        """
+        await self.acquire()
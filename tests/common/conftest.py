@@ -114,10 +114,19 @@ async def async_session_factory(async_engine):
             text(
                 """
                 TRUNCATE TABLE
+                    ingestion_work_units,
                     paper_ingestion_state,
+                    paper_statistics,
                     paper_authors,
+                    paper_backfill_windows,
+                    paper_fingerprints,
+                    paper_identifiers,
+                    paper_ingestion_ledger,
+                    paper_lsh_buckets,
                     paper_subjects,
                     papers,
+                    rate_limit_buckets,
+                    subject_ingestion_watermarks,
                     subjects,
                     domains,
                     authors
@@ -0,0 +1,58 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from common.database.postgres.models import Author, paper_authors
+from common.database.postgres.repositories import DatabaseRepository
+
+
+@pytest.mark.asyncio
+class TestAuthorSearch:
+    """Tests for the trigram author search."""
+
+    @pytest.fixture(autouse=True)
+    async def _setup(self, async_session_factory: async_sessionmaker[AsyncSession]):
+        """Inserts a few authors, one of them with papers."""
+        self._async_session_factory = async_session_factory
+        self._database = DatabaseRepository()
+        async with async_session_factory() as session:
+            self.authors = {}
+            for name in ["Geoffrey Hinton", "Jürgen Schmidhuber", "Yann LeCun"]:
+                author = await self._database.author.create(Author(name=name), session)
+                self.authors[name] = author.id
+            await session.execute(
+                insert(paper_authors).values(
+                    [
+                        {
+                            "author_id": self.authors["Geoffrey Hinton"],
+                            "paper_id": uuid4(),
+                        }
+                        for _ in range(3)
+                    ]
+                )
+            )
+            await session.commit()
+
+    async def test_search_authors_by_prefix(self):
+        """Test that a name prefix finds the author with their paper count."""
+        async with self._async_session_factory() as session:
+            rows = await self._database.author.search_authors("geof", session)
+
+        assert [row.Author.id for row in rows] == [self.authors["Geoffrey Hinton"]]
+        assert rows[0].paper_count == 3
+
+    async def test_search_authors_fuzzy(self):
+        """Test that misspelled and reordered names still match."""
+        async with self._async_session_factory() as session:
+            misspelled = await self._database.author.search_authors(
+                "Schmidhueber", session
+            )
+            reordered = await self._database.author.search_authors(
+                "LeCun, Yann", session
+            )
+
+        assert misspelled[0].Author.id == self.authors["Jürgen Schmidhuber"]
+        assert misspelled[0].paper_count == 0
+        assert reordered[0].Author.id == self.authors["Yann LeCun"]
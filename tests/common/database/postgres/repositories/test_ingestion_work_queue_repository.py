@@ -0,0 +1,158 @@
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from common.constants import DataSource, IngestionStatus
+from common.database.postgres.models import Datasource, Domain, Subject
+from common.database.postgres.repositories import DatabaseRepository
+
+STALE_AFTER = timedelta(minutes=5)
+MAX_ATTEMPTS = 2
+
+
+@pytest.mark.asyncio
+class TestIngestionWorkQueue:
+    """Tests for the queue of ingestion windows drained by workers."""
+
+    @pytest.fixture(autouse=True)
+    async def _setup(self, async_session_factory: async_sessionmaker[AsyncSession]):
+        """Creates two subjects and enqueues two windows of each."""
+        self._async_session_factory = async_session_factory
+        self._database = DatabaseRepository()
+        async with async_session_factory() as session:
+            datasource = await self._database.datasource.create(
+                Datasource(name=DataSource.ARXIV), session
+            )
+            domain = await self._database.domain.create(
+                Domain(code="cs", name="CS", datasource_id=datasource.id), session
+            )
+            self.subject_ids = []
+            for code in ("cs.AI", "cs.LG"):
+                subject = await self._database.subject.create(
+                    Subject(code=code, name=code, domain_id=domain.id), session
+                )
+                self.subject_ids.append(subject.id)
+            await session.commit()
+        self.units = [
+            {
+                "datasource_id": datasource.id,
+                "subject_id": subject_id,
+                "from_date": from_date,
+                "until_date": from_date + timedelta(days=9),
+            }
+            for subject_id in self.subject_ids
+            for from_date in (date(2024, 1, 1), date(2024, 1, 11))
+        ]
+        async with async_session_factory() as session:
+            async with session.begin():
+                await self._database.ingestion_work_queue.enqueue(
+                    "batch", self.units, session
+                )
+
+    async def _claim(self, worker_id: str, limit: int = 10):
+        """Claims units in their own transaction."""
+        async with self._async_session_factory() as session:
+            async with session.begin():
+                return await self._database.ingestion_work_queue.claim(
+                    worker_id, limit, STALE_AFTER, MAX_ATTEMPTS, session
+                )
+
+    async def _batch_status(self):
+        """Returns the number of units of the batch per status."""
+        async with self._async_session_factory() as session:
+            return await self._database.ingestion_work_queue.get_batch_status(
+                "batch", session
+            )
+
+    async def test_enqueue_skips_windows_already_in_batch(self):
+        """Test that enqueueing a batch again adds nothing."""
+        async with self._async_session_factory() as session:
+            async with session.begin():
+                enqueued = await self._database.ingestion_work_queue.enqueue(
+                    "batch", self.units, session
+                )
+        assert enqueued == 0
+        assert await self._batch_status() == {IngestionStatus.PENDING: 4}
+
+    async def test_claim_runs_windows_of_a_subject_in_order(self):
+        """Test that only the earliest open window of each subject is claimed."""
+        first = await self._claim("worker-1")
+        assert sorted((u.subject_id, u.from_date) for u in first) == sorted(
+            (subject_id, date(2024, 1, 1)) for subject_id in self.subject_ids
+        )
+        assert await self._claim("worker-2") == []
+
+        async with self._async_session_factory() as session:
+            async with session.begin():
+                assert await self._database.ingestion_work_queue.complete(
+                    first[0].id, "worker-1", 10, session
+                )
+        second = await self._claim("worker-2")
+        assert [(u.subject_id, u.from_date) for u in second] == [
+            (first[0].subject_id, date(2024, 1, 11))
+        ]
+
+    async def test_claim_takes_highest_priority_first(self):
+        """Test that units of a higher priority batch are claimed first."""
+        async with self._async_session_factory() as session:
+            async with session.begin():
+                await self._database.ingestion_work_queue.enqueue(
+                    "urgent",
+                    [
+                        {
+                            **self.units[3],
+                            "from_date": date(2023, 12, 1),
+                            "until_date": date(2023, 12, 10),
+                            "priority": 9.0,
+                        }
+                    ],
+                    session,
+                )
+        claimed = await self._claim("worker-1", limit=1)
+
+        assert claimed[0].batch_id == "urgent"
+        assert claimed[0].priority == 9.0
+
+    async def test_stale_unit_is_reclaimed_then_failed(self):
+        """Test that abandoned units are claimed again until out of attempts."""
+        claimed = await self._claim("worker-1", limit=1)
+        stale = text(
+            "UPDATE ingestion_work_units SET heartbeat_at = now() - interval '1 hour'"
+        )
+        async with self._async_session_factory() as session:
+            async with session.begin():
+                await session.execute(stale)
+        reclaimed = await self._claim("worker-2", limit=1)
+        assert [unit.id for unit in reclaimed] == [claimed[0].id]
+        assert reclaimed[0].attempts == 2
+
+        async with self._async_session_factory() as session:
+            async with session.begin():
+                assert not await self._database.ingestion_work_queue.complete(
+                    claimed[0].id, "worker-1", 10, session
+                )
+                await session.execute(stale)
+                expired = await self._database.ingestion_work_queue.expire_stale(
+                    STALE_AFTER, MAX_ATTEMPTS, session
+                )
+        assert expired == 1
+        assert (await self._batch_status())[IngestionStatus.FAILED] == 1
+
+    async def test_fail_releases_unit_until_out_of_attempts(self):
+        """Test that a failed unit goes back to pending, then fails for good."""
+        for attempt in range(MAX_ATTEMPTS):
+            claimed = await self._claim(f"worker-{attempt}", limit=1)
+            async with self._async_session_factory() as session:
+                async with session.begin():
+                    assert await self._database.ingestion_work_queue.fail(
+                        claimed[0].id,
+                        f"worker-{attempt}",
+                        "boom",
+                        MAX_ATTEMPTS,
+                        session,
+                    )
+        status = await self._batch_status()
+        assert status[IngestionStatus.FAILED] == 1
+        assert status[IngestionStatus.PENDING] == 3
@@ -0,0 +1,69 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from common.database.postgres.repositories import DatabaseRepository
+from common.utils.minhash import minhash_signature
+
+ABSTRACT = (
+    "Attention is all you need. We propose a new simple network architecture, "
+    "the Transformer, based solely on attention mechanisms, dispensing with "
+    "recurrence and convolutions entirely."
+)
+
+
+@pytest.mark.asyncio
+class TestPaperFingerprintIndex:
+    """Tests for the MinHash near-duplicate index."""
+
+    @pytest.fixture(autouse=True)
+    async def _setup(self, async_session_factory: async_sessionmaker[AsyncSession]):
+        """Initializes the repositories."""
+        self._async_session_factory = async_session_factory
+        self._database = DatabaseRepository()
+
+    async def test_near_duplicates_link_to_the_canonical_paper(self):
+        """Test that near duplicates link to the first indexed paper."""
+        original, revision, copy = uuid4(), uuid4(), uuid4()
+        async with self._async_session_factory() as session:
+            assert (
+                await self._database.paper_fingerprint.index_paper(
+                    original, minhash_signature(ABSTRACT), session
+                )
+                is None
+            )
+            duplicate = await self._database.paper_fingerprint.index_paper(
+                revision,
+                minhash_signature(ABSTRACT.replace("entirely.", "altogether.")),
+                session,
+            )
+            # Links to the canonical paper, not to the duplicate it matched.
+            copy_duplicate = await self._database.paper_fingerprint.index_paper(
+                copy,
+                minhash_signature(ABSTRACT.replace("entirely.", "altogether.")),
+                session,
+            )
+            await session.commit()
+
+            duplicate_ids = await self._database.paper_fingerprint.get_duplicate_ids(
+                original, session
+            )
+
+        assert duplicate[0] == original
+        assert copy_duplicate[0] == original
+        assert sorted(duplicate_ids) == sorted([revision, copy])
+
+    async def test_unrelated_paper_is_not_linked(self):
+        """Test that a paper sharing no bucket stays canonical."""
+        async with self._async_session_factory() as session:
+            await self._database.paper_fingerprint.index_paper(
+                uuid4(), minhash_signature(ABSTRACT), session
+            )
+            duplicate = await self._database.paper_fingerprint.index_paper(
+                uuid4(),
+                minhash_signature("Deep residual learning for image recognition."),
+                session,
+            )
+
+        assert duplicate is None
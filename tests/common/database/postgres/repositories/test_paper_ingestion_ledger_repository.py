@@ -0,0 +1,124 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from common.constants import DataSource, IngestionStatus
+from common.database.postgres.models import Datasource, Domain, Subject
+from common.database.postgres.repositories import DatabaseRepository
+
+
+@pytest.mark.asyncio
+class TestPaperIngestionLedger:
+    """Tests for the ledger of paper ingestion windows."""
+
+    @pytest.fixture(autouse=True)
+    async def _setup(self, async_session_factory: async_sessionmaker[AsyncSession]):
+        """Creates a subject to harvest."""
+        self._async_session_factory = async_session_factory
+        self._database = DatabaseRepository()
+        async with async_session_factory() as session:
+            datasource = await self._database.datasource.create(
+                Datasource(name=DataSource.ARXIV), session
+            )
+            domain = await self._database.domain.create(
+                Domain(code="cs", name="CS", datasource_id=datasource.id), session
+            )
+            subject = await self._database.subject.create(
+                Subject(code="cs.AI", name="AI", domain_id=domain.id), session
+            )
+            await session.commit()
+        self.datasource_id = datasource.id
+        self.subject_id = subject.id
+
+    async def _record(
+        self, from_date: date, until_date: date, status: IngestionStatus
+    ) -> int:
+        """Records a finished window in its own transaction."""
+        async with self._async_session_factory() as session:
+            async with session.begin():
+                ledger = self._database.paper_ingestion_ledger
+                entry_id = await ledger.start(
+                    self.datasource_id, self.subject_id, from_date, until_date, session
+                )
+                await ledger.finish(
+                    entry_id,
+                    status,
+                    {"pages": 2, "fetched": 10, "inserted": 7, "skipped": 3},
+                    4.0,
+                    session,
+                )
+        return entry_id
+
+    async def test_completed_windows_are_covered_by_succeeded_ones(self):
+        """Test that only windows inside a succeeded window are completed."""
+        await self._record(
+            date(2024, 1, 1), date(2024, 1, 10), IngestionStatus.SUCCEEDED
+        )
+        await self._record(date(2024, 1, 11), date(2024, 1, 20), IngestionStatus.FAILED)
+
+        windows = [
+            (self.subject_id, date(2024, 1, 1), date(2024, 1, 10)),
+            (self.subject_id, date(2024, 1, 10), date(2024, 1, 10)),
+            (self.subject_id, date(2024, 1, 10), date(2024, 1, 11)),
+            (self.subject_id, date(2024, 1, 11), date(2024, 1, 20)),
+        ]
+        async with self._async_session_factory() as session:
+            completed = (
+                await self._database.paper_ingestion_ledger.get_completed_windows(
+                    windows, session
+                )
+            )
+        assert completed == set(windows[:2])
+
+    async def test_window_ending_today_does_not_cover_today(self):
+        """Test that the day a window finished on is planned again."""
+        today = datetime.now(timezone.utc).date()
+        yesterday = today - timedelta(days=1)
+        await self._record(yesterday, today, IngestionStatus.SUCCEEDED)
+
+        windows = [
+            (self.subject_id, yesterday, yesterday),
+            (self.subject_id, today, today),
+        ]
+        async with self._async_session_factory() as session:
+            completed = (
+                await self._database.paper_ingestion_ledger.get_completed_windows(
+                    windows, session
+                )
+            )
+        assert completed == {windows[0]}
+
+    async def test_throughput_sums_finished_windows(self):
+        """Test that the throughput adds up the counters of finished windows."""
+        await self._record(
+            date(2024, 1, 1), date(2024, 1, 10), IngestionStatus.SUCCEEDED
+        )
+        await self._record(date(2024, 1, 11), date(2024, 1, 20), IngestionStatus.FAILED)
+        async with self._async_session_factory() as session:
+            async with session.begin():
+                await self._database.paper_ingestion_ledger.start(
+                    self.datasource_id,
+                    self.subject_id,
+                    date(2024, 1, 21),
+                    date(2024, 1, 30),
+                    session,
+                )
+
+        async with self._async_session_factory() as session:
+            rows = await self._database.paper_ingestion_ledger.get_throughput(
+                datetime.now(timezone.utc) - timedelta(days=1), session
+            )
+        assert [row._asdict() for row in rows] == [
+            {
+                "datasource": DataSource.ARXIV.value,
+                "windows": 2,
+                "failed_windows": 1,
+                "pages": 4,
+                "fetched": 20,
+                "inserted": 14,
+                "skipped": 6,
+                "failed": 0,
+                "duration_seconds": 8.0,
+            }
+        ]
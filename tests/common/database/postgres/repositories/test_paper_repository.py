@@ -0,0 +1,160 @@
+from datetime import date, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from common.constants import DataSource
+from common.database.postgres.models import Author, Datasource, Domain, Paper
+from common.database.postgres.repositories import (
+    DatabaseRepository,
+    PaperSearchFilters,
+)
+
+PAPER_COUNT = 25
+
+
+@pytest.mark.asyncio
+class TestPaperRepositoryReads:
+    """Tests for the streaming, keyset-paginated and full-text paper reads."""
+
+    @pytest.fixture(autouse=True)
+    async def _setup(self, async_session_factory: async_sessionmaker[AsyncSession]):
+        """Inserts papers spread over two months, two per day."""
+        self._async_session_factory = async_session_factory
+        self._database = DatabaseRepository()
+        async with async_session_factory() as session:
+            datasource = await self._database.datasource.create(
+                Datasource(name=DataSource.ARXIV), session
+            )
+            domain = await self._database.domain.create(
+                Domain(code="cs", name="CS", datasource_id=datasource.id), session
+            )
+            author = await self._database.author.create(Author(name="Ada"), session)
+            await self._database.paper.ensure_partitions(
+                date(2024, 2, 29), session, since=date(2024, 1, 1)
+            )
+            self.paper_defaults = {
+                "datasource_id": datasource.id,
+                "domain_id": domain.id,
+                "main_author_id": author.id,
+            }
+            self.papers = [
+                {
+                    "id": uuid4(),
+                    "abstract": f"Abstract {i}",
+                    "datasource_id": datasource.id,
+                    "domain_id": domain.id,
+                    "main_author_id": author.id,
+                    "paper_identifier": f"paper-{i}",
+                    "publish_date": date(2024, 1, 20) + timedelta(days=i // 2),
+                    "title": f"Title {i}",
+                }
+                for i in range(PAPER_COUNT)
+            ]
+            await session.execute(insert(Paper).values(self.papers))
+            await session.commit()
+        self.expected_keys = sorted(
+            (paper["publish_date"], paper["id"]) for paper in self.papers
+        )
+
+    async def test_iter_pages_walks_all_papers_in_key_order(self):
+        """Test that keyset pages return every paper once, in key order."""
+        keys, page_sizes = [], []
+        async with self._async_session_factory() as session:
+            async for page in self._database.paper.iter_pages(session, page_size=10):
+                page_sizes.append(len(page))
+                keys += [(paper.publish_date, paper.id) for paper in page]
+
+        assert page_sizes == [10, 10, 5]
+        assert keys == self.expected_keys
+
+    async def test_iter_pages_resumes_after_key(self):
+        """Test that a walk resumes after the given key."""
+        after = self.expected_keys[9]
+        async with self._async_session_factory() as session:
+            keys = [
+                (paper.publish_date, paper.id)
+                async for page in self._database.paper.iter_pages(
+                    session, page_size=10, after=after
+                )
+                for paper in page
+            ]
+
+        assert keys == self.expected_keys[10:]
+
+    async def test_iter_pages_keeps_other_objects_attached(self):
+        """Test that a walk only detaches the papers of its pages."""
+        async with self._async_session_factory() as session:
+            author = await session.get(Author, self.paper_defaults["main_author_id"])
+            pages = [
+                page
+                async for page in self._database.paper.iter_pages(session, page_size=10)
+            ]
+
+            assert author in session
+            assert not any(paper in session for page in pages for paper in page)
+
+    async def test_stream_by_publish_date(self):
+        """Test that streaming returns the papers of the date range in order."""
+        async with self._async_session_factory() as session:
+            keys = [
+                (paper.publish_date, paper.id)
+                async for paper in self._database.paper.stream_by_publish_date(
+                    date(2024, 1, 31), date(2024, 2, 2), session, yield_per=2
+                )
+            ]
+
+        assert keys == [
+            key
+            for key in self.expected_keys
+            if date(2024, 1, 31) <= key[0] <= date(2024, 2, 2)
+        ]
+
+    async def test_search_ranks_title_matches_first(self):
+        """Test that search ranks title matches above abstract matches."""
+        title_match, abstract_match = uuid4(), uuid4()
+        async with self._async_session_factory() as session:
+            await session.execute(
+                insert(Paper).values(
+                    [
+                        {
+                            **self.paper_defaults,
+                            "id": title_match,
+                            "abstract": "We study message passing.",
+                            "paper_identifier": "graph-title",
+                            "publish_date": date(2024, 2, 1),
+                            "title": "Graph Neural Networks",
+                        },
+                        {
+                            **self.paper_defaults,
+                            "id": abstract_match,
+                            "abstract": "Folding predicted with graph models.",
+                            "paper_identifier": "graph-abstract",
+                            "publish_date": date(2024, 1, 25),
+                            "title": "Protein Structure",
+                        },
+                    ]
+                )
+            )
+            await session.commit()
+
+            rows = await self._database.paper.search("graphs", session)
+            assert [row.Paper.id for row in rows] == [title_match, abstract_match]
+
+            first_page = await self._database.paper.search("graphs", session, limit=1)
+            second_page = await self._database.paper.search(
+                "graphs",
+                session,
+                limit=1,
+                cursor=(first_page[0].rank, first_page[0].Paper.id),
+            )
+            assert [row.Paper.id for row in second_page] == [abstract_match]
+
+            filtered = await self._database.paper.search(
+                "graphs",
+                session,
+                filters=PaperSearchFilters(until=date(2024, 1, 31)),
+            )
+            assert [row.Paper.id for row in filtered] == [abstract_match]
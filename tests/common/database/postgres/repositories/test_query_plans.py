@@ -0,0 +1,382 @@
+from contextlib import contextmanager
+from datetime import date, timedelta
+import json
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Set, Tuple
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, insert, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from common.constants import DataSource
+from common.database.postgres.models import (
+    Author,
+    Datasource,
+    Domain,
+    Paper,
+    PaperIdentifier,
+    PaperIngestionState,
+    Subject,
+    paper_authors,
+)
+from common.database.postgres.models.relationships import PaperSubject
+from common.database.postgres.partitions import paper_partition_name
+from common.database.postgres.repositories import DatabaseRepository
+from common.utils.author_name import author_name_hash, canonicalize_author_name
+
+LARGE_TABLES = {
+    "authors",
+    "paper_authors",
+    "paper_identifiers",
+    "paper_subjects",
+    "papers",
+    "subjects",
+}
+
+SUBJECT_COUNT = 40
+AUTHOR_COUNT = 300
+PAPER_COUNT = 2000
+
+# Each case runs one repository call. Aggregates over every subject may read
+# the small subjects table in full, so it is listed as allowed for them.
+PLAN_CASES = {
+    "author.get_by_name": (
+        set(),
+        lambda db, seed, session: db.author.get_by_name("Author 7", session),
+    ),
+    "author.get_by_names": (
+        set(),
+        lambda db, seed, session: db.author.get_by_names(
+            ["Author 1", "Author 2"], session
+        ),
+    ),
+    "author.search_authors": (
+        set(),
+        lambda db, seed, session: db.author.search_authors("Autor 17", session),
+    ),
+    "author.get_or_create_ids": (
+        set(),
+        lambda db, seed, session: db.author.get_or_create_ids(
+            {"author 3": "Author 3", "new author": "New Author"}, session
+        ),
+    ),
+    "paper.get_by_paper_id": (
+        set(),
+        lambda db, seed, session: db.paper.get_by_paper_id("paper-17", session),
+    ),
+    "paper.get_content_hash": (
+        set(),
+        lambda db, seed, session: db.paper.get_content_hash("paper-17", session),
+    ),
+    "paper.update_if_changed": (
+        set(),
+        lambda db, seed, session: db.paper.update_if_changed(
+            seed.paper_id,
+            seed.publish_date,
+            {
+                "content_hash": "0" * 64,
+                "paper_identifier": "paper-17",
+                "publish_date": seed.publish_date,
+                "title": "Revised Title 17",
+            },
+            session,
+        ),
+    ),
+    "paper.get_page": (
+        set(),
+        lambda db, seed, session: db.paper.get_page(
+            session, after=(seed.publish_date, seed.paper_id), limit=100
+        ),
+    ),
+    "paper.search": (
+        set(),
+        lambda db, seed, session: db.paper.search("title", session, limit=10),
+    ),
+    "paper.count_papers": (
+        set(),
+        lambda db, seed, session: db.paper.count_papers(seed.datasource_id, session),
+    ),
+    "paper.get_paper_count_by_datasource": (
+        set(),
+        lambda db, seed, session: db.paper.get_paper_count_by_datasource(session),
+    ),
+    "paper.delete_authors": (
+        set(),
+        lambda db, seed, session: db.paper.delete_authors(seed.paper_id, session),
+    ),
+    "paper_subject.delete_by_paper_uuid": (
+        set(),
+        lambda db, seed, session: db.paper_subject.delete_by_paper_uuid(
+            seed.paper_id, session
+        ),
+    ),
+    "paper_subject.get_paper_count_by_subject": (
+        {"subjects"},
+        lambda db, seed, session: db.paper_subject.get_paper_count_by_subject(session),
+    ),
+    "subject.get_by_code": (
+        set(),
+        lambda db, seed, session: db.subject.get_by_code("cs.S7", session),
+    ),
+    "subject.get_by_codes": (
+        set(),
+        lambda db, seed, session: db.subject.get_by_codes(["cs.S1", "cs.S2"], session),
+    ),
+    "subject.get_by_domain_uuid": (
+        set(),
+        lambda db, seed, session: db.subject.get_by_domain_uuid(
+            seed.domain_id, session
+        ),
+    ),
+    "subject.get_subject_count_by_domain": (
+        set(),
+        lambda db, seed, session: db.subject.get_subject_count_by_domain(session),
+    ),
+    "paper_ingestion_state.advance_cursor_date": (
+        set(),
+        lambda db, seed, session: db.paper_ingestion_state.advance_cursor_date(
+            seed.domain_id, seed.datasource_id, date(2025, 1, 1), session
+        ),
+    ),
+    "paper_ingestion_state.get_subject_plan": (
+        {"subjects"},
+        lambda db, seed, session: db.paper_ingestion_state.get_subject_plan(session),
+    ),
+    "paper_ingestion_state.update_cursor_date_from_papers": (
+        set(),
+        lambda db, seed, session: (
+            db.paper_ingestion_state.update_cursor_date_from_papers(session)
+        ),
+    ),
+}
+
+
+@contextmanager
+def record_statements(engine: AsyncEngine):
+    """Records the SQL statements executed on the engine.
+
+    Args:
+        engine (AsyncEngine): The engine to listen on.
+
+    Yields:
+        List[Tuple[str, Any]]: The recorded (statement, parameters) pairs.
+    """
+    statements: List[Tuple[str, Any]] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if not executemany:
+            statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+
+def find_relations(plan: Dict[str, Any], node_type: Optional[str] = None) -> Set[str]:
+    """Returns the relations read in a plan tree.
+
+    Args:
+        plan (Dict[str, Any]): The plan node.
+        node_type (Optional[str]): Only return relations read by this node type.
+
+    Returns:
+        Set[str]: The relation names, partitions included.
+    """
+    relations = set()
+    if "Relation Name" in plan and node_type in (None, plan["Node Type"]):
+        relations.add(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        relations |= find_relations(child, node_type)
+    return relations
+
+
+def find_seq_scans(plan: Dict[str, Any]) -> Set[str]:
+    """Returns the tables read with a sequential scan in a plan tree.
+
+    Papers partitions are reported as the papers table.
+    """
+    return {
+        "papers" if relation.startswith("papers_") else relation
+        for relation in find_relations(plan, "Seq Scan")
+    }
+
+
+async def explain(connection, statement: str, parameters: Any) -> Dict[str, Any]:
+    """Returns the root plan node of a statement."""
+    result = await connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {statement}", parameters
+    )
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+@pytest.mark.asyncio
+class TestQueryPlans:
+    """Query-plan regression tests for the repository queries."""
+
+    @pytest.fixture(autouse=True)
+    async def _setup(
+        self,
+        async_engine: AsyncEngine,
+        async_session_factory: async_sessionmaker[AsyncSession],
+    ):
+        """Seeds the database and refreshes the planner statistics."""
+        self._async_engine = async_engine
+        self._async_session_factory = async_session_factory
+        self._database = DatabaseRepository()
+        self.seed = await self._seed()
+
+    async def _seed(self) -> SimpleNamespace:
+        """Inserts enough rows for the planner to prefer indexes."""
+        domain_id = uuid4()
+        subject_ids = [uuid4() for _ in range(SUBJECT_COUNT)]
+        author_ids = [uuid4() for _ in range(AUTHOR_COUNT)]
+        paper_ids = [uuid4() for _ in range(PAPER_COUNT)]
+
+        authors = []
+        for i, author_id in enumerate(author_ids):
+            canonical_name = canonicalize_author_name(f"Author {i}")
+            authors.append(
+                {
+                    "id": author_id,
+                    "name": f"Author {i}",
+                    "canonical_name": canonical_name,
+                    "canonical_name_hash": author_name_hash(canonical_name),
+                }
+            )
+        papers, links, subjects = [], [], []
+        for i, paper_id in enumerate(paper_ids):
+            papers.append(
+                {
+                    "id": paper_id,
+                    "abstract": f"Abstract {i}",
+                    "domain_id": domain_id,
+                    "main_author_id": author_ids[i % AUTHOR_COUNT],
+                    "paper_identifier": f"paper-{i}",
+                    "publish_date": date(2024, 1, 1) + timedelta(days=i % 365),
+                    "title": f"Title {i}",
+                }
+            )
+            links += [
+                {"author_id": author_ids[(i + j) % AUTHOR_COUNT], "paper_id": paper_id}
+                for j in range(2)
+            ]
+            subjects += [
+                {
+                    "paper_id": paper_id,
+                    "subject_id": subject_ids[(i + j) % SUBJECT_COUNT],
+                    "is_primary": j == 0,
+                }
+                for j in range(2)
+            ]
+
+        async with self._async_session_factory() as session:
+            datasource = await self._database.datasource.create(
+                Datasource(name=DataSource.ARXIV), session
+            )
+            datasource_id = datasource.id
+            await session.execute(
+                insert(Domain).values(
+                    id=domain_id,
+                    code="cs",
+                    name="Computer Science",
+                    datasource_id=datasource_id,
+                )
+            )
+            await session.execute(
+                insert(Subject).values(
+                    [
+                        {
+                            "id": subject_id,
+                            "code": f"cs.S{i}",
+                            "name": f"Subject {i}",
+                            "domain_id": domain_id,
+                        }
+                        for i, subject_id in enumerate(subject_ids)
+                    ]
+                )
+            )
+            await session.execute(
+                insert(PaperIngestionState).values(
+                    datasource_id=datasource_id,
+                    domain_id=domain_id,
+                    cursor_date=date(2023, 1, 1),
+                    is_active=True,
+                )
+            )
+            await session.execute(insert(Author).values(authors))
+            await self._database.paper.ensure_partitions(
+                date(2024, 12, 31), session, since=date(2024, 1, 1)
+            )
+            for paper in papers:
+                paper["datasource_id"] = datasource_id
+            await session.execute(insert(Paper).values(papers))
+            await session.execute(
+                insert(PaperIdentifier).values(
+                    [
+                        {
+                            "paper_identifier": paper["paper_identifier"],
+                            "paper_id": paper["id"],
+                            "publish_date": paper["publish_date"],
+                        }
+                        for paper in papers
+                    ]
+                )
+            )
+            await session.execute(insert(paper_authors).values(links))
+            await session.execute(insert(PaperSubject).values(subjects))
+            await session.commit()
+            await session.execute(text("ANALYZE"))
+            await session.commit()
+
+        return SimpleNamespace(
+            datasource_id=datasource_id,
+            domain_id=domain_id,
+            paper_id=paper_ids[17],
+            publish_date=papers[17]["publish_date"],
+        )
+
+    @pytest.mark.parametrize("case", list(PLAN_CASES))
+    async def test_no_sequential_scan_on_large_tables(self, case: str):
+        """Test that no repository query scans a large table sequentially."""
+        allowed, run = PLAN_CASES[case]
+        async with self._async_session_factory() as session:
+            await session.execute(text("SET LOCAL enable_seqscan = off"))
+            with record_statements(self._async_engine) as statements:
+                await run(self._database, self.seed, session)
+            assert statements, f"{case} did not execute any statement"
+
+            connection = await session.connection()
+            for statement, parameters in statements:
+                plan = await explain(connection, statement, parameters)
+                seq_scans = find_seq_scans(plan) & LARGE_TABLES
+                assert (
+                    not seq_scans - allowed
+                ), f"{case} scans {sorted(seq_scans)} sequentially:\n{statement}"
+            await session.rollback()
+
+    async def test_publish_date_prunes_partitions(self):
+        """Test that a publish date predicate reads a single papers partition."""
+        async with self._async_session_factory() as session:
+            with record_statements(self._async_engine) as statements:
+                await PLAN_CASES["paper.update_if_changed"][1](
+                    self._database, self.seed, session
+                )
+
+            connection = await session.connection()
+            statement, parameters = statements[0]
+            plan = await explain(connection, statement, parameters)
+            partitions = {
+                relation
+                for relation in find_relations(plan)
+                if relation.startswith("papers_")
+            }
+            assert partitions == {
+                paper_partition_name(self.seed.publish_date)
+            }, f"Expected a single partition, got {sorted(partitions)}"
+            await session.rollback()
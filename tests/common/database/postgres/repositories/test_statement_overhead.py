@@ -0,0 +1,63 @@
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from common.constants import DataSource
+from common.database.postgres.models import Datasource, Domain, Subject
+from common.database.postgres.repositories import DatabaseRepository
+from common.database.postgres.repositories.subject_repository import _SELECT_BY_CODE
+
+
+@pytest.mark.asyncio
+class TestStatementOverhead:
+    """Tests for the pre-built repository statements.
+
+    A pre-built statement is constructed once at import, and its compiled
+    form is served from the engine cache on every later execution. The time
+    this saves is measured by `common.database.postgres.statement_benchmark`.
+    """
+
+    @pytest.fixture(autouse=True)
+    async def _setup(self, async_session_factory: async_sessionmaker[AsyncSession]):
+        """Inserts subjects to look up."""
+        self._async_session_factory = async_session_factory
+        self._database = DatabaseRepository()
+        async with async_session_factory() as session:
+            async with session.begin():
+                datasource = await self._database.datasource.create(
+                    Datasource(name=DataSource.ARXIV), session
+                )
+                domain = await self._database.domain.create(
+                    Domain(code="cs", name="CS", datasource_id=datasource.id),
+                    session,
+                )
+                for code in ("cs.AI", "cs.LG"):
+                    await self._database.subject.create(
+                        Subject(code=code, name=code, domain_id=domain.id), session
+                    )
+
+    async def test_prebuilt_statement_is_reused(self):
+        """Tests that lookups reuse the pre-built statement and its compilation."""
+        statements, cache_hits = [], []
+
+        def _record_statement(orm_execute_state):
+            statements.append(orm_execute_state.statement)
+
+        def _record_cache_hit(conn, cursor, statement, parameters, context, many):
+            cache_hits.append(context.cache_hit == context.CACHE_HIT)
+
+        async with self._async_session_factory() as session:
+            engine = session.bind.sync_engine
+            event.listen(session.sync_session, "do_orm_execute", _record_statement)
+            event.listen(engine, "before_cursor_execute", _record_cache_hit)
+            try:
+                for code in ("cs.AI", "cs.LG", "cs.AI"):
+                    subject = await self._database.subject.get_by_code(code, session)
+                    assert subject.code == code
+            finally:
+                event.remove(engine, "before_cursor_execute", _record_cache_hit)
+
+        assert all(statement is _SELECT_BY_CODE for statement in statements)
+        assert len(statements) == 3
+        # The first lookup may compile the statement, the next ones do not.
+        assert cache_hits[1:] == [True, True]
@@ -0,0 +1,108 @@
+from datetime import date
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from common.constants import DataSource
+from common.database.postgres.models import Datasource, Domain, Subject
+from common.database.postgres.repositories import DatabaseRepository
+
+
+@pytest.mark.asyncio
+class TestSubjectIngestionWatermark:
+    """Tests for the per-subject harvest watermarks."""
+
+    @pytest.fixture(autouse=True)
+    async def _setup(self, async_session_factory: async_sessionmaker[AsyncSession]):
+        """Creates a subject to harvest."""
+        self._async_session_factory = async_session_factory
+        self._database = DatabaseRepository()
+        async with async_session_factory() as session:
+            datasource = await self._database.datasource.create(
+                Datasource(name=DataSource.ARXIV), session
+            )
+            domain = await self._database.domain.create(
+                Domain(code="cs", name="CS", datasource_id=datasource.id), session
+            )
+            subject = await self._database.subject.create(
+                Subject(code="cs.AI", name="AI", domain_id=domain.id), session
+            )
+            await session.commit()
+        self.datasource_id = datasource.id
+        self.domain_id = domain.id
+        self.subject_id = subject.id
+
+    async def _advance(self, from_date: date, until_date: date) -> bool:
+        """Advances the watermark over a window in its own transaction."""
+        async with self._async_session_factory() as session:
+            async with session.begin():
+                return await self._database.subject_watermark.advance(
+                    self.subject_id, self.datasource_id, from_date, until_date, session
+                )
+
+    async def _harvested_until(self) -> date:
+        """Returns the watermark of the subject."""
+        async with self._async_session_factory() as session:
+            return await self._database.subject_watermark.get_harvested_until(
+                self.subject_id, session
+            )
+
+    async def test_advance_only_over_contiguous_windows(self):
+        """Test that a window past a gap does not move the watermark."""
+        assert await self._advance(date(2024, 1, 1), date(2024, 1, 10))
+        assert not await self._advance(date(2024, 1, 21), date(2024, 1, 30))
+        assert await self._harvested_until() == date(2024, 1, 10)
+
+        assert await self._advance(date(2024, 1, 11), date(2024, 1, 20))
+        assert not await self._advance(date(2024, 1, 1), date(2024, 1, 5))
+        assert await self._harvested_until() == date(2024, 1, 20)
+
+    async def test_raise_for_domain_keeps_later_watermarks(self):
+        """Test that raising a domain never moves a watermark back."""
+        async with self._async_session_factory() as session:
+            async with session.begin():
+                await self._database.subject_watermark.raise_for_domain(
+                    self.domain_id,
+                    self.datasource_id,
+                    date(2024, 1, 1),
+                    date(2024, 3, 1),
+                    session,
+                )
+        assert await self._harvested_until() == date(2024, 3, 1)
+
+        async with self._async_session_factory() as session:
+            async with session.begin():
+                await self._database.subject_watermark.raise_for_domain(
+                    self.domain_id,
+                    self.datasource_id,
+                    date(2024, 1, 1),
+                    date(2024, 2, 1),
+                    session,
+                )
+        assert await self._harvested_until() == date(2024, 3, 1)
+
+    async def test_raise_for_domain_keeps_watermarks_before_a_gap(self):
+        """Test that raising a domain does not skip days never harvested."""
+        assert await self._advance(date(2024, 1, 1), date(2024, 1, 10))
+
+        async with self._async_session_factory() as session:
+            async with session.begin():
+                await self._database.subject_watermark.raise_for_domain(
+                    self.domain_id,
+                    self.datasource_id,
+                    date(2024, 2, 1),
+                    date(2024, 2, 28),
+                    session,
+                )
+        assert await self._harvested_until() == date(2024, 1, 10)
+
+        async with self._async_session_factory() as session:
+            async with session.begin():
+                await self._database.subject_watermark.raise_for_domain(
+                    self.domain_id,
+                    self.datasource_id,
+                    date(2024, 1, 11),
+                    date(2024, 2, 28),
+                    session,
+                )
+        assert await self._harvested_until() == date(2024, 2, 28)
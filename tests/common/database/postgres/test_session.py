@@ -0,0 +1,131 @@
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from common.database.postgres import session as db_session
+
+
+@pytest.fixture
+def primary_env(monkeypatch):
+    """Configures the primary database and clears the replica settings."""
+    monkeypatch.setenv("POSTGRES_USER", "user")
+    monkeypatch.setenv("POSTGRES_PASSWORD", "password")
+    monkeypatch.setenv("POSTGRES_HOST", "primary")
+    monkeypatch.setenv("POSTGRES_PORT", "5432")
+    monkeypatch.setenv("POSTGRES_DATABASE", "publications")
+    monkeypatch.delenv("POSTGRES_READ_HOST", raising=False)
+    monkeypatch.delenv("POSTGRES_READ_PORT", raising=False)
+
+
+async def test_read_sessions_use_primary_without_replica(primary_env):
+    """Tests that read-only sessions go to the primary when no replica is set."""
+    db_session.init_database()
+    try:
+        assert db_session.get_session_factory(read_only=True) is (
+            db_session.get_session_factory()
+        )
+    finally:
+        await db_session.shutdown_database()
+
+
+async def test_read_sessions_use_replica(primary_env, monkeypatch):
+    """Tests that read-only sessions go to the replica when one is set."""
+    monkeypatch.setenv("POSTGRES_READ_HOST", "replica")
+    db_session.init_database()
+    try:
+        read_factory = db_session.get_session_factory(read_only=True)
+        write_factory = db_session.get_session_factory()
+        assert read_factory is not write_factory
+        assert read_factory.kw["bind"].url.host == "replica"
+        assert read_factory.kw["bind"].url.database == "publications"
+        assert write_factory.kw["bind"].url.host == "primary"
+    finally:
+        await db_session.shutdown_database()
+
+
+async def test_empty_replica_settings_use_primary(primary_env, monkeypatch):
+    """Tests that empty replica variables fall back to the primary settings."""
+    monkeypatch.setenv("POSTGRES_READ_HOST", "replica")
+    monkeypatch.setenv("POSTGRES_READ_PORT", "")
+    db_session.init_database()
+    try:
+        read_url = db_session.get_session_factory(read_only=True).kw["bind"].url
+        assert read_url.host == "replica"
+        assert read_url.port == 5432
+    finally:
+        await db_session.shutdown_database()
+
+
+async def test_engine_is_reused_across_tasks(primary_env):
+    """Tests that the engine outlives the end-of-task cleanup."""
+    db_session.init_database()
+    try:
+        engine = db_session.get_session_factory().kw["bind"]
+        await db_session.cleanup()
+        db_session.init_database()
+        assert db_session.get_session_factory().kw["bind"] is engine
+    finally:
+        await db_session.shutdown_database()
+
+
+async def test_pool_size_from_connection_budget(primary_env, monkeypatch):
+    """Tests that the pool size divides the budget by the task concurrency."""
+    monkeypatch.setenv("POSTGRES_CONNECTION_BUDGET", "48")
+    monkeypatch.setenv("POSTGRES_TASK_CONCURRENCY", "16")
+    db_session.init_database()
+    try:
+        assert db_session.get_pool_statistics()["primary"] == {
+            "size": 3,
+            "checked_in": 0,
+            "checked_out": 0,
+            "overflow": -3,
+        }
+    finally:
+        await db_session.shutdown_database()
+
+
+def test_pool_capacity_adds_overflow(primary_env, monkeypatch):
+    """Tests that the pool capacity counts the overflow connections."""
+    monkeypatch.setenv("POSTGRES_POOL_SIZE", "6")
+    monkeypatch.setenv("POSTGRES_MAX_OVERFLOW", "2")
+    engine = db_session._create_engine("POSTGRES_")
+
+    assert db_session.get_pool_capacity(async_sessionmaker(engine)) == 8
+
+
+def test_pgbouncer_mode_disables_statement_cache(primary_env, monkeypatch):
+    """Tests that PgBouncer mode turns off the asyncpg statement caches."""
+    monkeypatch.setenv("POSTGRES_PGBOUNCER", "true")
+    engine_kwargs = {}
+    monkeypatch.setattr(
+        db_session,
+        "create_async_engine",
+        lambda url, **kwargs: engine_kwargs.update(kwargs),
+    )
+    db_session._create_engine("POSTGRES_")
+
+    connect_args = engine_kwargs["connect_args"]
+    assert connect_args["statement_cache_size"] == 0
+    assert connect_args["prepared_statement_cache_size"] == 0
+    assert connect_args["prepared_statement_name_func"]() != (
+        connect_args["prepared_statement_name_func"]()
+    )
+
+
+def test_statement_cache_sizes_are_configurable(primary_env, monkeypatch):
+    """Tests that the statement cache sizes come from the environment."""
+    monkeypatch.setenv("POSTGRES_STATEMENT_CACHE_SIZE", "500")
+    monkeypatch.setenv("POSTGRES_PREPARED_STATEMENT_CACHE_SIZE", "250")
+    monkeypatch.setenv("POSTGRES_QUERY_CACHE_SIZE", "1000")
+    engine_kwargs = {}
+    monkeypatch.setattr(
+        db_session,
+        "create_async_engine",
+        lambda url, **kwargs: engine_kwargs.update(kwargs),
+    )
+    db_session._create_engine("POSTGRES_")
+
+    assert engine_kwargs["connect_args"] == {
+        "statement_cache_size": 500,
+        "prepared_statement_cache_size": 250,
+    }
+    assert engine_kwargs["query_cache_size"] == 1000
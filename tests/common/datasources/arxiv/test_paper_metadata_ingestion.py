@@ -19,6 +19,9 @@ async def test_arxiv_paper_metadata_ingestion(httpx_async_client):
         assert isinstance(
             paper, PaperMetadataRecord
         ), f"Expected PaperMetadataRecord, got {type(paper)}"
+        assert (
+            paper.content_hash == paper.compute_content_hash()
+        ), "Expected the content hash to be set at normalization"
         papers.append(paper)
 
     assert len(papers) > 1, "Expected at least two papers"
@@ -0,0 +1,110 @@
+from datetime import date, timedelta
+import os
+from uuid import uuid4
+
+import pyarrow.dataset as ds
+import pytest
+from sqlalchemy import func, insert, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from common.constants import DataSource
+from common.database.postgres.models import Author, Datasource, Domain, Paper
+from common.database.postgres.repositories import DatabaseRepository
+from common.services.export import PaperExportService
+
+
+@pytest.mark.asyncio
+class TestPaperExportService:
+    """Tests for the incremental Parquet export."""
+
+    @pytest.fixture(autouse=True)
+    async def _setup(
+        self, async_session_factory: async_sessionmaker[AsyncSession], tmp_path
+    ):
+        """Inserts papers in two months and wires the export service."""
+        self._async_session_factory = async_session_factory
+        self._database = DatabaseRepository()
+        self.output_dir = str(tmp_path)
+        self.export_service = PaperExportService(
+            self._database,
+            async_session_factory,
+            self.output_dir,
+            chunk_size=2,
+            safety_lag=timedelta(0),
+        )
+        async with async_session_factory() as session:
+            datasource = await self._database.datasource.create(
+                Datasource(name=DataSource.ARXIV), session
+            )
+            domain = await self._database.domain.create(
+                Domain(code="cs", name="CS", datasource_id=datasource.id), session
+            )
+            author = await self._database.author.create(Author(name="Ada"), session)
+            await self._database.paper.ensure_partitions(
+                date(2024, 2, 29), session, since=date(2024, 1, 1)
+            )
+            self.paper_ids = [uuid4() for _ in range(3)]
+            await session.execute(
+                insert(Paper).values(
+                    [
+                        {
+                            "id": paper_id,
+                            "abstract": f"Abstract {i}",
+                            "datasource_id": datasource.id,
+                            "domain_id": domain.id,
+                            "main_author_id": author.id,
+                            "paper_identifier": f"paper-{i}",
+                            "publish_date": date(2024, 1 + i % 2, 10),
+                            "title": f"Title {i}",
+                        }
+                        for i, paper_id in enumerate(self.paper_ids)
+                    ]
+                )
+            )
+            await session.commit()
+
+    def _read_export(self):
+        """Reads back all exported rows."""
+        return (
+            ds.dataset(
+                os.path.join(self.output_dir, "papers"),
+                format="parquet",
+                partitioning="hive",
+            )
+            .to_table()
+            .to_pylist()
+        )
+
+    async def test_export_partitions_by_datasource_and_month(self):
+        """Test that every paper is written under its datasource and month."""
+        assert await self.export_service.run() == 3
+
+        rows = self._read_export()
+        assert sorted(row["paper_identifier"] for row in rows) == [
+            "paper-0",
+            "paper-1",
+            "paper-2",
+        ]
+        assert {(row["datasource"], row["publish_month"]) for row in rows} == {
+            ("arxiv", "2024-01"),
+            ("arxiv", "2024-02"),
+        }
+        assert all(row["main_author"] == "Ada" for row in rows)
+
+    async def test_export_appends_only_updated_papers(self):
+        """Test that a second run only appends the papers updated since."""
+        assert await self.export_service.run() == 3
+        assert await self.export_service.run() == 0
+
+        async with self._async_session_factory() as session:
+            await session.execute(
+                update(Paper)
+                .where(Paper.id == self.paper_ids[1])
+                .values(title="Revised Title 1", updated_at=func.now())
+            )
+            await session.commit()
+
+        assert await self.export_service.run() == 1
+        rows = self._read_export()
+        assert len(rows) == 4
+        assert "Revised Title 1" in {row["title"] for row in rows}
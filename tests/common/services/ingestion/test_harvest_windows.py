@@ -0,0 +1,46 @@
+from datetime import date, timedelta
+
+import pytest
+
+from common.services.ingestion.harvest_windows import (
+    harvest_window_days,
+    plan_harvest_windows,
+    split_date_range,
+)
+
+
+@pytest.mark.parametrize("density", [0.0, 0.5, 40.0, 450.0, 3000.0])
+def test_plan_harvest_windows_covers_the_range(density):
+    """Tests that the windows cover the range once, without gaps."""
+    start = date(2024, 2, 25)
+    windows = plan_harvest_windows(start, 10, density, 2000)
+
+    assert windows[0][0] == start
+    assert windows[-1][1] == start + timedelta(days=10)
+    for (_, until_date, _), (from_date, _, _) in zip(
+        windows, windows[1:], strict=False
+    ):
+        assert from_date == until_date + timedelta(days=1)
+
+
+def test_plan_harvest_windows_targets_record_count():
+    """Tests that dense subjects are split and sparse ones are not."""
+    dense = plan_harvest_windows(date(2024, 1, 1), 10, 450.0, 2000)
+    sparse = plan_harvest_windows(date(2024, 1, 1), 10, 3.0, 2000)
+
+    assert len(dense) == 3
+    assert all(expected <= 2000 for _, _, expected in dense)
+    assert len(sparse) == 1
+    assert sparse[0][2] == pytest.approx(33.0)
+
+
+def test_harvest_window_days_bounds():
+    """Tests that window sizes stay between one day and the maximum."""
+    assert harvest_window_days(0.0, 2000, 11) == 11
+    assert harvest_window_days(10_000.0, 2000, 11) == 1
+
+
+def test_split_date_range_rejects_empty_windows():
+    """Tests that windows must span at least one day."""
+    with pytest.raises(ValueError):
+        split_date_range(date(2024, 1, 1), date(2024, 1, 2), 0)
@@ -0,0 +1,132 @@
+from datetime import date, timedelta
+from typing import Any
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from common.constants import DataSource, IngestionStatus
+from common.database.postgres.models import Datasource, Domain, Subject
+from common.database.postgres.repositories import DatabaseRepository
+from common.services.ingestion import IngestionWorker
+
+
+class _FakeIngestionService:
+    """Records the windows run and fails the ones of a given day."""
+
+    def __init__(self, failing_from_date: date = None):
+        """Initializes a _FakeIngestionService object."""
+        self.failing_from_date = failing_from_date
+        self.windows = []
+
+    async def run(self, datasource_uuid, subject_uuid, from_date, until_date):
+        """Records the window and returns a paper count."""
+        self.windows.append((subject_uuid, from_date))
+        if from_date == self.failing_from_date:
+            raise RuntimeError("harvest failed")
+        return 5
+
+
+@pytest.mark.asyncio
+class TestIngestionWorker:
+    """Tests for the worker draining the ingestion work queue."""
+
+    @pytest.fixture(autouse=True)
+    async def _setup(self, async_session_factory: async_sessionmaker[AsyncSession]):
+        """Enqueues three windows of a subject."""
+        self._async_session_factory = async_session_factory
+        self._database = DatabaseRepository()
+        async with async_session_factory() as session:
+            datasource = await self._database.datasource.create(
+                Datasource(name=DataSource.ARXIV), session
+            )
+            domain = await self._database.domain.create(
+                Domain(code="cs", name="CS", datasource_id=datasource.id), session
+            )
+            subject = await self._database.subject.create(
+                Subject(code="cs.AI", name="AI", domain_id=domain.id), session
+            )
+            await session.commit()
+        self.subject_id = subject.id
+        self.from_dates = [date(2024, 1, 1), date(2024, 1, 11), date(2024, 1, 21)]
+        async with async_session_factory() as session:
+            async with session.begin():
+                await self._database.ingestion_work_queue.enqueue(
+                    "batch",
+                    [
+                        {
+                            "datasource_id": datasource.id,
+                            "subject_id": subject.id,
+                            "from_date": from_date,
+                            "until_date": from_date + timedelta(days=9),
+                        }
+                        for from_date in self.from_dates
+                    ],
+                    session,
+                )
+
+    def _worker(self, service: _FakeIngestionService, **kwargs: Any) -> IngestionWorker:
+        """Returns a worker polling fast."""
+        return IngestionWorker(
+            service,
+            self._database,
+            self._async_session_factory,
+            max_attempts=2,
+            poll_interval=timedelta(milliseconds=10),
+            **kwargs,
+        )
+
+    async def _batch_status(self):
+        """Returns the number of units of the batch per status."""
+        async with self._async_session_factory() as session:
+            return await self._database.ingestion_work_queue.get_batch_status(
+                "batch", session
+            )
+
+    async def test_worker_drains_windows_in_order(self):
+        """Test that the worker runs every window of a subject in date order."""
+        service = _FakeIngestionService()
+        succeeded = await self._worker(service).run(exit_when_empty=True)
+
+        assert succeeded == 3
+        assert service.windows == [(self.subject_id, day) for day in self.from_dates]
+        assert await self._batch_status() == {IngestionStatus.SUCCEEDED: 3}
+
+    async def test_failed_window_is_retried_until_out_of_attempts(self):
+        """Test that a failing window is retried before the next one runs."""
+        service = _FakeIngestionService(failing_from_date=self.from_dates[1])
+        worker = self._worker(service)
+        succeeded = await worker.run(exit_when_empty=True)
+
+        assert succeeded == 2
+        assert worker.failed == 2
+        assert service.windows == [
+            (self.subject_id, self.from_dates[0]),
+            (self.subject_id, self.from_dates[1]),
+            (self.subject_id, self.from_dates[1]),
+            (self.subject_id, self.from_dates[2]),
+        ]
+        assert await self._batch_status() == {
+            IngestionStatus.SUCCEEDED: 2,
+            IngestionStatus.FAILED: 1,
+        }
+
+    async def test_bookkeeping_error_does_not_stop_the_worker(self, monkeypatch):
+        """Test that a unit whose completion fails to record is run again."""
+        queue = self._database.ingestion_work_queue
+        complete = queue.complete
+        calls = []
+
+        async def _complete(*args, **kwargs):
+            calls.append(args[0])
+            if len(calls) == 1:
+                raise ConnectionError("connection lost")
+            return await complete(*args, **kwargs)
+
+        monkeypatch.setattr(queue, "complete", _complete)
+        service = _FakeIngestionService()
+        worker = self._worker(service, stale_after=timedelta(seconds=1))
+        succeeded = await worker.run(exit_when_empty=True)
+
+        assert succeeded == 3
+        assert len(service.windows) == 4
+        assert await self._batch_status() == {IngestionStatus.SUCCEEDED: 3}
@@ -0,0 +1,118 @@
+from datetime import date
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from common.constants import DataSource
+from common.database.postgres.models import (
+    Datasource,
+    Domain,
+    PaperIngestionState,
+    Subject,
+)
+from common.database.postgres.repositories import DatabaseRepository
+from common.services.ingestion import PaperBackfillService
+
+
+class FakeIngestionService:
+    """Records the harvested windows and fails on the configured subjects."""
+
+    def __init__(self, failing_subject_ids=()):
+        """Initializes a FakeIngestionService object."""
+        self.windows = []
+        self.failing_subject_ids = set(failing_subject_ids)
+
+    async def run(
+        self, datasource_uuid, subject_uuid, from_date, until_date, track_watermark
+    ):
+        """Harvests a window, returning a fixed paper count."""
+        assert not track_watermark, "Backfill windows must not move watermarks"
+        if subject_uuid in self.failing_subject_ids:
+            raise RuntimeError("Harvest failed")
+        self.windows.append((subject_uuid, from_date, until_date))
+        return 2
+
+
+@pytest.mark.asyncio
+class TestPaperBackfillService:
+    """Tests for the resumable domain backfill."""
+
+    @pytest.fixture(autouse=True)
+    async def _setup(self, async_session_factory: async_sessionmaker[AsyncSession]):
+        """Creates a domain with two subjects and an inactive ingestion state."""
+        self._async_session_factory = async_session_factory
+        self._database = DatabaseRepository()
+        async with async_session_factory() as session:
+            datasource = await self._database.datasource.create(
+                Datasource(name=DataSource.ARXIV), session
+            )
+            domain = await self._database.domain.create(
+                Domain(code="cs", name="CS", datasource_id=datasource.id), session
+            )
+            self.subjects = [
+                await self._database.subject.create(
+                    Subject(code=code, name=code, domain_id=domain.id), session
+                )
+                for code in ["cs.AI", "cs.LG"]
+            ]
+            await self._database.paper_ingestion_state.create(
+                PaperIngestionState(
+                    datasource_id=datasource.id,
+                    domain_id=domain.id,
+                    cursor_date=date(2023, 1, 1),
+                    is_active=False,
+                ),
+                session,
+            )
+            await session.commit()
+        self.datasource_id = datasource.id
+        self.domain_id = domain.id
+
+    def _service(self, ingestion_service: FakeIngestionService):
+        """Returns a backfill service harvesting with the fake service."""
+        return PaperBackfillService(
+            self._database, self._async_session_factory, ingestion_service
+        )
+
+    async def test_plan_is_idempotent(self):
+        """Test that planning the same range again adds no windows."""
+        service = self._service(FakeIngestionService())
+        created = await service.plan(
+            self.datasource_id, self.domain_id, date(2020, 1, 1), date(2020, 3, 30), 30
+        )
+        created_again = await service.plan(
+            self.datasource_id, self.domain_id, date(2020, 1, 1), date(2020, 3, 30), 30
+        )
+
+        assert created == 2 * 3
+        assert created_again == 0
+
+    async def test_backfill_resumes_and_hands_over(self):
+        """Test that failed windows are retried and the domain handed over."""
+        failing = FakeIngestionService(failing_subject_ids=[self.subjects[1].id])
+        service = self._service(failing)
+        await service.plan(
+            self.datasource_id, self.domain_id, date(2020, 1, 1), date(2020, 1, 20), 10
+        )
+
+        assert await service.run(self.domain_id, max_concurrency=2) == (2, 2)
+        assert not await service.hand_over(self.datasource_id, self.domain_id)
+
+        resumed = FakeIngestionService()
+        service = self._service(resumed)
+        assert await service.run(self.domain_id) == (2, 0)
+        assert {window[0] for window in resumed.windows} == {self.subjects[1].id}
+        assert await service.hand_over(self.datasource_id, self.domain_id)
+
+        async with self._async_session_factory() as session:
+            state = await self._database.paper_ingestion_state.get_by_datasource_domain(
+                self.domain_id, self.datasource_id, session
+            )
+            harvested_until = (
+                await self._database.subject_watermark.get_harvested_until(
+                    self.subjects[0].id, session
+                )
+            )
+        assert state.is_active
+        assert state.cursor_date == date(2023, 1, 1), "Cursor must not move back"
+        assert harvested_until == date(2020, 1, 20)
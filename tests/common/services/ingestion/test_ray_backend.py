@@ -0,0 +1,43 @@
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+pytest.importorskip("ray")
+
+from common.services.ingestion.ray_backend import (  # noqa: E402
+    assign_windows,
+    max_actor_count,
+)
+
+
+def test_assign_windows_keeps_subjects_on_one_actor():
+    """Tests that all the windows of a subject go to the same actor."""
+    datasource_uuid = uuid4()
+    subject_uuids = [uuid4() for _ in range(5)]
+    windows = [
+        (datasource_uuid, subject_uuid, date(2024, month, 1), date(2024, month, 28))
+        for month in (1, 2, 3)
+        for subject_uuid in subject_uuids
+    ]
+    groups = assign_windows(windows, 2)
+
+    assert len(groups) == 2
+    assert sorted(index for group in groups for index in group) == list(
+        range(len(windows))
+    )
+    for subject_uuid in subject_uuids:
+        actors = {
+            actor
+            for actor, group in enumerate(groups)
+            for index in group
+            if windows[index][1] == subject_uuid
+        }
+        assert len(actors) == 1
+
+
+def test_actor_count_fits_the_connection_budget():
+    """Tests that every actor gets its minimum share of the connections."""
+    assert max_actor_count(32, 64) == 16
+    assert max_actor_count(32, 64, actor_count=20) == 16
+    assert max_actor_count(8, 1000) == 8
@@ -0,0 +1,48 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from common.database.postgres.repositories import DatabaseRepository
+from common.services.ingestion import SharedRateLimiter
+
+# A rate low enough that the refill during the test is negligible, so each
+# token taken beyond the burst reserves a slot 1000 seconds later.
+RATE = 0.001
+
+
+@pytest.mark.asyncio
+class TestSharedRateLimiter:
+    """Tests for the token bucket shared through Postgres."""
+
+    @pytest.fixture(autouse=True)
+    def _setup(self, async_session_factory: async_sessionmaker[AsyncSession]):
+        """Stores the session factory shared by the workers."""
+        self._async_session_factory = async_session_factory
+        self._database = DatabaseRepository()
+
+    async def _take(self, name: str) -> float:
+        """Takes a token in a session of its own, like a separate worker."""
+        async with self._async_session_factory() as session:
+            async with session.begin():
+                return await self._database.rate_limit_bucket.take(
+                    name, RATE, 2, session
+                )
+
+    async def test_workers_share_the_bucket(self):
+        """Test that separate workers draw from the same tokens."""
+        waits = [await self._take("export.arxiv.org") for _ in range(6)]
+
+        # 2 tokens of burst, then each worker waits one more slot.
+        assert waits == pytest.approx([0, 0, 1000, 2000, 3000, 4000], abs=1)
+
+    async def test_buckets_are_independent(self):
+        """Test that a busy bucket does not delay another one."""
+        for _ in range(3):
+            await self._take("export.arxiv.org")
+
+        assert await self._take("api.crossref.org") == 0
+
+
+def test_from_env_disabled_without_rate(monkeypatch):
+    """Test that no limiter is configured when the rate is 0."""
+    monkeypatch.setenv("DATASOURCE_REQUESTS_PER_SECOND", "0")
+    assert SharedRateLimiter.from_env(None) is None
@@ -0,0 +1,26 @@
+import pytest
+
+from common.services.ingestion.subject_groups import pack_by_volume
+
+
+def test_pack_by_volume_balances_groups():
+    """Tests that the group volumes stay close to the mean."""
+    volumes = {f"subject-{index}": volume for index, volume in enumerate(range(1, 41))}
+    groups = pack_by_volume(list(volumes), list(volumes.values()), 4)
+
+    totals = [sum(volumes[item] for item in group) for group in groups]
+    assert len(groups) == 4
+    assert sorted(item for group in groups for item in group) == sorted(volumes)
+    assert max(totals) - min(totals) <= max(volumes.values())
+
+
+def test_pack_by_volume_drops_empty_groups():
+    """Tests that fewer items than groups yields one group per item."""
+    assert pack_by_volume(["a", "b"], [1, 1], 8) == [["a"], ["b"]]
+    assert pack_by_volume([], [], 8) == []
+
+
+def test_pack_by_volume_rejects_no_groups():
+    """Tests that at least one group is required."""
+    with pytest.raises(ValueError):
+        pack_by_volume(["a"], [1], 0)
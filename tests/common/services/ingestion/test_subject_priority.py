@@ -0,0 +1,26 @@
+import pytest
+
+from common.services.ingestion.subject_priority import (
+    parse_subject_weights,
+    subject_priority,
+)
+
+
+def test_subject_priority_grows_with_backlog_and_weight():
+    """Tests that bigger and weighted backlogs come first."""
+    sparse = subject_priority(30, 0.5)
+    dense = subject_priority(2, 400.0)
+    weighted = subject_priority(30, 0.5, weight=100.0)
+
+    assert dense > sparse
+    assert weighted > sparse
+    assert subject_priority(0, 400.0) == 0
+
+
+def test_parse_subject_weights_rejects_invalid_pairs():
+    """Tests that a pair without a weight is rejected."""
+    assert parse_subject_weights(None) == {}
+    with pytest.raises(ValueError):
+        parse_subject_weights("cs.AI")
+    with pytest.raises(ValueError):
+        parse_subject_weights("cs.AI=high")
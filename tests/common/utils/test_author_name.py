@@ -0,0 +1,40 @@
+import pytest
+
+from common.utils.author_name import author_name_hash, canonicalize_author_name
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "John Smith",
+        "Smith, John",
+        "  JOHN   Smith ",
+        "smith ,john",
+    ],
+)
+def test_canonicalize_author_name(name):
+    """Tests that equivalent author names share a canonical key."""
+    assert canonicalize_author_name(name) == "john smith"
+
+
+def test_canonicalize_author_name_unicode():
+    """Tests that diacritics and compatibility characters are normalized."""
+    assert canonicalize_author_name("Müller, José") == "jose muller"
+    assert canonicalize_author_name("Ｊｏｈｎ Ｓｍｉｔｈ") == "john smith"
+
+
+def test_canonicalize_author_name_keeps_initials():
+    """Tests that initials are not expanded into full first names."""
+    assert canonicalize_author_name("Smith, J.") == "j smith"
+    assert canonicalize_author_name("J. Smith") == "j smith"
+    assert canonicalize_author_name("J. Smith") != canonicalize_author_name(
+        "John Smith"
+    )
+
+
+def test_author_name_hash():
+    """Tests that the hash is a stable signed 64-bit integer."""
+    name_hash = author_name_hash("john smith")
+    assert name_hash == author_name_hash("john smith"), "Expected a stable hash"
+    assert -(2**63) <= name_hash < 2**63, "Expected a signed 64-bit integer"
+    assert name_hash != author_name_hash("jane smith"), "Expected distinct hashes"
@@ -0,0 +1,50 @@
+from common.utils.minhash import (
+    DUPLICATE_THRESHOLD,
+    LSH_BANDS,
+    NUM_PERMUTATIONS,
+    estimate_similarity,
+    lsh_buckets,
+    minhash_signature,
+    signature_from_bytes,
+    signature_to_bytes,
+)
+
+ABSTRACT = (
+    "We propose a graph neural network for molecular property prediction that "
+    "combines message passing with attention over chemical substructures and "
+    "reaches state of the art accuracy on several public benchmarks."
+)
+
+
+def test_minhash_signature_is_stable():
+    """Tests that the signature only depends on the normalized text."""
+    signature = minhash_signature(ABSTRACT)
+    assert len(signature) == NUM_PERMUTATIONS
+    assert signature == minhash_signature(ABSTRACT.upper().replace(" ", "  "))
+    assert signature_from_bytes(signature_to_bytes(signature)) == signature
+
+
+def test_near_duplicates_share_a_bucket():
+    """Tests that a lightly edited text shares a band bucket and is similar."""
+    edited = ABSTRACT.replace("several public", "many public").replace(
+        "We propose", "We present"
+    )
+    signature = minhash_signature(ABSTRACT)
+    other = minhash_signature(edited)
+
+    assert estimate_similarity(signature, other) >= DUPLICATE_THRESHOLD
+    assert set(lsh_buckets(signature)) & set(lsh_buckets(other))
+
+
+def test_unrelated_texts_are_not_similar():
+    """Tests that unrelated texts are far below the duplicate threshold."""
+    signature = minhash_signature(ABSTRACT)
+    other = minhash_signature(
+        "A survey of reinforcement learning methods for robotic manipulation "
+        "tasks with sparse rewards and sim to real transfer."
+    )
+
+    assert estimate_similarity(signature, other) < 0.2
+    buckets = lsh_buckets(signature)
+    assert len(buckets) == LSH_BANDS
+    assert not set(buckets) & set(lsh_buckets(other))
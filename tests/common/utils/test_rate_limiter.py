@@ -0,0 +1,35 @@
+import asyncio
+import time
+
+import pytest
+
+from common.utils.rate_limiter import AsyncRateLimiter
+
+
+async def test_rate_limiter_spaces_acquisitions():
+    """Tests that acquisitions beyond the burst wait for new tokens."""
+    rate_limiter = AsyncRateLimiter(rate=20, burst=2)
+    start = time.monotonic()
+    await asyncio.gather(*(rate_limiter.acquire() for _ in range(6)))
+    elapsed = time.monotonic() - start
+
+    # 2 immediate acquisitions, then 4 more at 20 per second.
+    assert elapsed == pytest.approx(0.2, abs=0.08)
+
+
+async def test_rate_limiter_refills_up_to_burst():
+    """Tests that an idle period does not accumulate more than the burst."""
+    rate_limiter = AsyncRateLimiter(rate=50, burst=1)
+    await rate_limiter.acquire()
+    await asyncio.sleep(0.1)
+    start = time.monotonic()
+    await rate_limiter.acquire()
+    await rate_limiter.acquire()
+
+    assert time.monotonic() - start >= 0.015
+
+
+def test_rate_limiter_rejects_non_positive_rate():
+    """Tests that the rate must be positive."""
+    with pytest.raises(ValueError):
+        AsyncRateLimiter(rate=0)